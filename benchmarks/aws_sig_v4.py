@@ -0,0 +1,37 @@
+"""
+Micro-benchmark of request signing.
+
+    python benchmarks/aws_sig_v4.py
+
+Prints the cost of signing one request with a cached signing key, and with the key derived on every request.
+"""
+import timeit
+
+from sp_api.base.aws_sig_v4 import AWSSigV4, canonical_query, signing_key
+
+HOST = 'sellingpartnerapi-eu.amazon.com'
+PATH = '/orders/v0/orders'
+PARAMS = {'MarketplaceIds': ['A1PA6795UKMFR9'], 'CreatedAfter': '2021-01-01T00:00:00',
+          'OrderStatuses': 'Shipped,Unshipped'}
+NUMBER = 20000
+
+
+def main():
+    signer = AWSSigV4('execute-api', aws_access_key_id='AKIDEXAMPLE',
+                      aws_secret_access_key='wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY',
+                      aws_session_token='session-token', region='eu-west-1')
+
+    def sign():
+        signer.get_request_auth_headers('GET', HOST, PATH, canonical_query(PARAMS))
+
+    def sign_uncached():
+        signing_key.cache_clear()
+        sign()
+
+    for name, func in (('derived key', sign_uncached), ('cached key', sign)):
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+        print('%-12s %6.2f us per request' % (name, seconds * 1e6))
+
+
+if __name__ == '__main__':
+    main()
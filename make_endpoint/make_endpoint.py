@@ -71,8 +71,7 @@ def make_params(params, model):
 def add_to_init(endpoint):
     e = sub(endpoint)
     import_template = f'''##### DO NOT DELETE ########## INSERT IMPORT HERE #######
-from .{e}.{e} import {endpoint}
-    '''
+    '{endpoint}': '{e}.{e}','''
     append_template = f'''##### DO NOT DELETE ########## INSERT TITLE HERE #######
     "{endpoint}",
     '''
@@ -12,6 +12,10 @@ setup(
         "pytz",
         "confuse~=1.4.0"
     ],
+    extras_require={
+        'aio': ['aiohttp'],
+        'arrow': ['pyarrow'],
+    },
     packages=['tests', 'tests.api', 'tests.api.orders', 'tests.api.sellers', 'tests.api.finances',
               'tests.api.product_fees', 'tests.api.notifications', 'tests.api.reports', 'tests.client',
               'sp_api',
@@ -34,6 +38,8 @@ setup(
               'sp_api.auth',
               'sp_api.base',
               'sp_api.util',
+              'sp_api.aio',
+              'sp_api.aio.api',
                 ##### DO NOT DELETE ########## INSERT PACKAGE HERE #######
 
               'sp_api.api.catalog_items',
@@ -0,0 +1,11 @@
+from .transport import Transport
+from .aws_sig_v4 import AWSSigV4
+from .access_token_client import AccessTokenClient
+from .client import Client
+
+__all__ = [
+    'Transport',
+    'AWSSigV4',
+    'AccessTokenClient',
+    'Client',
+]
@@ -0,0 +1,64 @@
+import asyncio
+import logging
+
+from sp_api.auth import access_token_client, AccessTokenResponse
+from sp_api.auth.exceptions import AuthorizationError
+from .transport import default_transport
+
+logger = logging.getLogger(__name__)
+
+
+class AccessTokenClient(access_token_client.AccessTokenClient):
+    transport = default_transport
+
+    async def _request(self, url, data, headers):
+        response = await self.transport.request('POST', url, data=data, headers=headers)
+        response_data = await response.json(content_type=None)
+        if response.status != 200:
+            error_message = response_data.get('error_description')
+            error_code = response_data.get('error')
+            raise AuthorizationError(error_code, error_message, response.status)
+        return response_data
+
+    async def get_auth(self) -> AccessTokenResponse:
+        """
+        Get's the access token, from the token cache if it's still valid
+        :return:AccessTokenResponse
+        """
+        return AccessTokenResponse(**await self.token_cache.get_async(self._get_cache_key(),
+                                                                      self._fetch_access_token))
+
+    async def _fetch_access_token(self):
+        loop = asyncio.get_running_loop()
+        access_token = None
+        if self.use_secrets():
+            access_token = await loop.run_in_executor(None, self.get_secret)
+        if not access_token:
+            request_url = self.scheme + self.host + self.path
+            access_token = await self._request(request_url, self.data, self.headers)
+            if self.use_secrets():
+                await loop.run_in_executor(None, self.put_access_token, access_token)
+        return access_token
+
+    async def get_grantless_auth(self, scope='sellingpartnerapi::notifications'):
+        return AccessTokenResponse(**await self.grantless_token_cache.get_async(
+            self._get_cache_key(scope), lambda: self._fetch_grantless_token(scope)
+        ))
+
+    async def _fetch_grantless_token(self, scope):
+        request_url = self.scheme + self.host + self.path
+        access_token = await self._request(
+            request_url,
+            data=self.grantless_data(scope),
+            headers=self.headers
+        )
+        logger.debug('token_refreshed. scope: %s', scope)
+        return access_token
+
+    async def authorize_auth_code(self, auth_code):
+        request_url = self.scheme + self.host + self.path
+        return await self._request(
+            request_url,
+            data=self._auth_code_request_body(auth_code),
+            headers=self.headers
+        )
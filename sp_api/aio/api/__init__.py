@@ -0,0 +1,24 @@
+"""
+asyncio counterparts of the clients in `sp_api.api`.
+
+The classes are built on first access from the synchronous endpoints, so every endpoint method
+returns a coroutine and reuses the `sp_endpoint` metadata of its synchronous counterpart.
+"""
+from sp_api import api
+from sp_api.aio.client import Client
+from .feeds import Feeds
+from .reports import Reports
+
+__all__ = list(dict.fromkeys(api.__all__))
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    endpoint = getattr(api, name)
+    async_endpoint = type(name, (Client, endpoint), {
+        '__doc__': endpoint.__doc__,
+        '__module__': __name__
+    })
+    globals()[name] = async_endpoint
+    return async_endpoint
@@ -0,0 +1,80 @@
+import asyncio
+
+from sp_api.api.feeds import feeds
+from sp_api.base import fill_query_params, ApiResponse, SellingApiException
+from sp_api.base.processing_report import ProcessingReportParser
+from sp_api.aio.client import Client, same_endpoint
+
+
+class Feeds(Client, feeds.Feeds):
+
+    @same_endpoint(feeds.Feeds.create_feed_document)
+    async def create_feed_document(self, file, content_type='text/tsv', compress: bool = False,
+                                   **kwargs) -> ApiResponse:
+        data = {
+            'contentType': kwargs.get('contentType', content_type)
+        }
+        response = await self._request(kwargs.get('path'), data={**data, **kwargs})
+        loop = asyncio.get_running_loop()
+        # encrypting and spilling text files reads the whole file, keep it off the event loop
+        body = await loop.run_in_executor(None, self._encrypt_feed, file, response.payload, compress)
+
+        async def chunks():
+            while True:
+                chunk = await loop.run_in_executor(None, body.read, 1024 * 1024)
+                if not chunk:
+                    return
+                yield chunk
+
+        with body:
+            upload = await self.transport.request(
+                'PUT',
+                response.payload.get('url'),
+                data=chunks(),
+                headers={'Content-Type': content_type, 'Content-Length': str(len(body))}
+            )
+        if 200 <= upload.status < 300:
+            return response
+        raise SellingApiException([{'message': 'Uploading the feed document failed'}], upload.headers)
+
+    async def submit_feed(self, feed_type, file, content_type='text/tsv', compress: bool = False,
+                          **kwargs) -> [ApiResponse, ApiResponse]:
+        document_response = await self.create_feed_document(file, content_type, compress)
+        return document_response, await self.create_feed(feed_type, document_response.payload.get('feedDocumentId'),
+                                                         **kwargs)
+
+    @same_endpoint(feeds.Feeds.get_feed_result_document)
+    async def get_feed_result_document(self, feed_id, **kwargs) -> str:
+        response = await self._request(fill_query_params(kwargs.pop('path'), feed_id), params=kwargs,
+                                       add_marketplace=False)
+        return ''.join([piece async for piece in self.stream_feed_result_document(response.payload, 'auto')])
+
+    async def stream_feed_result_document(self, document, encoding: str = None, chunk_size: int = 1024 * 1024):
+        decoder = self._result_decoder(document, encoding)
+        async with self.transport.stream('GET', document.get('url')) as response:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                for piece in decoder.feed(chunk):
+                    yield piece
+        for piece in decoder.close():
+            yield piece
+
+    async def iter_feed_result_issues(self, feed_document_id, chunk_size: int = 1024 * 1024, parser=None):
+        document = (await self.get_feed_document(feed_document_id)).payload
+        parser = parser if parser is not None else ProcessingReportParser()
+        async for piece in self.stream_feed_result_document(document, chunk_size=chunk_size):
+            for issue in parser.feed(piece):
+                yield issue
+        for issue in parser.close():
+            yield issue
+
+    async def get_feed_processing_report(self, feed_document_id, chunk_size: int = 1024 * 1024) -> dict:
+        parser = ProcessingReportParser()
+        issues = [issue async for issue in self.iter_feed_result_issues(feed_document_id, chunk_size, parser)]
+        return {'header': parser.header, 'summary': parser.summary, 'issues': issues}
+
+    create_feed_document.__doc__ = feeds.Feeds.create_feed_document.__doc__
+    submit_feed.__doc__ = feeds.Feeds.submit_feed.__doc__
+    get_feed_result_document.__doc__ = feeds.Feeds.get_feed_result_document.__doc__
+    stream_feed_result_document.__doc__ = feeds.Feeds.stream_feed_result_document.__doc__
+    iter_feed_result_issues.__doc__ = feeds.Feeds.iter_feed_result_issues.__doc__
+    get_feed_processing_report.__doc__ = feeds.Feeds.get_feed_processing_report.__doc__
@@ -0,0 +1,82 @@
+import asyncio
+
+from sp_api.api.reports import reports
+from sp_api.base import fill_query_params, ApiResponse
+from sp_api.base.report_columns import write_report_columns, report_column_types
+from sp_api.base.report_headers import ReportRowParser
+from sp_api.aio.client import Client, same_endpoint
+
+
+def iter_sync(pieces, loop):
+    """
+    Iterates an async generator from a worker thread, each piece is awaited on `loop`
+    """
+    while True:
+        try:
+            yield asyncio.run_coroutine_threadsafe(pieces.__anext__(), loop).result()
+        except StopAsyncIteration:
+            return
+
+
+class Reports(Client, reports.Reports):
+
+    @same_endpoint(reports.Reports.get_report_document)
+    async def get_report_document(self, document_id, decrypt: bool = False, file=None,
+                                  character_code: str = 'iso-8859-1', stream: bool = False, output: str = None,
+                                  report_type=None, column_types: dict = None, **kwargs) -> ApiResponse:
+        res = await self._request(fill_query_params(kwargs.pop('path'), document_id), add_marketplace=False)
+        if output:
+            # pyarrow reads in a worker thread, pulling the pieces from the event loop
+            loop = asyncio.get_running_loop()
+            table = await loop.run_in_executor(
+                None, write_report_columns, iter_sync(self.stream_report_document(res.payload, character_code), loop),
+                output, file, report_column_types(report_type, column_types)
+            )
+            if table is not None:
+                res.payload.update({
+                    'document': table
+                })
+        elif decrypt:
+            pieces = self.stream_report_document(res.payload, character_code)
+            if stream and file:
+                if isinstance(file, str):
+                    with open(file, 'w', encoding=character_code) as text_file:
+                        async for piece in pieces:
+                            text_file.write(piece)
+                else:
+                    async for piece in pieces:
+                        file.write(piece)
+                return res
+            document = pieces if stream else ''.join([piece async for piece in pieces])
+            res.payload.update({
+                'document': document
+            })
+            if file:
+                self._write_document(document, file, character_code)
+        return res
+
+    get_report_document.__doc__ = reports.Reports.get_report_document.__doc__
+
+    async def stream_report_document(self, document, character_code: str = 'iso-8859-1',
+                                     chunk_size: int = 1024 * 1024):
+        decoder = self._document_decoder(document, character_code, self._fallback_encoding())
+        async with self.transport.stream('GET', document.get('url')) as response:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                for piece in decoder.feed(chunk):
+                    yield piece
+        for piece in decoder.close():
+            yield piece
+
+    stream_report_document.__doc__ = reports.Reports.stream_report_document.__doc__
+
+    async def iter_report_rows(self, document_id, header_enum=None, as_tuple: bool = False,
+                               character_code: str = None, strict: bool = True, chunk_size: int = 1024 * 1024):
+        document = (await self.get_report_document(document_id)).payload
+        parser = ReportRowParser(header_enum, as_tuple, strict=strict)
+        async for text in self.stream_report_document(document, character_code or 'auto', chunk_size):
+            for row in parser.feed(text):
+                yield row
+        for row in parser.close():
+            yield row
+
+    iter_report_rows.__doc__ = reports.Reports.iter_report_rows.__doc__
@@ -0,0 +1,7 @@
+from sp_api.base import aws_sig_v4
+
+
+class AWSSigV4(aws_sig_v4.AWSSigV4):
+    """
+    Signs requests sent by the asyncio clients, see `sp_api.base.AWSSigV4.sign`
+    """
@@ -0,0 +1,116 @@
+import asyncio
+import json
+import logging
+
+from sp_api.base import client, ApiResponse, sp_endpoint
+from sp_api.base.aws_sig_v4 import canonical_query
+from sp_api.base.exceptions import get_exception_for_code, SellingApiRequestThrottledException
+from sp_api.base.rate_limiter import current_usage_plan
+from .access_token_client import AccessTokenClient
+from .aws_sig_v4 import AWSSigV4
+from .transport import Transport, default_transport
+
+log = logging.getLogger(__name__)
+
+
+def same_endpoint(endpoint):
+    """
+    `sp_endpoint` decorator with the path, method and usage plan of the synchronous `endpoint`
+    """
+    return sp_endpoint(endpoint.path, endpoint.method,
+                       rate=endpoint.usage_plan.rate, burst=endpoint.usage_plan.burst)
+
+
+class Client(client.Client):
+    """
+    asyncio counterpart of `sp_api.base.Client`, endpoint methods return coroutines
+    """
+    transport: Transport = default_transport
+    access_token_client = AccessTokenClient
+
+    async def _get_headers(self):
+        if self.restricted_data_token:
+            return self._make_headers(self.restricted_data_token)
+        auth = await self._auth.get_auth()
+        return self._make_headers(auth.access_token)
+
+    def _sign_request(self):
+        role = self.role
+        return AWSSigV4('execute-api',
+                        aws_access_key_id=role.get('AccessKeyId'),
+                        aws_secret_access_key=role.get('SecretAccessKey'),
+                        region=self.region,
+                        aws_session_token=role.get('SessionToken')
+                        )
+
+    def _request(self, path: str, *, data: dict = None, params: dict = None, headers=None,
+                 add_marketplace=True):
+        # the usage plan is only set while the endpoint method is called, not when the coroutine runs
+        return self._send_request(current_usage_plan.get(), path, data=data, params=params, headers=headers,
+                                  add_marketplace=add_marketplace)
+
+    async def _send_request(self, usage_plan, path: str, *, data: dict = None, params: dict = None, headers=None,
+                            add_marketplace=True) -> ApiResponse:
+        if params is None:
+            params = {}
+        if data is None:
+            data = {}
+
+        method = self.method = params.pop('method', data.pop('method', 'GET'))
+
+        if add_marketplace:
+            self._add_marketplaces(data if method in ('POST', 'PUT') else params)
+
+        # the query is encoded once, the signature covers exactly what is sent
+        query = canonical_query(params)
+        url = self.endpoint + path + ('?' + query if query else '')
+        body = json.dumps(data) if data and method in ('POST', 'PUT', 'PATCH') else None
+
+        if usage_plan and self.rate_limiter:
+            wait = self.rate_limiter.reserve(self._rate_limit_key(usage_plan), usage_plan.rate, usage_plan.burst)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+        if headers is None:
+            headers = await self._get_headers()
+        # assuming the role may call STS, which is blocking
+        signer = await asyncio.get_running_loop().run_in_executor(None, self._sign_request)
+
+        headers = signer.sign(method, self.endpoint[8:], path, query, headers, body)
+        res = await self.transport.request(method, url, data=body, headers=headers)
+        try:
+            response = await self._check_response(res)
+        except SellingApiRequestThrottledException:
+            self._update_rate_limiter(usage_plan, res.headers, throttled=True)
+            raise
+        self._update_rate_limiter(usage_plan, res.headers)
+        return response
+
+    async def _iter_pages(self, endpoint, *args, next_token_param='NextToken', next_page_kwargs=None, **kwargs):
+        res = await endpoint(*args, **kwargs)
+        yield res
+        while res.next_token:
+            res = await endpoint(*args, **{**(next_page_kwargs or {}), next_token_param: res.next_token})
+            yield res
+
+    async def _iter_items(self, endpoint, items, *args, next_token_param='NextToken', next_page_kwargs=None, **kwargs):
+        get_items = self._items_getter(items)
+        async for page in self._iter_pages(endpoint, *args, next_token_param=next_token_param,
+                                           next_page_kwargs=next_page_kwargs, **kwargs):
+            for item in get_items(page.payload):
+                yield item
+
+    @staticmethod
+    async def _check_response(res) -> ApiResponse:
+        content = await res.json(content_type=None)
+        error = content.get('errors', None)
+        if error:
+            exception = get_exception_for_code(res.status)
+            raise exception(error, headers=res.headers)
+        return ApiResponse(**content, headers=res.headers)
+
+    async def _request_grantless_operation(self, path: str, *, data: dict = None, params: dict = None):
+        if not self.grantless_scope:
+            raise Exception("Grantless operations require scope")
+        auth = await self._auth.get_grantless_auth(self.grantless_scope)
+        return await self._request(path, data=data, params=params, headers=self._make_headers(auth.access_token))
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+import aiohttp
+from yarl import URL
+
+log = logging.getLogger(__name__)
+
+
+class Transport:
+    """
+    Pooled, keep-alive HTTP transport for asyncio clients.
+
+    Holds one `aiohttp.ClientSession` per event loop, its connector keeps connections alive per host.
+
+    Args:
+        limit: int | maximum number of simultaneous connections
+        limit_per_host: int | maximum number of simultaneous connections to the same host
+        keepalive_timeout: float | seconds an idle connection is kept open
+        timeout: float | total timeout for a request
+    """
+
+    def __init__(self, limit=100, limit_per_host=10, keepalive_timeout=15, timeout=None):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self._session = None
+        self._loop = None
+
+    def session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            log.debug('Creating aiohttp session')
+            connector = aiohttp.TCPConnector(limit=self.limit,
+                                             limit_per_host=self.limit_per_host,
+                                             keepalive_timeout=self.keepalive_timeout)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._loop = loop
+        return self._session
+
+    async def request(self, method, url, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Sends the request and reads the body, the url is expected to be encoded already
+        """
+        async with self.session().request(method, URL(url, encoded=True), **kwargs) as response:
+            await response.read()
+        return response
+
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        """
+        Sends the request and yields the response without reading the body, read it from `response.content`
+        """
+        async with self.session().request(method, URL(url, encoded=True), **kwargs) as response:
+            yield response
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+default_transport = Transport()
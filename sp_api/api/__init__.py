@@ -1,65 +1,47 @@
-from .finances.finances import Finances
-from .notifications.notifications import Notifications
-from .orders.orders import Orders
-from .product_fees.product_fees import ProductFees
-from .sellers.sellers import Sellers
-from .reports.reports import Reports
-from .products.products import Products
-from .sales.sales import Sales
-from .catalog.catalog import Catalog
-from .feeds.feeds import Feeds
-from .inventories.inventories import Inventories
-from .fulfillment_inbound.fulfillment_inbound import FulfillmentInbound
-from .upload.upload import Upload
-from .messaging.messaging import Messaging
-from .merchant_fulfillment.merchant_fulfillment import MerchantFulfillment
-
-##### DO NOT DELETE ########## INSERT IMPORT HERE #######
-from .messaging.messaging import Messaging
-    
-from .catalog_items.catalog_items import CatalogItems
-    
-from .product_type_definitions.product_type_definitions import ProductTypeDefinitions
-    
-from .listings_items.listings_items import ListingsItems
-    
-from .vendor_transaction_status.vendor_transaction_status import VendorTransactionStatus
-    
-from .vendor_shipments.vendor_shipments import VendorShipments
-    
-from .vendor_orders.vendor_orders import VendorOrders
-    
-from .vendor_invoices.vendor_invoices import VendorInvoices
-    
-from .vendor_direct_fulfillment_transactions.vendor_direct_fulfillment_transactions import VendorDirectFulfillmentTransactions
-    
-from .vendor_direct_fulfillment_shipping.vendor_direct_fulfillment_shipping import VendorDirectFulfillmentShipping
-    
-from .vendor_direct_fulfillment_payments.vendor_direct_fulfillment_payments import VendorDirectFulfillmentPayments
-    
-from .vendor_direct_fulfillment_orders.vendor_direct_fulfillment_orders import VendorDirectFulfillmentOrders
-    
-from .vendor_direct_fulfillment_inventory.vendor_direct_fulfillment_inventory import VendorDirectFulfillmentInventory
-    
-from .tokens.tokens import Tokens
-    
-from .solicitations.solicitations import Solicitations
-    
-from .shipping.shipping import Shipping
-    
-from .services.services import Services
-    
-from .fba_small_and_light.fba_small_and_light import FbaSmallAndLight
-    
-from .fba_inbound_eligibility.fba_inbound_eligibility import FbaInboundEligibility
-    
-from .authorization.authorization import Authorization
-    
-from .aplus_content.aplus_content import AplusContent
-    
-from .fulfillment_outbound.fulfillment_outbound import FulfillmentOutbound
-    
-
+"""
+The endpoint clients, each module is imported on first access of its client (PEP 562),
+so `from sp_api.api import Orders` only imports the orders endpoint.
+"""
+# client name -> module defining it
+_endpoints = {
+    'Finances': 'finances.finances',
+    'Notifications': 'notifications.notifications',
+    'Orders': 'orders.orders',
+    'ProductFees': 'product_fees.product_fees',
+    'Sellers': 'sellers.sellers',
+    'Reports': 'reports.reports',
+    'Products': 'products.products',
+    'Sales': 'sales.sales',
+    'Catalog': 'catalog.catalog',
+    'Feeds': 'feeds.feeds',
+    'Inventories': 'inventories.inventories',
+    'FulfillmentInbound': 'fulfillment_inbound.fulfillment_inbound',
+    'Upload': 'upload.upload',
+    'Messaging': 'messaging.messaging',
+    'MerchantFulfillment': 'merchant_fulfillment.merchant_fulfillment',
+    ##### DO NOT DELETE ########## INSERT IMPORT HERE #######
+    'CatalogItems': 'catalog_items.catalog_items',
+    'ProductTypeDefinitions': 'product_type_definitions.product_type_definitions',
+    'ListingsItems': 'listings_items.listings_items',
+    'VendorTransactionStatus': 'vendor_transaction_status.vendor_transaction_status',
+    'VendorShipments': 'vendor_shipments.vendor_shipments',
+    'VendorOrders': 'vendor_orders.vendor_orders',
+    'VendorInvoices': 'vendor_invoices.vendor_invoices',
+    'VendorDirectFulfillmentTransactions': 'vendor_direct_fulfillment_transactions.vendor_direct_fulfillment_transactions',
+    'VendorDirectFulfillmentShipping': 'vendor_direct_fulfillment_shipping.vendor_direct_fulfillment_shipping',
+    'VendorDirectFulfillmentPayments': 'vendor_direct_fulfillment_payments.vendor_direct_fulfillment_payments',
+    'VendorDirectFulfillmentOrders': 'vendor_direct_fulfillment_orders.vendor_direct_fulfillment_orders',
+    'VendorDirectFulfillmentInventory': 'vendor_direct_fulfillment_inventory.vendor_direct_fulfillment_inventory',
+    'Tokens': 'tokens.tokens',
+    'Solicitations': 'solicitations.solicitations',
+    'Shipping': 'shipping.shipping',
+    'Services': 'services.services',
+    'FbaSmallAndLight': 'fba_small_and_light.fba_small_and_light',
+    'FbaInboundEligibility': 'fba_inbound_eligibility.fba_inbound_eligibility',
+    'Authorization': 'authorization.authorization',
+    'AplusContent': 'aplus_content.aplus_content',
+    'FulfillmentOutbound': 'fulfillment_outbound.fulfillment_outbound',
+}
 
 __all__ = [
     "Sales",
@@ -125,3 +107,17 @@ __all__ = [
     
 
 ]
+
+
+def __getattr__(name):
+    module = _endpoints.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # a relative import, like the `from .orders.orders import Orders` it replaces, shows up in `-X importtime`
+    endpoint = getattr(__import__(module, globals(), fromlist=[name], level=1), name)
+    globals()[name] = endpoint
+    return endpoint
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_endpoints))
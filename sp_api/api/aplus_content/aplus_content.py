@@ -12,7 +12,7 @@ class AplusContent(Client):
     """
 
 
-    @sp_endpoint('/aplus/2020-11-01/contentDocuments', method='GET')
+    @sp_endpoint('/aplus/2020-11-01/contentDocuments', method='GET', rate=10, burst=10)
     def search_content_documents(self, **kwargs) -> ApiResponse:
         """
         search_content_documents(self, **kwargs) -> ApiResponse
@@ -42,7 +42,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(kwargs.pop('path'),  params=kwargs)
     
 
-    @sp_endpoint('/aplus/2020-11-01/contentDocuments', method='POST')
+    @sp_endpoint('/aplus/2020-11-01/contentDocuments', method='POST', rate=10, burst=10)
     def create_content_document(self, **kwargs) -> ApiResponse:
         """
         create_content_document(self, **kwargs) -> ApiResponse
@@ -72,7 +72,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(kwargs.pop('path'),  data=kwargs)
     
 
-    @sp_endpoint('/aplus/2020-11-01/contentDocuments/{}', method='GET')
+    @sp_endpoint('/aplus/2020-11-01/contentDocuments/{}', method='GET', rate=10, burst=10)
     def get_content_document(self, contentReferenceKey, **kwargs) -> ApiResponse:
         """
         get_content_document(self, contentReferenceKey, **kwargs) -> ApiResponse
@@ -104,7 +104,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(fill_query_params(kwargs.pop('path'), contentReferenceKey), params=kwargs)
     
 
-    @sp_endpoint('/aplus/2020-11-01/contentDocuments/{}', method='POST')
+    @sp_endpoint('/aplus/2020-11-01/contentDocuments/{}', method='POST', rate=10, burst=10)
     def update_content_document(self, contentReferenceKey, **kwargs) -> ApiResponse:
         """
         update_content_document(self, contentReferenceKey, **kwargs) -> ApiResponse
@@ -136,7 +136,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(fill_query_params(kwargs.pop('path'), contentReferenceKey), data=kwargs)
     
 
-    @sp_endpoint('/aplus/2020-11-01/contentDocuments/{}/asins', method='GET')
+    @sp_endpoint('/aplus/2020-11-01/contentDocuments/{}/asins', method='GET', rate=10, burst=10)
     def list_content_document_asin_relations(self, contentReferenceKey, **kwargs) -> ApiResponse:
         """
         list_content_document_asin_relations(self, contentReferenceKey, **kwargs) -> ApiResponse
@@ -172,7 +172,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(fill_query_params(kwargs.pop('path'), contentReferenceKey), params=kwargs)
     
 
-    @sp_endpoint('/aplus/2020-11-01/contentDocuments/{}/asins', method='POST')
+    @sp_endpoint('/aplus/2020-11-01/contentDocuments/{}/asins', method='POST', rate=10, burst=10)
     def post_content_document_asin_relations(self, contentReferenceKey, **kwargs) -> ApiResponse:
         """
         post_content_document_asin_relations(self, contentReferenceKey, **kwargs) -> ApiResponse
@@ -204,7 +204,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(fill_query_params(kwargs.pop('path'), contentReferenceKey), data=kwargs)
     
 
-    @sp_endpoint('/aplus/2020-11-01/contentAsinValidations', method='POST')
+    @sp_endpoint('/aplus/2020-11-01/contentAsinValidations', method='POST', rate=10, burst=10)
     def validate_content_document_asin_relations(self, **kwargs) -> ApiResponse:
         """
         validate_content_document_asin_relations(self, **kwargs) -> ApiResponse
@@ -236,7 +236,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(kwargs.pop('path'),  data=kwargs)
     
 
-    @sp_endpoint('/aplus/2020-11-01/contentPublishRecords', method='GET')
+    @sp_endpoint('/aplus/2020-11-01/contentPublishRecords', method='GET', rate=10, burst=10)
     def search_content_publish_records(self, **kwargs) -> ApiResponse:
         """
         search_content_publish_records(self, **kwargs) -> ApiResponse
@@ -268,7 +268,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(kwargs.pop('path'),  params=kwargs)
     
 
-    @sp_endpoint('/aplus/2020-11-01/contentDocuments/{}/approvalSubmissions', method='POST')
+    @sp_endpoint('/aplus/2020-11-01/contentDocuments/{}/approvalSubmissions', method='POST', rate=10, burst=10)
     def post_content_document_approval_submission(self, contentReferenceKey, **kwargs) -> ApiResponse:
         """
         post_content_document_approval_submission(self, contentReferenceKey, **kwargs) -> ApiResponse
@@ -298,7 +298,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(fill_query_params(kwargs.pop('path'), contentReferenceKey), data=kwargs)
     
 
-    @sp_endpoint('/aplus/2020-11-01/contentDocuments/{}/suspendSubmissions', method='POST')
+    @sp_endpoint('/aplus/2020-11-01/contentDocuments/{}/suspendSubmissions', method='POST', rate=10, burst=10)
     def post_content_document_suspend_submission(self, contentReferenceKey, **kwargs) -> ApiResponse:
         """
         post_content_document_suspend_submission(self, contentReferenceKey, **kwargs) -> ApiResponse
@@ -12,7 +12,7 @@ class Authorization(Client):
     """
     grantless_scope = 'sellingpartnerapi::migration'
 
-    @sp_endpoint('/authorization/v1/authorizationCode', method='GET')
+    @sp_endpoint('/authorization/v1/authorizationCode', method='GET', rate=1, burst=5)
     def get_authorization_code(self, **kwargs) -> ApiResponse:
         """
         get_authorization_code(self, **kwargs) -> ApiResponse
@@ -9,7 +9,7 @@ class Catalog(Client):
 
     """
 
-    @sp_endpoint('/catalog/v0/items/{}')
+    @sp_endpoint('/catalog/v0/items/{}', rate=1, burst=1)
     def get_item(self, asin: str, **kwargs) -> ApiResponse:
         """
         get_item(self, asin: str, **kwargs) -> ApiResponse
@@ -35,7 +35,7 @@ class Catalog(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), asin), params=kwargs)
 
-    @sp_endpoint('/catalog/v0/items')
+    @sp_endpoint('/catalog/v0/items', rate=1, burst=1)
     def list_items(self, **kwargs) -> ApiResponse:
         """
         list_items(self, **kwargs) -> ApiResponse
@@ -69,7 +69,7 @@ class Catalog(Client):
             kwargs.update({'Query': urllib.parse.quote_plus(kwargs.pop('Query'))})
         return self._request(kwargs.pop('path'), params=kwargs)
 
-    @sp_endpoint('/catalog/v0/categories')
+    @sp_endpoint('/catalog/v0/categories', rate=1, burst=40)
     def list_categories(self, **kwargs) -> ApiResponse:
         """
         list_categories(self, **kwargs) -> ApiResponse
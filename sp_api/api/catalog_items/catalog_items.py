@@ -12,7 +12,7 @@ class CatalogItems(Client):
     """
 
 
-    @sp_endpoint('/catalog/2020-12-01/items', method='GET')
+    @sp_endpoint('/catalog/2020-12-01/items', method='GET', rate=1, burst=5)
     def search_catalog_items(self, **kwargs) -> ApiResponse:
         """
         search_catalog_items(self, **kwargs) -> ApiResponse
@@ -56,7 +56,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(kwargs.pop('path'),  params=kwargs)
     
 
-    @sp_endpoint('/catalog/2020-12-01/items/{}', method='GET')
+    @sp_endpoint('/catalog/2020-12-01/items/{}', method='GET', rate=5, burst=5)
     def get_catalog_item(self, asin, **kwargs) -> ApiResponse:
         """
         get_catalog_item(self, asin, **kwargs) -> ApiResponse
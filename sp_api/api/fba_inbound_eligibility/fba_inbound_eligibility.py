@@ -12,7 +12,7 @@ class FbaInboundEligibility(Client):
     """
 
 
-    @sp_endpoint('/fba/inbound/v1/eligibility/itemPreview', method='GET')
+    @sp_endpoint('/fba/inbound/v1/eligibility/itemPreview', method='GET', rate=1, burst=1)
     def get_item_eligibility_preview(self, **kwargs) -> ApiResponse:
         """
         get_item_eligibility_preview(self, **kwargs) -> ApiResponse
@@ -15,7 +15,7 @@ class FbaSmallAndLight(Client):
     def get_small_and_light_enrollment_by_seller_s_k_u(self, sellerSKU, **kwargs) -> ApiResponse:
         return self.get_small_and_light_enrollment_by_seller_s_k_u(sellerSKU, **kwargs)
 
-    @sp_endpoint('/fba/smallAndLight/v1/enrollments/{}', method='GET')
+    @sp_endpoint('/fba/smallAndLight/v1/enrollments/{}', method='GET', rate=2, burst=10)
     def get_small_and_light_enrollment_by_seller_sku(self, seller_sku, **kwargs) -> ApiResponse:
         """
         get_small_and_light_enrollment_by_seller_s_k_u(self, sellerSKU, **kwargs) -> ApiResponse
@@ -47,7 +47,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
     def put_small_and_light_enrollment_by_seller_s_k_u(self, sellerSKU, **kwargs) -> ApiResponse:
         return self.put_small_and_light_enrollment_by_seller_sku(sellerSKU, **kwargs)
 
-    @sp_endpoint('/fba/smallAndLight/v1/enrollments/{}', method='PUT')
+    @sp_endpoint('/fba/smallAndLight/v1/enrollments/{}', method='PUT', rate=2, burst=5)
     def put_small_and_light_enrollment_by_seller_sku(self, seller_sku, **kwargs) -> ApiResponse:
         """
         put_small_and_light_enrollment_by_seller_s_k_u(self, sellerSKU, **kwargs) -> ApiResponse
@@ -79,7 +79,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
     def delete_small_and_light_enrollment_by_seller_s_k_u(self, sellerSKU, **kwargs) -> ApiResponse:
         return self.delete_small_and_light_enrollment_by_seller_sku(sellerSKU, **kwargs)
 
-    @sp_endpoint('/fba/smallAndLight/v1/enrollments/{}', method='DELETE')
+    @sp_endpoint('/fba/smallAndLight/v1/enrollments/{}', method='DELETE', rate=2, burst=5)
     def delete_small_and_light_enrollment_by_seller_sku(self, seller_sku, **kwargs) -> ApiResponse:
         """
         delete_small_and_light_enrollment_by_seller_s_k_u(self, sellerSKU, **kwargs) -> ApiResponse
@@ -111,7 +111,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
     def get_small_and_light_eligibility_by_seller_s_k_u(self, sellerSKU, **kwargs) -> ApiResponse:
         return self.get_small_and_light_eligibility_by_seller_sku(sellerSKU, **kwargs)
 
-    @sp_endpoint('/fba/smallAndLight/v1/eligibilities/{}', method='GET')
+    @sp_endpoint('/fba/smallAndLight/v1/eligibilities/{}', method='GET', rate=2, burst=10)
     def get_small_and_light_eligibility_by_seller_sku(self, seller_sku, **kwargs) -> ApiResponse:
         """
         get_small_and_light_eligibility_by_seller_s_k_u(self, sellerSKU, **kwargs) -> ApiResponse
@@ -140,7 +140,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), seller_sku), params=kwargs)
     
 
-    @sp_endpoint('/fba/smallAndLight/v1/feePreviews', method='POST')
+    @sp_endpoint('/fba/smallAndLight/v1/feePreviews', method='POST', rate=1, burst=3)
     def get_small_and_light_fee_preview(self, **kwargs) -> ApiResponse:
         """
         get_small_and_light_fee_preview(self, **kwargs) -> ApiResponse
@@ -1,9 +1,7 @@
-import requests
 from sp_api.base import Client, sp_endpoint, Marketplaces, fill_query_params, ApiResponse
 
-import zlib
-
-from sp_api.base.helpers import encrypt_aes, decrypt_aes
+from sp_api.base.helpers import encrypt_aes_stream, DocumentDecoder
+from sp_api.base.processing_report import ProcessingReportParser
 
 
 class Feeds(Client):
@@ -13,7 +11,7 @@ class Feeds(Client):
     :link: https://github.com/amzn/selling-partner-api-docs/tree/main/references/feeds-api
     """
 
-    @sp_endpoint('/feeds/2020-09-04/feeds', method='POST')
+    @sp_endpoint('/feeds/2020-09-04/feeds', method='POST', rate=0.0083, burst=15)
     def create_feed(self, feed_type: str, input_feed_document_id: str, **kwargs) -> ApiResponse:
         """
         create_feed(self, feed_type: str, input_feed_document_id: str, **kwargs) -> ApiResponse
@@ -46,13 +44,15 @@ class Feeds(Client):
         }
         return self._request(kwargs.get('path'), data=data)
 
-    @sp_endpoint('/feeds/2020-09-04/documents', method='POST')
-    def create_feed_document(self, file, content_type='text/tsv', **kwargs) -> ApiResponse:
+    @sp_endpoint('/feeds/2020-09-04/documents', method='POST', rate=0.0083, burst=15)
+    def create_feed_document(self, file, content_type='text/tsv', compress: bool = False, **kwargs) -> ApiResponse:
         """
-        create_feed_document(self, file: File or FileLike, content_type='text/tsv', **kwargs) -> ApiResponse
+        create_feed_document(self, file: File or FileLike, content_type='text/tsv', compress: bool = False, **kwargs) -> ApiResponse
         Creates a feed document for the feed type that you specify.
         This method also encrypts and uploads the file you specify.
 
+        The file is encrypted and uploaded chunk by chunk, memory stays constant regardless of the file's size.
+
         **Usage Plan:**
 
         ======================================  ==============
@@ -66,6 +66,7 @@ class Feeds(Client):
         Args:
             file: File or File like object
             content_type: str
+            compress: bool | gzip the file while encrypting it, for feed types accepting compressed documents
             **kwargs:
 
         Returns:
@@ -76,22 +77,30 @@ class Feeds(Client):
             'contentType': kwargs.get('contentType', content_type)
         }
         response = self._request(kwargs.get('path'), data={**data, **kwargs})
-        upload = requests.put(
-            response.payload.get('url'),
-            data=encrypt_aes(file,
-                             response.payload.get('encryptionDetails').get('key'),
-                             response.payload.get('encryptionDetails').get('initializationVector')
-                             ),
-            headers={'Content-Type': content_type}
-        )
+        body = self._encrypt_feed(file, response.payload, compress)
+        with body:
+            upload = self.transport.request(
+                'PUT',
+                response.payload.get('url'),
+                data=body,
+                headers={'Content-Type': content_type, 'Content-Length': str(len(body))}
+            )
         if 200 <= upload.status_code < 300:
             return response
         from sp_api.base.exceptions import SellingApiException
-        raise SellingApiException(upload.headers)
+        raise SellingApiException([{'message': 'Uploading the feed document failed'}], upload.headers)
+
+    @staticmethod
+    def _encrypt_feed(file, payload, compress=False):
+        return encrypt_aes_stream(file,
+                                  payload.get('encryptionDetails').get('key'),
+                                  payload.get('encryptionDetails').get('initializationVector'),
+                                  compress)
 
-    def submit_feed(self, feed_type, file, content_type='text/tsv', **kwargs) -> [ApiResponse, ApiResponse]:
+    def submit_feed(self, feed_type, file, content_type='text/tsv', compress: bool = False,
+                    **kwargs) -> [ApiResponse, ApiResponse]:
         """
-        submit_feed(self, feed_type: str, file: File or File like, content_type='text/tsv', **kwargs) -> [ApiResponse, ApiResponse]
+        submit_feed(self, feed_type: str, file: File or File like, content_type='text/tsv', compress: bool = False, **kwargs) -> [ApiResponse, ApiResponse]
         Combines `create_feed_document` and `create_feed`, uploads the encrypted file and sends the feed to amazon.
 
         **Usage Plan:**
@@ -107,15 +116,16 @@ class Feeds(Client):
             feed_type:
             file:
             content_type:
+            compress: bool | gzip the file while encrypting it
             **kwargs:
 
         Returns:
             [CreateFeedDocumentResponse, CreateFeedResponse]:
         """
-        document_response = self.create_feed_document(file, content_type)
+        document_response = self.create_feed_document(file, content_type, compress)
         return document_response, self.create_feed(feed_type, document_response.payload.get('feedDocumentId'), **kwargs)
 
-    @sp_endpoint('/feeds/2020-09-04/feeds/{}')
+    @sp_endpoint('/feeds/2020-09-04/feeds/{}', rate=2, burst=15)
     def get_feed(self, feed_id: str, **kwargs) -> ApiResponse:
         """
         get_feed(self, feed_id: str, **kwargs) -> ApiResponse
@@ -141,11 +151,40 @@ class Feeds(Client):
         return self._request(fill_query_params(kwargs.pop('path'), feed_id), params=kwargs,
                              add_marketplace=False)
 
-    @sp_endpoint('/feeds/2020-09-04/documents/{}')
+    @sp_endpoint('/feeds/2020-09-04/documents/{}', rate=0.0222, burst=10)
+    def get_feed_document(self, feed_document_id: str, **kwargs) -> ApiResponse:
+        """
+        get_feed_document(self, feed_document_id: str, **kwargs) -> ApiResponse
+        Returns the information required for retrieving a feed document's contents, without downloading it.
+
+        **Usage Plan:**
+
+        ======================================  ==============
+        Rate (requests per second)               Burst
+        ======================================  ==============
+        0.0222                                  10
+        ======================================  ==============
+
+        For more information, see "Usage Plans and Rate Limits" in the Selling Partner API documentation.
+
+        Args:
+            feed_document_id: str | e.g. the resultFeedDocumentId of `get_feed`
+            **kwargs:
+
+        Returns:
+            GetFeedDocumentResponse:
+        """
+        return self._request(fill_query_params(kwargs.pop('path'), feed_document_id), params=kwargs,
+                             add_marketplace=False)
+
+    @sp_endpoint('/feeds/2020-09-04/documents/{}', rate=0.0222, burst=10)
     def get_feed_result_document(self, feed_id, **kwargs) -> str:
         """
         Returns the decrypted, unpacked FeedResponse
 
+        The document is decoded as utf-8, or iso-8859-1 if it isn't valid utf-8.
+        Use `iter_feed_result_issues` for large processing reports.
+
          **Usage Plan:**
 
         ======================================  ==============
@@ -164,13 +203,78 @@ class Feeds(Client):
         """
         response = self._request(fill_query_params(kwargs.pop('path'), feed_id), params=kwargs,
                                  add_marketplace=False)
-        url = response.payload.get('url')
-        decrypted = decrypt_aes(
-            requests.get(url).content,
-            response.payload.get('encryptionDetails').get('key'),
-            response.payload.get('encryptionDetails').get('initializationVector')
-        )
-
-        if 'compressionAlgorithm' in response.payload:
-            return zlib.decompress(bytearray(decrypted), 15 + 32).decode('iso-8859-1')
-        return decrypted.decode('iso-8859-1')
+        return ''.join(self.stream_feed_result_document(response.payload, 'auto'))
+
+    def stream_feed_result_document(self, document, encoding: str = None, chunk_size: int = 1024 * 1024):
+        """
+        stream_feed_result_document(self, document, encoding: str = None, chunk_size: int = 1024 * 1024)
+        Downloads, decrypts and unpacks a feed result document chunk by chunk
+
+        Args:
+            document: dict | payload of `get_feed_document`
+            encoding: str | decode the document, 'auto' detects the encoding, None yields bytes
+            chunk_size: int | size of the downloaded chunks
+
+        Returns:
+            Iterator[bytes] or Iterator[str]: the document's contents, piece by piece
+        """
+        decoder = self._result_decoder(document, encoding)
+        with self.transport.request('GET', document.get('url'), stream=True) as response:
+            for chunk in response.iter_content(chunk_size):
+                yield from decoder.feed(chunk)
+        yield from decoder.close()
+
+    def iter_feed_result_issues(self, feed_document_id, chunk_size: int = 1024 * 1024,
+                                parser: ProcessingReportParser = None):
+        """
+        iter_feed_result_issues(self, feed_document_id, chunk_size: int = 1024 * 1024, parser: ProcessingReportParser = None)
+        Streams a processing report and yields its errors and warnings as they are parsed.
+
+        XML, JSON and flat file reports are supported, neither the document nor its DOM is held in memory.
+        The report's header and summary are read from the `parser` once all issues are consumed.
+
+        Examples:
+            feed = Feeds().get_feed(feed_id).payload
+            for issue in Feeds().iter_feed_result_issues(feed['resultFeedDocumentId']):
+                print(issue['messageId'], issue['severity'], issue['message'])
+
+        Args:
+            feed_document_id: str | the resultFeedDocumentId of `get_feed`
+            chunk_size: int | size of the downloaded chunks
+            parser: ProcessingReportParser | pass one to read the header and summary afterwards
+
+        Returns:
+            Iterator[dict]: issues with messageId, code, severity and message
+        """
+        document = self.get_feed_document(feed_document_id).payload
+        parser = parser if parser is not None else ProcessingReportParser()
+        yield from parser.iter(self.stream_feed_result_document(document, chunk_size=chunk_size))
+
+    def get_feed_processing_report(self, feed_document_id, chunk_size: int = 1024 * 1024) -> dict:
+        """
+        get_feed_processing_report(self, feed_document_id, chunk_size: int = 1024 * 1024) -> dict
+        Streams and parses a processing report, see `sp_api.base.processing_report.parse_processing_report`
+
+        Args:
+            feed_document_id: str | the resultFeedDocumentId of `get_feed`
+            chunk_size: int | size of the downloaded chunks
+
+        Returns:
+            dict: {'header': {...}, 'summary': {...}, 'issues': [...]}
+        """
+        parser = ProcessingReportParser()
+        issues = list(self.iter_feed_result_issues(feed_document_id, chunk_size, parser))
+        return {'header': parser.header, 'summary': parser.summary, 'issues': issues}
+
+    @staticmethod
+    def _result_decoder(document, encoding=None):
+        encryption_details = document.get('encryptionDetails') or {}
+        return DocumentDecoder(encryption_details.get('key'), encryption_details.get('initializationVector'),
+                               'compressionAlgorithm' in document, encoding)
+
+    @staticmethod
+    def decrypt_feed_result_content(content, payload) -> str:
+        """
+        Decrypts and unpacks the already downloaded contents of a feed result document
+        """
+        return ''.join(Feeds._result_decoder(payload, 'auto').iter([content]))
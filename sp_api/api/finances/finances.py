@@ -4,7 +4,7 @@ from sp_api.base import sp_endpoint, fill_query_params
 
 class Finances(Client):
 
-    @sp_endpoint('/finances/v0/orders/{}/financialEvents')
+    @sp_endpoint('/finances/v0/orders/{}/financialEvents', rate=0.5, burst=30)
     def get_financial_events_for_order(self, order_id, **kwargs) -> ApiResponse:
         """
         get_financial_events_for_order(self, order_id, **kwargs) -> ApiResponse
@@ -19,7 +19,7 @@ class Finances(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), order_id), params={**kwargs})
 
-    @sp_endpoint('/finances/v0/financialEvents')
+    @sp_endpoint('/finances/v0/financialEvents', rate=0.5, burst=30)
     def list_financial_events(self, **kwargs) -> ApiResponse:
         """
         list_financial_events(self, **kwargs) -> ApiResponse:
@@ -33,7 +33,23 @@ class Finances(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path')), params={**kwargs})
 
-    @sp_endpoint('/finances/v0/financialEventGroups/{}/financialEvents')
+    def iter_financial_events(self, **kwargs):
+        """
+        iter_financial_events(self, **kwargs) -> Iterator[(str, dict)]
+
+        Yields the financial events of all pages of `list_financial_events` one at a time, loading the next page when it's needed.
+        Takes the same arguments as `list_financial_events`.
+        Every event is yielded as tuple of its list's name and the event, e.g. ('ShipmentEventList', {...})
+
+        Args:
+            **kwargs:
+
+        Returns:
+            Iterator[(str, dict)]:
+        """
+        return self._iter_items(self.list_financial_events, self._financial_events, **kwargs)
+
+    @sp_endpoint('/finances/v0/financialEventGroups/{}/financialEvents', rate=0.5, burst=30)
     def list_financial_events_by_group_id(self, event_group_id,  **kwargs) -> ApiResponse:
         """
         list_financial_events_by_groupid(self, event_group_id,  **kwargs) -> ApiResponse:
@@ -48,7 +64,25 @@ class Finances(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), event_group_id), params={**kwargs})
 
-    @sp_endpoint('/finances/v0/financialEventGroups')
+    def iter_financial_events_by_group_id(self, event_group_id, **kwargs):
+        """
+        iter_financial_events_by_group_id(self, event_group_id, **kwargs) -> Iterator[(str, dict)]
+
+        Yields the financial events of all pages of `list_financial_events_by_group_id` one at a time, loading the next page when it's needed.
+        Takes the same arguments as `list_financial_events_by_group_id`.
+        Every event is yielded as tuple of its list's name and the event, e.g. ('ShipmentEventList', {...})
+
+        Args:
+            event_group_id:
+            **kwargs:
+
+        Returns:
+            Iterator[(str, dict)]:
+        """
+        return self._iter_items(self.list_financial_events_by_group_id, self._financial_events, event_group_id,
+                                 **kwargs)
+
+    @sp_endpoint('/finances/v0/financialEventGroups', rate=0.5, burst=30)
     def list_financial_event_groups(self, **kwargs) -> ApiResponse:
         """
         list_financial_event_groups(self, **kwargs) -> ApiResponse:
@@ -62,3 +96,23 @@ class Finances(Client):
         """
         return self._request(kwargs.pop('path'), params={**kwargs})
 
+    def iter_financial_event_groups(self, **kwargs):
+        """
+        iter_financial_event_groups(self, **kwargs) -> Iterator[dict]
+
+        Yields the financial event groups of all pages of `list_financial_event_groups` one at a time, loading the next page when it's needed.
+        Takes the same arguments as `list_financial_event_groups`.
+
+        Args:
+            **kwargs:
+
+        Returns:
+            Iterator[dict]:
+        """
+        return self._iter_items(self.list_financial_event_groups, 'FinancialEventGroupList', **kwargs)
+
+    @staticmethod
+    def _financial_events(payload):
+        for event_list, events in (payload.get('FinancialEvents') or {}).items():
+            for event in events or []:
+                yield event_list, event
@@ -2,71 +2,102 @@ from sp_api.base import Client, Marketplaces, ApiResponse
 from sp_api.base import sp_endpoint, fill_query_params
 
 class FulfillmentInbound(Client):
-    @sp_endpoint("/fba/inbound/v0/itemsGuidance")
+    @sp_endpoint("/fba/inbound/v0/itemsGuidance", rate=2, burst=30)
     def item_guidance(self, **kwargs):
         return self._request(kwargs.pop('path'), params=kwargs)
 
-    @sp_endpoint("/fba/inbound/v0/plans", method='POST')
+    @sp_endpoint("/fba/inbound/v0/plans", method='POST', rate=2, burst=30)
     def plans(self, data, **kwargs):
         return self._request(kwargs.pop('path'), data={**data, **kwargs})
 
-    @sp_endpoint("/fba/inbound/v0/shipments/{}", method='POST')
+    @sp_endpoint("/fba/inbound/v0/shipments/{}", method='POST', rate=2, burst=30)
     def create_shipment(self, shipment_id, data, **kwargs):
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), data={**data, **kwargs})
 
-    @sp_endpoint("/fba/inbound/v0/shipments/{}", method='PUT')
+    @sp_endpoint("/fba/inbound/v0/shipments/{}", method='PUT', rate=2, burst=30)
     def update_shipment(self, shipment_id, data, **kwargs):
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), data={**data, **kwargs})
 
-    @sp_endpoint("/fba/inbound/v0/shipments/{}/preorder")
+    @sp_endpoint("/fba/inbound/v0/shipments/{}/preorder", rate=2, burst=30)
     def preorder(self, shipment_id, **kwargs):
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), params=kwargs)
 
-    @sp_endpoint("/fba/inbound/v0/shipments/{}/preorder/confirm", method='PUT')
+    @sp_endpoint("/fba/inbound/v0/shipments/{}/preorder/confirm", method='PUT', rate=2, burst=30)
     def confirm_preorder(self, shipment_id, **kwargs):
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), params=kwargs)
 
-    @sp_endpoint("/fba/inbound/v0/prepInstructions")
+    @sp_endpoint("/fba/inbound/v0/prepInstructions", rate=2, burst=30)
     def prep_instruction(self, data, **kwargs):
         return self._request(kwargs.pop('path'), params={**data, **kwargs})
 
-    @sp_endpoint("/fba/inbound/v0/shipments/{}/transport")
+    @sp_endpoint("/fba/inbound/v0/shipments/{}/transport", rate=2, burst=30)
     def get_transport_information(self, shipment_id, **kwargs):
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), params=kwargs)
 
-    @sp_endpoint("/fba/inbound/v0/shipments/{}/transport", method='PUT')
+    @sp_endpoint("/fba/inbound/v0/shipments/{}/transport", method='PUT', rate=2, burst=30)
     def update_transport_information(self, shipment_id, **kwargs):
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), data=kwargs)
 
-    @sp_endpoint("/fba/inbound/v0/shipments/{}/transport/void", method='POST')
+    @sp_endpoint("/fba/inbound/v0/shipments/{}/transport/void", method='POST', rate=2, burst=30)
     def void_transport(self, shipment_id, **kwargs):
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), data=kwargs, add_marketplace=False)
 
-    @sp_endpoint("/fba/inbound/v0/shipments/{}/transport/estimate", method='POST')
+    @sp_endpoint("/fba/inbound/v0/shipments/{}/transport/estimate", method='POST', rate=2, burst=30)
     def estimate_transport(self, shipment_id, **kwargs):
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), data=kwargs, add_marketplace=False)
 
-    @sp_endpoint("/fba/inbound/v0/shipments/{}/transport/confirm", method='POST')
+    @sp_endpoint("/fba/inbound/v0/shipments/{}/transport/confirm", method='POST', rate=2, burst=30)
     def confirm_transport(self, shipment_id, **kwargs):
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), data=kwargs, add_marketplace=False)
 
-    @sp_endpoint("/fba/inbound/v0/shipments/{}/labels")
+    @sp_endpoint("/fba/inbound/v0/shipments/{}/labels", rate=2, burst=30)
     def get_labels(self, shipment_id, **kwargs):
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), params=kwargs, add_marketplace=False)
 
-    @sp_endpoint("/fba/inbound/v0/shipments/{}/billOfLading")
+    @sp_endpoint("/fba/inbound/v0/shipments/{}/billOfLading", rate=2, burst=30)
     def bill_of_lading(self, shipment_id, **kwargs):
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), params=kwargs)
 
-    @sp_endpoint("/fba/inbound/v0/shipments")
+    @sp_endpoint("/fba/inbound/v0/shipments", rate=2, burst=30)
     def get_shipments(self, **kwargs):
         return self._request(kwargs.pop('path'), params=kwargs)
 
-    @sp_endpoint("/fba/inbound/v0/shipments/{}/items")
+    def iter_shipments(self, **kwargs):
+        """
+        iter_shipments(self, **kwargs) -> Iterator[dict]
+
+        Yields the shipments of all pages of `get_shipments` one at a time, loading the next page when it's needed.
+        Takes the same arguments as `get_shipments`.
+
+        Args:
+            **kwargs:
+
+        Returns:
+            Iterator[dict]:
+        """
+        return self._iter_items(self.get_shipments, 'ShipmentData', next_page_kwargs={'QueryType': 'NEXT_TOKEN'},
+                                 **kwargs)
+
+    @sp_endpoint("/fba/inbound/v0/shipments/{}/items", rate=2, burst=30)
     def shipment_items_by_shipment(self, shipment_id, **kwargs):
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), params=kwargs)
 
-    @sp_endpoint("/fba/inbound/v0/shipmentItems")
+    @sp_endpoint("/fba/inbound/v0/shipmentItems", rate=2, burst=30)
     def shipment_items(self, **kwargs):
         return self._request(kwargs.pop('path'), params=kwargs)
 
+    def iter_shipment_items(self, **kwargs):
+        """
+        iter_shipment_items(self, **kwargs) -> Iterator[dict]
+
+        Yields the shipment items of all pages of `shipment_items` one at a time, loading the next page when it's needed.
+        Takes the same arguments as `shipment_items`.
+
+        Args:
+            **kwargs:
+
+        Returns:
+            Iterator[dict]:
+        """
+        return self._iter_items(self.shipment_items, 'ItemData', next_page_kwargs={'QueryType': 'NEXT_TOKEN'}, **kwargs)
+
@@ -12,7 +12,7 @@ class FulfillmentOutbound(Client):
     """
 
 
-    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders/preview', method='POST')
+    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders/preview', method='POST', rate=2, burst=30)
     def get_fulfillment_preview(self, **kwargs) -> ApiResponse:
         """
         get_fulfillment_preview(self, **kwargs) -> ApiResponse
@@ -66,7 +66,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(kwargs.pop('path'),  data=kwargs)
     
 
-    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders', method='GET')
+    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders', method='GET', rate=2, burst=30)
     def list_all_fulfillment_orders(self, **kwargs) -> ApiResponse:
         """
         list_all_fulfillment_orders(self, **kwargs) -> ApiResponse
@@ -95,7 +95,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(kwargs.pop('path'),  params=kwargs)
     
 
-    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders', method='POST')
+    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders', method='POST', rate=2, burst=30)
     def create_fulfillment_order(self, **kwargs) -> ApiResponse:
         """
         create_fulfillment_order(self, **kwargs) -> ApiResponse
@@ -148,7 +148,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(kwargs.pop('path'),  data=kwargs)
     
 
-    @sp_endpoint('/fba/outbound/2020-07-01/tracking', method='GET')
+    @sp_endpoint('/fba/outbound/2020-07-01/tracking', method='GET', rate=2, burst=30)
     def get_package_tracking_details(self, **kwargs) -> ApiResponse:
         """
         get_package_tracking_details(self, **kwargs) -> ApiResponse
@@ -175,7 +175,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(kwargs.pop('path'),  params=kwargs)
     
 
-    @sp_endpoint('/fba/outbound/2020-07-01/returnReasonCodes', method='GET')
+    @sp_endpoint('/fba/outbound/2020-07-01/returnReasonCodes', method='GET', rate=2, burst=30)
     def list_return_reason_codes(self, **kwargs) -> ApiResponse:
         """
         list_return_reason_codes(self, **kwargs) -> ApiResponse
@@ -208,7 +208,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(kwargs.pop('path'),  params=kwargs)
     
 
-    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders/{}/return', method='PUT')
+    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders/{}/return', method='PUT', rate=2, burst=30)
     def create_fulfillment_return(self, sellerFulfillmentOrderId, **kwargs) -> ApiResponse:
         """
         create_fulfillment_return(self, sellerFulfillmentOrderId, **kwargs) -> ApiResponse
@@ -241,7 +241,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), sellerFulfillmentOrderId), data=kwargs)
     
 
-    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders/{}', method='GET')
+    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders/{}', method='GET', rate=2, burst=30)
     def get_fulfillment_order(self, sellerFulfillmentOrderId, **kwargs) -> ApiResponse:
         """
         get_fulfillment_order(self, sellerFulfillmentOrderId, **kwargs) -> ApiResponse
@@ -268,7 +268,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), sellerFulfillmentOrderId), params=kwargs)
     
 
-    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders/{}', method='PUT')
+    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders/{}', method='PUT', rate=2, burst=30)
     def update_fulfillment_order(self, sellerFulfillmentOrderId, **kwargs) -> ApiResponse:
         """
         update_fulfillment_order(self, sellerFulfillmentOrderId, **kwargs) -> ApiResponse
@@ -313,7 +313,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), sellerFulfillmentOrderId), data=kwargs)
     
 
-    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders/{}/cancel', method='PUT')
+    @sp_endpoint('/fba/outbound/2020-07-01/fulfillmentOrders/{}/cancel', method='PUT', rate=2, burst=30)
     def cancel_fulfillment_order(self, sellerFulfillmentOrderId, **kwargs) -> ApiResponse:
         """
         cancel_fulfillment_order(self, sellerFulfillmentOrderId, **kwargs) -> ApiResponse
@@ -340,7 +340,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), sellerFulfillmentOrderId), data=kwargs)
     
 
-    @sp_endpoint('/fba/outbound/2020-07-01/features', method='GET')
+    @sp_endpoint('/fba/outbound/2020-07-01/features', method='GET', rate=2, burst=30)
     def get_features(self, **kwargs) -> ApiResponse:
         """
         get_features(self, **kwargs) -> ApiResponse
@@ -367,7 +367,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(kwargs.pop('path'),  params=kwargs)
     
 
-    @sp_endpoint('/fba/outbound/2020-07-01/features/inventory/{}', method='GET')
+    @sp_endpoint('/fba/outbound/2020-07-01/features/inventory/{}', method='GET', rate=2, burst=30)
     def get_feature_inventory(self, featureName, **kwargs) -> ApiResponse:
         """
         get_feature_inventory(self, featureName, **kwargs) -> ApiResponse
@@ -398,7 +398,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), featureName), params=kwargs)
     
 
-    @sp_endpoint('/fba/outbound/2020-07-01/features/inventory/{}', method='GET')
+    @sp_endpoint('/fba/outbound/2020-07-01/features/inventory/{}', method='GET', rate=2, burst=30)
     def get_feature_s_k_u(self, featureName, **kwargs) -> ApiResponse:
         """
         get_feature_s_k_u(self, featureName, **kwargs) -> ApiResponse
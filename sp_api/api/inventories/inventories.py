@@ -9,7 +9,7 @@ class Inventories(Client):
     :link: https://github.com/amzn/selling-partner-api-docs/blob/main/references/fba-inventory-api/fbaInventory.md#getinventorysummaries
     """
 
-    @sp_endpoint('/fba/inventory/v1/summaries')
+    @sp_endpoint('/fba/inventory/v1/summaries', rate=90, burst=150)
     def get_inventory_summary_marketplace(self, **kwargs) -> ApiResponse:
         """
         get_inventory_summary_marketplace(self, **kwargs) -> GetInventorySummariesResponse
@@ -60,3 +60,19 @@ class Inventories(Client):
 
         return self._request(kwargs.pop('path'), params=kwargs)
 
+    def iter_inventory_summaries(self, **kwargs):
+        """
+        iter_inventory_summaries(self, **kwargs) -> Iterator[dict]
+
+        Yields the inventory summaries of all pages of `get_inventory_summary_marketplace` one at a time, loading the next page when it's needed.
+        Takes the same arguments as `get_inventory_summary_marketplace`.
+
+        Args:
+            **kwargs:
+
+        Returns:
+            Iterator[dict]:
+        """
+        return self._iter_items(self.get_inventory_summary_marketplace, 'inventorySummaries', next_token_param='nextToken',
+                                 next_page_kwargs=kwargs, **kwargs)
+
@@ -12,7 +12,7 @@ class ListingsItems(Client):
     """
 
 
-    @sp_endpoint('/listings/2020-09-01/items/{}/{}', method='DELETE')
+    @sp_endpoint('/listings/2020-09-01/items/{}/{}', method='DELETE', rate=5, burst=10)
     def delete_listings_item(self, sellerId, sku, **kwargs) -> ApiResponse:
         """
         delete_listings_item(self, sellerId, **kwargs) -> ApiResponse
@@ -45,7 +45,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
     
         return self._request(fill_query_params(kwargs.pop('path'), sellerId, sku), params=kwargs)
 
-    @sp_endpoint('/listings/2021-08-01/items/{}/{}', method='GET')
+    @sp_endpoint('/listings/2021-08-01/items/{}/{}', method='GET', rate=5, burst=10)
     def get_listings_item(self, sellerId, sku, **kwargs) -> ApiResponse:
         """
         get_listings_item(self, sellerId, **kwargs) -> ApiResponse
@@ -79,7 +79,7 @@ The `x-amzn-RateLimit-Limit` response header returns the usage plan rate limits
 
         return self._request(fill_query_params(kwargs.pop('path'), sellerId, sku), params=kwargs)
 
-    @sp_endpoint('/listings/2020-09-01/items/{}/{}', method='PATCH')
+    @sp_endpoint('/listings/2020-09-01/items/{}/{}', method='PATCH', rate=5, burst=10)
     def patch_listings_item(self, sellerId, sku, **kwargs) -> ApiResponse:
         """
         patch_listings_item(self, sellerId, **kwargs) -> ApiResponse
@@ -118,7 +118,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
     
         return self._request(fill_query_params(kwargs.pop('path'), sellerId, sku), data=kwargs.pop('body'), params=kwargs)
 
-    @sp_endpoint('/listings/2020-09-01/items/{}/{}', method='PUT')
+    @sp_endpoint('/listings/2020-09-01/items/{}/{}', method='PUT', rate=5, burst=10)
     def put_listings_item(self, sellerId, sku, **kwargs) -> ApiResponse:
         """
         put_listings_item(self, sellerId, **kwargs) -> ApiResponse
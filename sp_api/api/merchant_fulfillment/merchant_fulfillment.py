@@ -8,7 +8,7 @@ class MerchantFulfillment(Client):
 
     """
 
-    @sp_endpoint("/mfn/v0/eligibleServices", method='POST')
+    @sp_endpoint("/mfn/v0/eligibleServices", method='POST', rate=1, burst=1)
     def get_eligible_shipment_services_old(self, shipment_request_details: dict, **kwargs) -> ApiResponse:
         """
         get_eligible_shipment_services_old(self, shipment_request_details: dict, **kwargs) -> ApiResponse
@@ -38,7 +38,7 @@ class MerchantFulfillment(Client):
 
         return self._request(kwargs.pop('path'), data=data)
 
-    @sp_endpoint("/mfn/v0/eligibleShippingServices", method='POST')
+    @sp_endpoint("/mfn/v0/eligibleShippingServices", method='POST', rate=1, burst=1)
     def get_eligible_shipment_services(self, shipment_request_details: dict, **kwargs) -> ApiResponse:
         """
         get_eligible_shipment_services(self, shipment_request_details: dict, **kwargs) -> ApiResponse
@@ -69,7 +69,7 @@ class MerchantFulfillment(Client):
 
         return self._request(kwargs.pop('path'), data=data)
 
-    @sp_endpoint("/mfn/v0/shipments/{}")
+    @sp_endpoint("/mfn/v0/shipments/{}", rate=1, burst=1)
     def get_shipment(self, shipment_id: str, **kwargs) -> ApiResponse:
         """
         get_shipment(self, shipmentId:str) -> ApiResponse
@@ -93,7 +93,7 @@ class MerchantFulfillment(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), params=kwargs, add_marketplace=False)
 
-    @sp_endpoint("/mfn/v0/shipments/{}", method='DELETE')
+    @sp_endpoint("/mfn/v0/shipments/{}", method='DELETE', rate=1, burst=1)
     def cancel_shipment(self, shipment_id: str, **kwargs) -> ApiResponse:
         """
         cancel_shipment(self, shipment_id: str, **kwargs) -> ApiResponse
@@ -117,7 +117,7 @@ class MerchantFulfillment(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), params=kwargs, add_marketplace=False)
 
-    @sp_endpoint("/mfn/v0/shipments/{}/cancel", method='PUT')
+    @sp_endpoint("/mfn/v0/shipments/{}/cancel", method='PUT', rate=1, burst=1)
     def cancel_shipment_old(self, shipment_id: str, **kwargs) -> ApiResponse:
         """
         cancel_shipment_old(self, shipment_id: str, **kwargs) -> ApiResponse
@@ -141,7 +141,7 @@ class MerchantFulfillment(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), shipment_id), params=kwargs, add_marketplace=False)
 
-    @sp_endpoint("/mfn/v0/shipments", method='POST')
+    @sp_endpoint("/mfn/v0/shipments", method='POST', rate=1, burst=1)
     def create_shipment(self, shipment_request_details: dict, shipping_service_id: str, **kwargs) -> ApiResponse:
         """
         create_shipment(self, shipment_request_details: dict, shipping_service_id: str, **kwargs) -> ApiResponse
@@ -172,7 +172,7 @@ class MerchantFulfillment(Client):
         }
         return self._request(kwargs.pop('path'), data=data, add_marketplace=False)
 
-    @sp_endpoint("/mfn/v0/sellerInputs", method='POST')
+    @sp_endpoint("/mfn/v0/sellerInputs", method='POST', rate=1, burst=1)
     def get_additional_seller_inputs_old(self, shipping_service_id: str,  ship_from_address: dict,
                                          order_id: str, **kwargs) -> ApiResponse:
         """
@@ -207,7 +207,7 @@ class MerchantFulfillment(Client):
         }
         return self._request(kwargs.pop('path'), data=data, add_marketplace=False)
 
-    @sp_endpoint("/mfn/v0/additionalSellerInputs", method='POST')
+    @sp_endpoint("/mfn/v0/additionalSellerInputs", method='POST', rate=1, burst=1)
     def get_additional_seller_inputs(self, shipping_service_id: str, ship_from_address: dict,
                                      order_id: str, **kwargs) -> ApiResponse:
         """
@@ -11,7 +11,7 @@ class Messaging(Client):
     With the Messaging API you can build applications that send messages to buyers. You can get a list of message types that are available for an order that you specify, then call an operation that sends a message to the buyer for that order. The Messaging API returns responses that are formed according to the <a href=https://tools.ietf.org/html/draft-kelly-json-hal-08>JSON Hypertext Application Language</a> (HAL) standard.
     """
 
-    @sp_endpoint('/messaging/v1/orders/{}', method='GET')
+    @sp_endpoint('/messaging/v1/orders/{}', method='GET', rate=1, burst=5)
     def get_messaging_actions_for_order(self, order_id, **kwargs) -> ApiResponse:
         """
         get_messaging_actions_for_order(self, order_id, **kwargs) -> ApiResponse
@@ -39,7 +39,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
 
         return self._request(fill_query_params(kwargs.pop('path'), order_id), params=kwargs)
 
-    @sp_endpoint('/messaging/v1/orders/{}/messages/confirmCustomizationDetails', method='POST')
+    @sp_endpoint('/messaging/v1/orders/{}/messages/confirmCustomizationDetails', method='POST', rate=1, burst=5)
     def confirm_customization_details(self, order_id, **kwargs) -> ApiResponse:
         """
         confirm_customization_details(self, order_id, **kwargs) -> ApiResponse
@@ -75,7 +75,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
             fill_query_params(kwargs.pop('path'), order_id), data=kwargs, params={"marketplaceIds": self.marketplace_id}
         )
 
-    @sp_endpoint('/messaging/v1/orders/{}/messages/confirmDeliveryDetails', method='POST')
+    @sp_endpoint('/messaging/v1/orders/{}/messages/confirmDeliveryDetails', method='POST', rate=1, burst=5)
     def create_confirm_delivery_details(self, order_id, **kwargs) -> ApiResponse:
         """
         create_confirm_delivery_details(self, order_id, **kwargs) -> ApiResponse
@@ -111,7 +111,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
             fill_query_params(kwargs.pop('path'), order_id), data=kwargs, params={"marketplaceIds": self.marketplace_id}
         )
 
-    @sp_endpoint('/messaging/v1/orders/{}/messages/legalDisclosure', method='POST')
+    @sp_endpoint('/messaging/v1/orders/{}/messages/legalDisclosure', method='POST', rate=1, burst=5)
     def create_legal_disclosure(self, order_id, **kwargs) -> ApiResponse:
         """
         create_legal_disclosure(self, order_id, **kwargs) -> ApiResponse
@@ -147,7 +147,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
             fill_query_params(kwargs.pop('path'), order_id), data=kwargs, params={"marketplaceIds": self.marketplace_id}
         )
 
-    @sp_endpoint('/messaging/v1/orders/{}/messages/negativeFeedbackRemoval', method='POST')
+    @sp_endpoint('/messaging/v1/orders/{}/messages/negativeFeedbackRemoval', method='POST', rate=1, burst=5)
     def create_negative_feedback_removal(self, order_id, **kwargs) -> ApiResponse:
         """
         create_negative_feedback_removal(self, order_id, **kwargs) -> ApiResponse
@@ -174,7 +174,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
             fill_query_params(kwargs.pop('path'), order_id), data=kwargs, params={"marketplaceIds": self.marketplace_id}
         )
 
-    @sp_endpoint('/messaging/v1/orders/{}/messages/confirmOrderDetails', method='POST')
+    @sp_endpoint('/messaging/v1/orders/{}/messages/confirmOrderDetails', method='POST', rate=1, burst=5)
     def create_confirm_order_details(self, order_id, **kwargs) -> ApiResponse:
         """
         create_confirm_order_details(self, order_id, **kwargs) -> ApiResponse
@@ -210,7 +210,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
             fill_query_params(kwargs.pop('path'), order_id), data=kwargs, params={"marketplaceIds": self.marketplace_id}
         )
 
-    @sp_endpoint('/messaging/v1/orders/{}/messages/confirmServiceDetails', method='POST')
+    @sp_endpoint('/messaging/v1/orders/{}/messages/confirmServiceDetails', method='POST', rate=1, burst=5)
     def create_confirm_service_details(self, order_id, **kwargs) -> ApiResponse:
         """
         create_confirm_service_details(self, order_id, **kwargs) -> ApiResponse
@@ -246,7 +246,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
             fill_query_params(kwargs.pop('path'), order_id), data=kwargs, params={"marketplaceIds": self.marketplace_id}
         )
 
-    @sp_endpoint('/messaging/v1/orders/{}/messages/amazonMotors', method='POST')
+    @sp_endpoint('/messaging/v1/orders/{}/messages/amazonMotors', method='POST', rate=1, burst=5)
     def create_amazon_motors(self, order_id, **kwargs) -> ApiResponse:
         """
         create_amazon_motors(self, order_id, **kwargs) -> ApiResponse
@@ -282,7 +282,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
             fill_query_params(kwargs.pop('path'), order_id), data=kwargs, params={"marketplaceIds": self.marketplace_id}
         )
 
-    @sp_endpoint('/messaging/v1/orders/{}/messages/warranty', method='POST')
+    @sp_endpoint('/messaging/v1/orders/{}/messages/warranty', method='POST', rate=1, burst=5)
     def create_warranty(self, order_id, **kwargs) -> ApiResponse:
         """
         create_warranty(self, order_id, **kwargs) -> ApiResponse
@@ -321,7 +321,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
             fill_query_params(kwargs.pop('path'), order_id), data=kwargs, params={"marketplaceIds": self.marketplace_id}
         )
 
-    @sp_endpoint('/messaging/v1/orders/{}/attributes', method='GET')
+    @sp_endpoint('/messaging/v1/orders/{}/attributes', method='GET', rate=1, burst=5)
     def get_attributes(self, order_id, **kwargs) -> ApiResponse:
         """
         get_attributes(self, order_id, **kwargs) -> ApiResponse
@@ -344,7 +344,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
 
         return self._request(fill_query_params(kwargs.pop('path'), order_id), params=kwargs)
 
-    @sp_endpoint('/messaging/v1/orders/{}/messages/digitalAccessKey', method='POST')
+    @sp_endpoint('/messaging/v1/orders/{}/messages/digitalAccessKey', method='POST', rate=1, burst=5)
     def create_digital_access_key(self, order_id, **kwargs) -> ApiResponse:
         """
         create_digital_access_key(self, order_id, **kwargs) -> ApiResponse
@@ -381,7 +381,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
             fill_query_params(kwargs.pop('path'), order_id), data=kwargs, params={"marketplaceIds": self.marketplace_id}
         )
 
-    @sp_endpoint('/messaging/v1/orders/{}/messages/unexpectedProblem', method='POST')
+    @sp_endpoint('/messaging/v1/orders/{}/messages/unexpectedProblem', method='POST', rate=1, burst=5)
     def create_unexpected_problem(self, order_id, **kwargs) -> ApiResponse:
         """
         create_unexpected_problem(self, order_id, **kwargs) -> ApiResponse
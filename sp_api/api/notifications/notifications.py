@@ -13,7 +13,7 @@ class Notifications(Client):
         """deprecated, use create_subscription"""
         return self.create_subscription(notification_type, **kwargs)
 
-    @sp_endpoint('/notifications/v1/subscriptions/{}', method='POST')
+    @sp_endpoint('/notifications/v1/subscriptions/{}', method='POST', rate=1, burst=5)
     def create_subscription(self, notification_type: NotificationType or str, destination_id: str = None,
                             **kwargs) -> ApiResponse:
         """
@@ -50,7 +50,7 @@ class Notifications(Client):
                                                                                str) else notification_type.value),
                              data={**kwargs, **data})
 
-    @sp_endpoint('/notifications/v1/subscriptions/{}')
+    @sp_endpoint('/notifications/v1/subscriptions/{}', rate=1, burst=5)
     def get_subscription(self, notification_type: NotificationType or str, **kwargs) -> ApiResponse:
         """
         get_subscription(self, notification_type: NotificationType or str, **kwargs) -> ApiResponse
@@ -79,7 +79,7 @@ class Notifications(Client):
                                                                                                    str) else notification_type.value),
                              params={**kwargs})
 
-    @sp_endpoint('/notifications/v1/subscriptions/{}/{}', method='DELETE')
+    @sp_endpoint('/notifications/v1/subscriptions/{}/{}', method='DELETE', rate=1, burst=5)
     def delete_notification_subscription(self, notification_type: NotificationType or str, subscription_id: str,
                                          **kwargs) -> ApiResponse:
         """
@@ -112,7 +112,7 @@ class Notifications(Client):
                               subscription_id),
             params={**kwargs})
 
-    @sp_endpoint(path='/notifications/v1/destinations', method='POST')
+    @sp_endpoint(path='/notifications/v1/destinations', method='POST', rate=1, burst=5)
     def create_destination(self, name: str, arn: str = None, account_id: str = None, region: str = None, **kwargs) -> ApiResponse:
         """
         create_destination(self, name: str, arn: str, **kwargs) -> ApiResponse
@@ -153,7 +153,7 @@ class Notifications(Client):
 
         return self._request_grantless_operation(kwargs.pop('path'), data={**kwargs, **data})
 
-    @sp_endpoint('/notifications/v1/destinations', method='GET')
+    @sp_endpoint('/notifications/v1/destinations', method='GET', rate=1, burst=5)
     def get_destinations(self, **kwargs) -> ApiResponse:
         """
         get_destinations(self, **kwargs) -> ApiResponse
@@ -179,7 +179,7 @@ class Notifications(Client):
         """
         return self._request_grantless_operation(kwargs.pop('path'), params={**kwargs})
 
-    @sp_endpoint('/notifications/v1/destinations/{}', method='GET')
+    @sp_endpoint('/notifications/v1/destinations/{}', method='GET', rate=1, burst=5)
     def get_destination(self, destination_id: str, **kwargs) -> ApiResponse:
         """
         get_destination(self, destination_id: str, **kwargs) -> ApiResponse
@@ -208,7 +208,7 @@ class Notifications(Client):
         return self._request_grantless_operation(fill_query_params(kwargs.pop('path'), destination_id),
                                                  params={**kwargs})
 
-    @sp_endpoint('/notifications/v1/destinations/{}', method='DELETE')
+    @sp_endpoint('/notifications/v1/destinations/{}', method='DELETE', rate=1, burst=5)
     def delete_destination(self, destination_id: str, **kwargs) -> ApiResponse:
         """
         delete_destination(self, destination_id: str, **kwargs) -> ApiResponse
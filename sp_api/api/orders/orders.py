@@ -7,7 +7,7 @@ class Orders(Client):
     :link: https://github.com/amzn/selling-partner-api-docs/tree/main/references/orders-api
     """
 
-    @sp_endpoint('/orders/v0/orders')
+    @sp_endpoint('/orders/v0/orders', rate=1, burst=1)
     def get_orders(self, **kwargs) -> ApiResponse:
         """
         get_orders(self, **kwargs) -> ApiResponse
@@ -50,7 +50,22 @@ class Orders(Client):
         """
         return self._request(kwargs.pop('path'), params={**kwargs})
 
-    @sp_endpoint('/orders/v0/orders/{}')
+    def iter_orders(self, **kwargs):
+        """
+        iter_orders(self, **kwargs) -> Iterator[dict]
+
+        Yields the orders of all pages of `get_orders` one at a time, loading the next page when it's needed.
+        Takes the same arguments as `get_orders`.
+
+        Args:
+            **kwargs:
+
+        Returns:
+            Iterator[dict]:
+        """
+        return self._iter_items(self.get_orders, 'Orders', **kwargs)
+
+    @sp_endpoint('/orders/v0/orders/{}', rate=1, burst=1)
     def get_order(self, order_id: str, **kwargs) -> ApiResponse:
         """
         get_order(self, order_id: str, **kwargs) -> ApiResponse
@@ -78,7 +93,7 @@ class Orders(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), order_id), params={**kwargs}, add_marketplace=False)
 
-    @sp_endpoint('/orders/v0/orders/{}/orderItems')
+    @sp_endpoint('/orders/v0/orders/{}/orderItems', rate=1, burst=1)
     def get_order_items(self, order_id: str, **kwargs) -> ApiResponse:
         """
         get_order_items(self, order_id: str, **kwargs) -> ApiResponse
@@ -116,7 +131,23 @@ class Orders(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), order_id), params={**kwargs})
 
-    @sp_endpoint('/orders/v0/orders/{}/address')
+    def iter_order_items(self, order_id: str, **kwargs):
+        """
+        iter_order_items(self, order_id: str, **kwargs) -> Iterator[dict]
+
+        Yields the order items of all pages of `get_order_items` one at a time, loading the next page when it's needed.
+        Takes the same arguments as `get_order_items`.
+
+        Args:
+            order_id: str
+            **kwargs:
+
+        Returns:
+            Iterator[dict]:
+        """
+        return self._iter_items(self.get_order_items, 'OrderItems', order_id, **kwargs)
+
+    @sp_endpoint('/orders/v0/orders/{}/address', rate=1, burst=1)
     def get_order_address(self, order_id, **kwargs) -> ApiResponse:
         """
         get_order_address(self, order_id, **kwargs) -> ApiResponse
@@ -143,7 +174,7 @@ class Orders(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), order_id), params={**kwargs})
 
-    @sp_endpoint('/orders/v0/orders/{}/buyerInfo')
+    @sp_endpoint('/orders/v0/orders/{}/buyerInfo', rate=1, burst=1)
     def get_order_buyer_info(self, order_id: str, **kwargs) -> ApiResponse:
         """
         get_order_buyer_info(self, order_id: str, **kwargs) -> ApiResponse
@@ -173,7 +204,7 @@ class Orders(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), order_id), params={**kwargs})
 
-    @sp_endpoint('/orders/v0/orders/{}/orderItems/buyerInfo')
+    @sp_endpoint('/orders/v0/orders/{}/orderItems/buyerInfo', rate=1, burst=1)
     def get_order_items_buyer_info(self, order_id: str, **kwargs) -> ApiResponse:
         """
         get_order_items_buyer_info(self, order_id: str, **kwargs) -> ApiResponse
@@ -7,7 +7,7 @@ class ProductFees(Client):
     :link: https://github.com/amzn/selling-partner-api-docs/tree/main/references/product-fees-api
     """
 
-    @sp_endpoint('/products/fees/v0/listings/{}/feesEstimate', method='POST')
+    @sp_endpoint('/products/fees/v0/listings/{}/feesEstimate', method='POST', rate=1, burst=2)
     def get_product_fees_estimate_for_sku(self, seller_sku, price: float, shipping_price=None, currency='USD',
                                           is_fba=False, points: dict = None, **kwargs) -> ApiResponse:
         """
@@ -31,7 +31,7 @@ class ProductFees(Client):
         kwargs.update(self._create_body(price, shipping_price, currency, is_fba, seller_sku, points))
         return self._request(fill_query_params(kwargs.pop('path'), seller_sku), data=kwargs)
 
-    @sp_endpoint('/products/fees/v0/items/{}/feesEstimate', method='POST')
+    @sp_endpoint('/products/fees/v0/items/{}/feesEstimate', method='POST', rate=1, burst=2)
     def get_product_fees_estimate_for_asin(self, asin, price: float, currency='USD', shipping_price=None, is_fba=False,
                                            points: dict = None,
                                            **kwargs) -> ApiResponse:
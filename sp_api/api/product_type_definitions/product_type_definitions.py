@@ -12,7 +12,7 @@ class ProductTypeDefinitions(Client):
     """
 
 
-    @sp_endpoint('/definitions/2020-09-01/productTypes', method='GET')
+    @sp_endpoint('/definitions/2020-09-01/productTypes', method='GET', rate=5, burst=10)
     def search_definitions_product_types(self, **kwargs) -> ApiResponse:
         """
         search_definitions_product_types(self, **kwargs) -> ApiResponse
@@ -42,7 +42,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(kwargs.pop('path'),  params=kwargs)
     
 
-    @sp_endpoint('/definitions/2020-09-01/productTypes/{}', method='GET')
+    @sp_endpoint('/definitions/2020-09-01/productTypes/{}', method='GET', rate=5, burst=10)
     def get_definitions_product_type(self, productType, **kwargs) -> ApiResponse:
         """
         get_definitions_product_type(self, productType, **kwargs) -> ApiResponse
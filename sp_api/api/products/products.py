@@ -7,7 +7,7 @@ class Products(Client):
     :link: https://github.com/amzn/selling-partner-api-docs/blob/main/references/product-pricing-api/productPricingV0.md
     """
 
-    @sp_endpoint('/products/pricing/v0/price', method='GET')
+    @sp_endpoint('/products/pricing/v0/price', method='GET', rate=1, burst=1)
     def get_product_pricing_for_skus(self, seller_sku_list: [str], item_condition=None, **kwargs) -> ApiResponse:
         """
         get_product_pricing_for_skus(self, seller_sku_list: [str], item_condition: str = None, **kwargs) -> ApiResponse
@@ -35,7 +35,7 @@ class Products(Client):
 
         return self._create_get_pricing_request(seller_sku_list, 'Sku', **kwargs)
 
-    @sp_endpoint('/products/pricing/v0/price', method='GET')
+    @sp_endpoint('/products/pricing/v0/price', method='GET', rate=1, burst=1)
     def get_product_pricing_for_asins(self, asin_list: [str], item_condition=None, **kwargs) -> ApiResponse:
         """
         get_product_pricing_for_asins(self, asin_list: [str], item_condition=None, **kwargs) -> ApiResponse
@@ -62,7 +62,7 @@ class Products(Client):
 
         return self._create_get_pricing_request(asin_list, 'Asin', **kwargs)
 
-    @sp_endpoint('/products/pricing/v0/competitivePrice', method='GET')
+    @sp_endpoint('/products/pricing/v0/competitivePrice', method='GET', rate=1, burst=1)
     def get_competitive_pricing_for_skus(self, seller_sku_list: [str], **kwargs) -> ApiResponse:
         """
         get_competitive_pricing_for_skus(self, seller_sku_list, **kwargs) -> ApiResponse
@@ -83,7 +83,7 @@ class Products(Client):
         """
         return self._create_get_pricing_request(seller_sku_list, 'Sku', **kwargs)
 
-    @sp_endpoint('/products/pricing/v0/competitivePrice', method='GET')
+    @sp_endpoint('/products/pricing/v0/competitivePrice', method='GET', rate=1, burst=1)
     def get_competitive_pricing_for_asins(self, asin_list: [str], **kwargs) -> ApiResponse:
         """
         get_competitive_pricing_for_asins(self, asin_list, **kwargs) -> ApiResponse
@@ -105,7 +105,7 @@ class Products(Client):
         """
         return self._create_get_pricing_request(asin_list, 'Asin', **kwargs)
 
-    @sp_endpoint('/products/pricing/v0/listings/{}/offers', method='GET')
+    @sp_endpoint('/products/pricing/v0/listings/{}/offers', method='GET', rate=1, burst=1)
     def get_listings_offer(self, seller_sku: str, **kwargs) -> ApiResponse:
         """
         get_listings_offer(self, seller_sku: str, **kwargs) -> ApiResponse
@@ -130,7 +130,7 @@ class Products(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), seller_sku), params={**kwargs})       
 
-    @sp_endpoint('/products/pricing/v0/items/{}/offers', method='GET')
+    @sp_endpoint('/products/pricing/v0/items/{}/offers', method='GET', rate=5, burst=10)
     def get_item_offers(self, asin: str, **kwargs) -> ApiResponse:
         """
         get_item_offers(self, asin: str, **kwargs) -> ApiResponse
@@ -1,17 +1,17 @@
 from collections import abc
 from datetime import datetime
-import zlib
-
-import requests
 
 from sp_api.base import sp_endpoint, fill_query_params, SellingApiException, ApiResponse, ProcessingStatus, Marketplaces
 from sp_api.base import Client
-from sp_api.base.helpers import decrypt_aes
+from sp_api.base.helpers import DocumentDecoder
+from sp_api.base.report_columns import write_report_columns, report_column_types
+from sp_api.base.report_headers import ReportRowParser
+from sp_api.base.transport import default_transport
 
 
 class Reports(Client):
 
-    @sp_endpoint('/reports/2020-09-04/reports', method='POST')
+    @sp_endpoint('/reports/2020-09-04/reports', method='POST', rate=0.0167, burst=15)
     def create_report(self, **kwargs) -> ApiResponse:
         """
         create_report(self, **kwargs) -> ApiResponse
@@ -40,7 +40,7 @@ class Reports(Client):
         """
         return self._request(kwargs.pop('path'), data=kwargs)
 
-    @sp_endpoint('/reports/2020-09-04/reports/{}')
+    @sp_endpoint('/reports/2020-09-04/reports/{}', rate=2, burst=15)
     def get_report(self, report_id, **kwargs) -> ApiResponse:
         """
         get_report(self, report_id, **kwargs)
@@ -66,14 +66,20 @@ class Reports(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), report_id), add_marketplace=False)
 
-    @sp_endpoint('/reports/2020-09-04/documents/{}')
-    def get_report_document(self, document_id, decrypt: bool = False, file=None, character_code: str = 'iso-8859-1', ** kwargs) -> ApiResponse:
+    @sp_endpoint('/reports/2020-09-04/documents/{}', rate=0.0167, burst=15)
+    def get_report_document(self, document_id, decrypt: bool = False, file=None, character_code: str = 'iso-8859-1',
+                            stream: bool = False, output: str = None, report_type=None, column_types: dict = None,
+                            **kwargs) -> ApiResponse:
         """
-        get_report_document(self, document_id, decrypt: bool = False, file=None, character_code: str = 'iso-8859-1', ** kwargs) -> ApiResponse
+        get_report_document(self, document_id, decrypt: bool = False, file=None, character_code: str = 'iso-8859-1', stream: bool = False, output: str = None, report_type=None, column_types: dict = None, ** kwargs) -> ApiResponse
         Returns the information required for retrieving a report document's contents. This includes a presigned URL for the report document as well as the information required to decrypt the document's contents.
 
         If decrypt = True the report will automatically be loaded and decrypted/unpacked
         If file is set to a file (or file like object), the report's contents are written to the file
+        If stream = True the report is downloaded, decrypted and unpacked chunk by chunk. With a file, the contents are
+        written to the file as they arrive and not added to the payload, otherwise `document` is a generator of str.
+        If output = 'arrow' or 'parquet' the flat file is streamed into pyarrow's csv reader and written to file batch
+        by batch. Without a file, output='arrow' puts a pyarrow.Table in `document`. Needs `pyarrow`.
 
 
         **Usage Plan:**
@@ -94,33 +100,37 @@ class Reports(Client):
             decrypt: bool | flag to automatically decrypt a report
             file: If passed, will save the document to the file specified. Only valid if decrypt=True
             character_code: If passed, will be a file with the specified character code.  The default is 'iso-8859-1'. Only valid if decrypt=True
+            stream: bool | keep memory constant, regardless of the report's size. Only valid if decrypt=True
+            output: str | 'arrow' or 'parquet', implies decrypt=True
+            report_type: ReportType | selects the declared column types, see sp_api.base.report_columns
+            column_types: dict | column name to pyarrow type alias, overrides the declared types
 
         Returns:
              ApiResponse
         """
         res = self._request(fill_query_params(kwargs.pop('path'), document_id), add_marketplace=False)
-        if decrypt:
-            document = self.decrypt_report_document(
-                    res.payload.get('url'),
-                    res.payload.get('encryptionDetails').get('initializationVector'),
-                    res.payload.get('encryptionDetails').get('key'),
-                    res.payload.get('encryptionDetails').get('standard'),
-                    character_code,
-                    res.payload
-                )
+        if output:
+            table = write_report_columns(self.stream_report_document(res.payload, character_code), output, file,
+                                         report_column_types(report_type, column_types))
+            if table is not None:
+                res.payload.update({
+                    'document': table
+                })
+        elif decrypt:
+            pieces = self.stream_report_document(res.payload, character_code)
+            if stream and file:
+                self._write_document(pieces, file, character_code)
+                return res
+            document = pieces if stream else ''.join(pieces)
             res.payload.update({
                 'document': document
             })
             if file:
-                if isinstance(file, str):
-                    with open(file, "w", encoding=character_code) as text_file:
-                        text_file.write(document)
-                else:
-                    file.write(document)
+                self._write_document(document, file, character_code)
 
         return res
 
-    @sp_endpoint('/reports/2020-09-04/schedules', method='POST')
+    @sp_endpoint('/reports/2020-09-04/schedules', method='POST', rate=0.0222, burst=10)
     def create_report_schedule(self, **kwargs) -> ApiResponse:
         """
         create_report_schedule(self, **kwargs) -> ApiResponse
@@ -141,7 +151,7 @@ class Reports(Client):
         """
         return self._request(kwargs.pop('path'), data=kwargs)
 
-    @sp_endpoint('/reports/2020-09-04/schedules/{}', method='DELETE')
+    @sp_endpoint('/reports/2020-09-04/schedules/{}', method='DELETE', rate=0.0222, burst=10)
     def delete_report_schedule(self, schedule_id, **kwargs) -> ApiResponse:
         """
         delete_report_schedule(self, schedule_id, **kwargs) -> ApiResponse
@@ -166,7 +176,7 @@ class Reports(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), schedule_id), params=kwargs)
 
-    @sp_endpoint('/reports/2020-09-04/schedules/{}')
+    @sp_endpoint('/reports/2020-09-04/schedules/{}', rate=0.0222, burst=10)
     def get_report_schedule(self, schedule_id, **kwargs) -> ApiResponse:
         """
         Returns report schedule details for the report schedule that you specify.
@@ -190,7 +200,7 @@ class Reports(Client):
         """
         return self._request(fill_query_params(kwargs.pop('path'), schedule_id), params=kwargs)
 
-    @sp_endpoint('/reports/2020-09-04/schedules')
+    @sp_endpoint('/reports/2020-09-04/schedules', rate=0.0222, burst=10)
     def get_report_schedules(self, **kwargs) -> ApiResponse:
         """
         Returns report schedule details that match the filters that you specify.
@@ -216,7 +226,7 @@ class Reports(Client):
 
         return self._request(kwargs.pop('path'), params=kwargs)
 
-    @sp_endpoint('/reports/2020-09-04/reports')
+    @sp_endpoint('/reports/2020-09-04/reports', rate=0.0222, burst=10)
     def get_reports(self, **kwargs) -> ApiResponse:
         """
         get_reports(self, **kwargs) -> ApiResponse
@@ -262,16 +272,115 @@ class Reports(Client):
 
         return self._request(kwargs.pop('path'), params=kwargs, add_marketplace=False)
 
+    def iter_reports(self, **kwargs):
+        """
+        iter_reports(self, **kwargs) -> Iterator[dict]
+
+        Yields the reports of all pages of `get_reports` one at a time, loading the next page when it's needed.
+        Takes the same arguments as `get_reports`.
+
+        Args:
+            **kwargs:
+
+        Returns:
+            Iterator[dict]:
+        """
+        return self._iter_items(self.get_reports, 'reports', next_token_param='nextToken', **kwargs)
+
+    def stream_report_document(self, document, character_code: str = 'iso-8859-1', chunk_size: int = 1024 * 1024):
+        """
+        stream_report_document(self, document, character_code: str = 'iso-8859-1', chunk_size: int = 1024 * 1024)
+        Downloads, decrypts and unpacks a report document chunk by chunk
+
+        Args:
+            document: dict | payload of `get_report_document`
+            character_code: str | the document's character code, 'auto' detects it
+            chunk_size: int | size of the downloaded chunks
+
+        Returns:
+            Iterator[str]: the document's contents, piece by piece
+        """
+        decoder = self._document_decoder(document, character_code, self._fallback_encoding())
+        with self.transport.request('GET', document.get('url'), stream=True) as response:
+            for chunk in response.iter_content(chunk_size):
+                yield from decoder.feed(chunk)
+        yield from decoder.close()
+
+    def iter_report_rows(self, document_id, header_enum=None, as_tuple: bool = False, character_code: str = None,
+                         strict: bool = True, chunk_size: int = 1024 * 1024):
+        """
+        iter_report_rows(self, document_id, header_enum=None, as_tuple: bool = False, character_code: str = None, strict: bool = True, chunk_size: int = 1024 * 1024)
+        Streams the rows of a tab separated flat file report, without loading the whole document.
+
+        Examples:
+            for row in Reports().iter_report_rows(document_id, header_enum=MerchantListingsAllData):
+                print(row['seller-sku'])
+
+        Args:
+            document_id: str | the document to load
+            header_enum: ReportHeaders | validates the header, rows hold the enum's columns
+            as_tuple: bool | yield tuples instead of dicts
+            character_code: str | the document's character code, detected if not passed,
+                iso-8859-1 is used if a later part of the report isn't in the detected encoding
+            strict: bool | raise a ValueError if the report has columns `header_enum` doesn't know,
+                otherwise they follow the enum's columns
+            chunk_size: int | size of the downloaded chunks
+
+        Returns:
+            Iterator[dict] or Iterator[tuple]
+        """
+        document = self.get_report_document(document_id).payload
+        parser = ReportRowParser(header_enum, as_tuple, strict=strict)
+        for text in self.stream_report_document(document, character_code or 'auto', chunk_size):
+            yield from parser.feed(text)
+        yield from parser.close()
+
     @staticmethod
     def decrypt_report_document(url, initialization_vector, key, encryption_standard, character_code, payload):
         """
         Decrypts and unpacks a report document, currently AES encryption is implemented
         """
-        if encryption_standard == 'AES':
-            decrypted = decrypt_aes(requests.get(url).content, key, initialization_vector)
-            if 'compressionAlgorithm' in payload:
-                return zlib.decompress(bytearray(decrypted), 15 + 32).decode(character_code)
-            return decrypted.decode(character_code)
-        raise SellingApiException([{
-            'message': 'Only AES decryption is implemented. Contribute: https://github.com/saleweaver/python-sp-api'
-        }])
+        decoder = Reports._document_decoder(dict(payload, encryptionDetails={
+            'standard': encryption_standard, 'initializationVector': initialization_vector, 'key': key
+        }), character_code)
+        with default_transport.request('GET', url, stream=True) as response:
+            return ''.join(decoder.iter(response.iter_content(1024 * 1024)))
+
+    @staticmethod
+    def decrypt_report_content(content, initialization_vector, key, encryption_standard, character_code, payload):
+        """
+        Decrypts and unpacks the already downloaded contents of a report document
+        """
+        decoder = Reports._document_decoder(dict(payload, encryptionDetails={
+            'standard': encryption_standard, 'initializationVector': initialization_vector, 'key': key
+        }), character_code)
+        return ''.join(decoder.iter([content]))
+
+    def _fallback_encoding(self):
+        # flat files of the japanese marketplace are Shift_JIS encoded
+        if self.marketplace_id == Marketplaces.JP.marketplace_id:
+            return 'cp932'
+        return 'iso-8859-1'
+
+    @staticmethod
+    def _document_decoder(document, character_code, fallback_encoding='iso-8859-1'):
+        encryption_details = document.get('encryptionDetails') or {}
+        if encryption_details and encryption_details.get('standard') != 'AES':
+            raise SellingApiException([{
+                'message': 'Only AES decryption is implemented. Contribute: https://github.com/saleweaver/python-sp-api'
+            }], None)
+        return DocumentDecoder(encryption_details.get('key'), encryption_details.get('initializationVector'),
+                               'compressionAlgorithm' in document, character_code,
+                               fallback_encoding=fallback_encoding)
+
+    @staticmethod
+    def _write_document(document, file, character_code):
+        if isinstance(document, str):
+            document = [document]
+        if isinstance(file, str):
+            with open(file, "w", encoding=character_code) as text_file:
+                for piece in document:
+                    text_file.write(piece)
+        else:
+            for piece in document:
+                file.write(piece)
@@ -10,7 +10,7 @@ class Sales(Client):
     :link: https://github.com/amzn/selling-partner-api-docs/blob/main/references/sales-api/sales.md#parameters
     """
 
-    @sp_endpoint('/sales/v1/orderMetrics')
+    @sp_endpoint('/sales/v1/orderMetrics', rate=0.5, burst=15)
     def get_order_metrics(self, interval: tuple, granularity: Granularity, granularityTimeZone: str = None, **kwargs) -> ApiResponse:
         """
         get_order_metrics(self, interval: tuple, granularity: Granularity, granularityTimeZone: str = None, **kwargs) -> ApiResponse
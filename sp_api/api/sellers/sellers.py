@@ -4,6 +4,6 @@ from sp_api.base import Client, Marketplaces, ApiResponse
 
 class Sellers(Client):
 
-    @sp_endpoint('/sellers/v1/marketplaceParticipations')
+    @sp_endpoint('/sellers/v1/marketplaceParticipations', rate=0.016, burst=15)
     def get_marketplace_participation(self, **kwargs) -> ApiResponse:
         return self._request(kwargs.pop('path'))
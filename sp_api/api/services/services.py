@@ -12,7 +12,7 @@ class Services(Client):
     """
 
 
-    @sp_endpoint('/service/v1/serviceJobs/{}', method='GET')
+    @sp_endpoint('/service/v1/serviceJobs/{}', method='GET', rate=20, burst=40)
     def get_service_job_by_service_job_id(self, serviceJobId, **kwargs) -> ApiResponse:
         """
         get_service_job_by_service_job_id(self, serviceJobId, **kwargs) -> ApiResponse
@@ -39,7 +39,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), serviceJobId), params=kwargs)
     
 
-    @sp_endpoint('/service/v1/serviceJobs/{}/cancellations', method='PUT')
+    @sp_endpoint('/service/v1/serviceJobs/{}/cancellations', method='PUT', rate=5, burst=20)
     def cancel_service_job_by_service_job_id(self, serviceJobId, **kwargs) -> ApiResponse:
         """
         cancel_service_job_by_service_job_id(self, serviceJobId, **kwargs) -> ApiResponse
@@ -68,7 +68,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), serviceJobId), data=kwargs)
     
 
-    @sp_endpoint('/service/v1/serviceJobs/{}/completions', method='PUT')
+    @sp_endpoint('/service/v1/serviceJobs/{}/completions', method='PUT', rate=5, burst=20)
     def complete_service_job_by_service_job_id(self, serviceJobId, **kwargs) -> ApiResponse:
         """
         complete_service_job_by_service_job_id(self, serviceJobId, **kwargs) -> ApiResponse
@@ -95,7 +95,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), serviceJobId), data=kwargs)
     
 
-    @sp_endpoint('/service/v1/serviceJobs', method='GET')
+    @sp_endpoint('/service/v1/serviceJobs', method='GET', rate=10, burst=40)
     def get_service_jobs(self, **kwargs) -> ApiResponse:
         """
         get_service_jobs(self, **kwargs) -> ApiResponse
@@ -146,7 +146,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(kwargs.pop('path'),  params=kwargs)
     
 
-    @sp_endpoint('/service/v1/serviceJobs/{}/appointments', method='POST')
+    @sp_endpoint('/service/v1/serviceJobs/{}/appointments', method='POST', rate=5, burst=20)
     def add_appointment_for_service_job_by_service_job_id(self, serviceJobId, **kwargs) -> ApiResponse:
         """
         add_appointment_for_service_job_by_service_job_id(self, serviceJobId, **kwargs) -> ApiResponse
@@ -175,7 +175,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), serviceJobId), data=kwargs)
     
 
-    @sp_endpoint('/service/v1/serviceJobs/{}', method='POST')
+    @sp_endpoint('/service/v1/serviceJobs/{}', method='POST', rate=5, burst=20)
     def reschedule_appointment_for_service_job_by_service_job_id(self, serviceJobId, **kwargs) -> ApiResponse:
         """
         reschedule_appointment_for_service_job_by_service_job_id(self, serviceJobId, **kwargs) -> ApiResponse
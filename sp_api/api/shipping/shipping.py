@@ -12,7 +12,7 @@ class Shipping(Client):
     """
 
 
-    @sp_endpoint('/shipping/v1/shipments', method='POST')
+    @sp_endpoint('/shipping/v1/shipments', method='POST', rate=5, burst=15)
     def create_shipment(self, **kwargs) -> ApiResponse:
         """
         create_shipment(self, **kwargs) -> ApiResponse
@@ -42,7 +42,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(kwargs.pop('path'),  data=kwargs)
     
 
-    @sp_endpoint('/shipping/v1/shipments/{}', method='GET')
+    @sp_endpoint('/shipping/v1/shipments/{}', method='GET', rate=5, burst=15)
     def get_shipment(self, shipmentId, **kwargs) -> ApiResponse:
         """
         get_shipment(self, shipmentId, **kwargs) -> ApiResponse
@@ -69,7 +69,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), shipmentId), params=kwargs)
     
 
-    @sp_endpoint('/shipping/v1/shipments/{}/cancel', method='POST')
+    @sp_endpoint('/shipping/v1/shipments/{}/cancel', method='POST', rate=5, burst=15)
     def cancel_shipment(self, shipmentId, **kwargs) -> ApiResponse:
         """
         cancel_shipment(self, shipmentId, **kwargs) -> ApiResponse
@@ -96,7 +96,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), shipmentId), data=kwargs)
     
 
-    @sp_endpoint('/shipping/v1/shipments/{}/purchaseLabels', method='POST')
+    @sp_endpoint('/shipping/v1/shipments/{}/purchaseLabels', method='POST', rate=5, burst=15)
     def purchase_labels(self, shipmentId, **kwargs) -> ApiResponse:
         """
         purchase_labels(self, shipmentId, **kwargs) -> ApiResponse
@@ -128,7 +128,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), shipmentId), data=kwargs)
     
 
-    @sp_endpoint('/shipping/v1/shipments/{}/label', method='POST')
+    @sp_endpoint('/shipping/v1/shipments/{}/label', method='POST', rate=5, burst=15)
     def retrieve_shipping_label(self, shipmentId, **kwargs) -> ApiResponse:
         """
         retrieve_shipping_label(self, shipmentId, **kwargs) -> ApiResponse
@@ -159,7 +159,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), shipmentId), data=kwargs)
     
 
-    @sp_endpoint('/shipping/v1/purchaseShipment', method='POST')
+    @sp_endpoint('/shipping/v1/purchaseShipment', method='POST', rate=5, burst=15)
     def purchase_shipment(self, **kwargs) -> ApiResponse:
         """
         purchase_shipment(self, **kwargs) -> ApiResponse
@@ -195,7 +195,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(kwargs.pop('path'),  data=kwargs)
     
 
-    @sp_endpoint('/shipping/v1/rates', method='POST')
+    @sp_endpoint('/shipping/v1/rates', method='POST', rate=5, burst=15)
     def get_rates(self, **kwargs) -> ApiResponse:
         """
         get_rates(self, **kwargs) -> ApiResponse
@@ -229,7 +229,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(kwargs.pop('path'),  data=kwargs)
     
 
-    @sp_endpoint('/shipping/v1/account', method='GET')
+    @sp_endpoint('/shipping/v1/account', method='GET', rate=5, burst=15)
     def get_account(self, **kwargs) -> ApiResponse:
         """
         get_account(self, **kwargs) -> ApiResponse
@@ -254,7 +254,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(kwargs.pop('path'),  params=kwargs)
     
 
-    @sp_endpoint('/shipping/v1/tracking/{}', method='GET')
+    @sp_endpoint('/shipping/v1/tracking/{}', method='GET', rate=1, burst=1)
     def get_tracking_information(self, trackingId, **kwargs) -> ApiResponse:
         """
         get_tracking_information(self, trackingId, **kwargs) -> ApiResponse
@@ -280,7 +280,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
     
         return self._request(fill_query_params(kwargs.pop('path'), trackingId), params=kwargs)
 
-    @sp_endpoint('/easyship/v0/timeSlots', method='POST')
+    @sp_endpoint('/easyship/v0/timeSlots', method='POST', rate=1, burst=5)
     def get_time_slots(self, **kwargs) -> ApiResponse:
         """
         Raw request:
@@ -323,7 +323,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         """
         return self._request(fill_query_params(kwargs.pop('path')), data=kwargs)
 
-    @sp_endpoint('/easyship/v0/packages', method='GET')
+    @sp_endpoint('/easyship/v0/packages', method='GET', rate=1, burst=5)
     def get_packages(self, **kwargs) -> ApiResponse:
         """
         Raw response:
@@ -379,7 +379,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         """
         return self._request(fill_query_params(kwargs.pop('path')), params=kwargs)
 
-    @sp_endpoint('/easyship/v0/packages', method='POST')
+    @sp_endpoint('/easyship/v0/packages', method='POST', rate=1, burst=5)
     def create_scheduled_packages(self, **kwargs) -> ApiResponse:
         """
         Raw request:
@@ -468,7 +468,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         """
         return self._request(fill_query_params(kwargs.pop('path')), data=kwargs)
 
-    @sp_endpoint('/easyship/v0/packages', method='PATCH')
+    @sp_endpoint('/easyship/v0/packages', method='PATCH', rate=1, burst=5)
     def update_scheduled_packages(self, **kwargs) -> ApiResponse:
         """
         Raw request:
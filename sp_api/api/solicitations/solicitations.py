@@ -12,7 +12,7 @@ class Solicitations(Client):
     """
 
 
-    @sp_endpoint('/solicitations/v1/orders/{}', method='GET')
+    @sp_endpoint('/solicitations/v1/orders/{}', method='GET', rate=1, burst=5)
     def get_solicitation_actions_for_order(self, amazonOrderId, **kwargs) -> ApiResponse:
         """
         get_solicitation_actions_for_order(self, amazonOrderId, **kwargs) -> ApiResponse
@@ -41,7 +41,7 @@ For more information, see "Usage Plans and Rate Limits" in the Selling Partner A
         return self._request(fill_query_params(kwargs.pop('path'), amazonOrderId), params=kwargs)
     
 
-    @sp_endpoint('/solicitations/v1/orders/{}/solicitations/productReviewAndSellerFeedback', method='POST')
+    @sp_endpoint('/solicitations/v1/orders/{}/solicitations/productReviewAndSellerFeedback', method='POST', rate=1, burst=5)
     def create_product_review_and_seller_feedback_solicitation(self, amazonOrderId, **kwargs) -> ApiResponse:
         """
         create_product_review_and_seller_feedback_solicitation(self, amazonOrderId, **kwargs) -> ApiResponse
@@ -12,7 +12,7 @@ class Tokens(Client):
     """
 
 
-    @sp_endpoint('/tokens/2021-03-01/restrictedDataToken', method='POST')
+    @sp_endpoint('/tokens/2021-03-01/restrictedDataToken', method='POST', rate=1, burst=10)
     def create_restricted_data_token(self, **kwargs) -> ApiResponse:
         """
         create_restricted_data_token(self, **kwargs) -> ApiResponse
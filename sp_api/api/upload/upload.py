@@ -3,7 +3,7 @@ from sp_api.base.helpers import create_md5, fill_query_params
 
 
 class Upload(Client):
-    @sp_endpoint('/uploads/2020-11-01/uploadDestinations/{}', method='POST')
+    @sp_endpoint('/uploads/2020-11-01/uploadDestinations/{}', method='POST', rate=0.1, burst=5)
     def upload_document(self, resource, file, content_type='application/pdf', **kwargs):
         md5 = create_md5(file)
         kwargs.update({
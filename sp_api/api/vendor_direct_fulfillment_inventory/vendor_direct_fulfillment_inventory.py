@@ -12,7 +12,7 @@ class VendorDirectFulfillmentInventory(Client):
     """
 
 
-    @sp_endpoint('/vendor/directFulfillment/inventory/v1/warehouses/{}/items', method='POST')
+    @sp_endpoint('/vendor/directFulfillment/inventory/v1/warehouses/{}/items', method='POST', rate=10, burst=10)
     def submit_inventory_update(self, warehouseId, **kwargs) -> ApiResponse:
         """
         submit_inventory_update(self, warehouseId, **kwargs) -> ApiResponse
@@ -12,7 +12,7 @@ class VendorDirectFulfillmentOrders(Client):
     """
 
 
-    @sp_endpoint('/vendor/directFulfillment/orders/v1/purchaseOrders', method='GET')
+    @sp_endpoint('/vendor/directFulfillment/orders/v1/purchaseOrders', method='GET', rate=10, burst=10)
     def get_orders(self, **kwargs) -> ApiResponse:
         """
         get_orders(self, **kwargs) -> ApiResponse
@@ -52,9 +52,25 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         """
     
         return self._request(kwargs.pop('path'),  params=kwargs)
+
+    def iter_orders(self, **kwargs):
+        """
+        iter_orders(self, **kwargs) -> Iterator[dict]
+
+        Yields the orders of all pages of `get_orders` one at a time, loading the next page when it's needed.
+        Takes the same arguments as `get_orders`.
+
+        Args:
+            **kwargs:
+
+        Returns:
+            Iterator[dict]:
+        """
+        return self._iter_items(self.get_orders, 'orders', next_token_param='nextToken', next_page_kwargs=kwargs,
+                                 **kwargs)
     
 
-    @sp_endpoint('/vendor/directFulfillment/orders/v1/purchaseOrders/{}', method='GET')
+    @sp_endpoint('/vendor/directFulfillment/orders/v1/purchaseOrders/{}', method='GET', rate=10, burst=10)
     def get_order(self, purchaseOrderNumber, **kwargs) -> ApiResponse:
         """
         get_order(self, purchaseOrderNumber, **kwargs) -> ApiResponse
@@ -82,7 +98,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(fill_query_params(kwargs.pop('path'), purchaseOrderNumber), params=kwargs)
     
 
-    @sp_endpoint('/vendor/directFulfillment/orders/v1/acknowledgements', method='POST')
+    @sp_endpoint('/vendor/directFulfillment/orders/v1/acknowledgements', method='POST', rate=10, burst=10)
     def submit_acknowledgement(self, **kwargs) -> ApiResponse:
         """
         submit_acknowledgement(self, **kwargs) -> ApiResponse
@@ -12,7 +12,7 @@ class VendorDirectFulfillmentPayments(Client):
     """
 
 
-    @sp_endpoint('/vendor/directFulfillment/payments/v1/invoices', method='POST')
+    @sp_endpoint('/vendor/directFulfillment/payments/v1/invoices', method='POST', rate=10, burst=10)
     def submit_invoice(self, **kwargs) -> ApiResponse:
         """
         submit_invoice(self, **kwargs) -> ApiResponse
@@ -12,7 +12,7 @@ class VendorDirectFulfillmentShipping(Client):
     """
 
 
-    @sp_endpoint('/vendor/directFulfillment/shipping/v1/shippingLabels', method='GET')
+    @sp_endpoint('/vendor/directFulfillment/shipping/v1/shippingLabels', method='GET', rate=10, burst=10)
     def get_shipping_labels(self, **kwargs) -> ApiResponse:
         """
         get_shipping_labels(self, **kwargs) -> ApiResponse
@@ -50,7 +50,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(kwargs.pop('path'),  params=kwargs)
     
 
-    @sp_endpoint('/vendor/directFulfillment/shipping/v1/shippingLabels', method='POST')
+    @sp_endpoint('/vendor/directFulfillment/shipping/v1/shippingLabels', method='POST', rate=10, burst=10)
     def submit_shipping_label_request(self, **kwargs) -> ApiResponse:
         """
         submit_shipping_label_request(self, **kwargs) -> ApiResponse
@@ -78,7 +78,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(kwargs.pop('path'),  data=kwargs, add_marketplace=False)
     
 
-    @sp_endpoint('/vendor/directFulfillment/shipping/v1/shippingLabels/{}', method='GET')
+    @sp_endpoint('/vendor/directFulfillment/shipping/v1/shippingLabels/{}', method='GET', rate=10, burst=10)
     def get_shipping_label(self, purchaseOrderNumber, **kwargs) -> ApiResponse:
         """
         get_shipping_label(self, purchaseOrderNumber, **kwargs) -> ApiResponse
@@ -106,7 +106,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(fill_query_params(kwargs.pop('path'), purchaseOrderNumber), params=kwargs)
     
 
-    @sp_endpoint('/vendor/directFulfillment/shipping/v1/shipmentConfirmations', method='POST')
+    @sp_endpoint('/vendor/directFulfillment/shipping/v1/shipmentConfirmations', method='POST', rate=10, burst=10)
     def submit_shipment_confirmations(self, **kwargs) -> ApiResponse:
         """
         submit_shipment_confirmations(self, **kwargs) -> ApiResponse
@@ -134,7 +134,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(kwargs.pop('path'),  data=kwargs, add_marketplace=False)
     
 
-    @sp_endpoint('/vendor/directFulfillment/shipping/v1/shipmentStatusUpdates', method='POST')
+    @sp_endpoint('/vendor/directFulfillment/shipping/v1/shipmentStatusUpdates', method='POST', rate=10, burst=10)
     def submit_shipment_status_updates(self, **kwargs) -> ApiResponse:
         """
         submit_shipment_status_updates(self, **kwargs) -> ApiResponse
@@ -162,7 +162,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(kwargs.pop('path'),  data=kwargs)
     
 
-    @sp_endpoint('/vendor/directFulfillment/shipping/v1/customerInvoices', method='GET')
+    @sp_endpoint('/vendor/directFulfillment/shipping/v1/customerInvoices', method='GET', rate=10, burst=10)
     def get_customer_invoices(self, **kwargs) -> ApiResponse:
         """
         get_customer_invoices(self, **kwargs) -> ApiResponse
@@ -200,7 +200,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(kwargs.pop('path'),  params=kwargs)
     
 
-    @sp_endpoint('/vendor/directFulfillment/shipping/v1/customerInvoices/{}', method='GET')
+    @sp_endpoint('/vendor/directFulfillment/shipping/v1/customerInvoices/{}', method='GET', rate=10, burst=10)
     def get_customer_invoice(self, purchaseOrderNumber, **kwargs) -> ApiResponse:
         """
         get_customer_invoice(self, purchaseOrderNumber, **kwargs) -> ApiResponse
@@ -228,7 +228,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(fill_query_params(kwargs.pop('path'), purchaseOrderNumber), params=kwargs)
     
 
-    @sp_endpoint('/vendor/directFulfillment/shipping/v1/packingSlips', method='GET')
+    @sp_endpoint('/vendor/directFulfillment/shipping/v1/packingSlips', method='GET', rate=10, burst=10)
     def get_packing_slips(self, **kwargs) -> ApiResponse:
         """
         get_packing_slips(self, **kwargs) -> ApiResponse
@@ -266,7 +266,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(kwargs.pop('path'),  params=kwargs)
     
 
-    @sp_endpoint('/vendor/directFulfillment/shipping/v1/packingSlips/{}', method='GET')
+    @sp_endpoint('/vendor/directFulfillment/shipping/v1/packingSlips/{}', method='GET', rate=10, burst=10)
     def get_packing_slip(self, purchaseOrderNumber, **kwargs) -> ApiResponse:
         """
         get_packing_slip(self, purchaseOrderNumber, **kwargs) -> ApiResponse
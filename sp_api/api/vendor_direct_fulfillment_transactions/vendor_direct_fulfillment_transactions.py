@@ -12,7 +12,7 @@ class VendorDirectFulfillmentTransactions(Client):
     """
 
 
-    @sp_endpoint('/vendor/directFulfillment/transactions/v1/transactions/{}', method='GET')
+    @sp_endpoint('/vendor/directFulfillment/transactions/v1/transactions/{}', method='GET', rate=10, burst=10)
     def get_transaction_status(self, transactionId, **kwargs) -> ApiResponse:
         """
         get_transaction_status(self, transactionId, **kwargs) -> ApiResponse
@@ -12,7 +12,7 @@ class VendorInvoices(Client):
     """
 
 
-    @sp_endpoint('/vendor/payments/v1/invoices', method='POST')
+    @sp_endpoint('/vendor/payments/v1/invoices', method='POST', rate=10, burst=10)
     def submit_invoices(self, **kwargs) -> ApiResponse:
         """
         submit_invoices(self, **kwargs) -> ApiResponse
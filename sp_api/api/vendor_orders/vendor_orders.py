@@ -12,7 +12,7 @@ class VendorOrders(Client):
     """
 
 
-    @sp_endpoint('/vendor/orders/v1/purchaseOrders', method='GET')
+    @sp_endpoint('/vendor/orders/v1/purchaseOrders', method='GET', rate=10, burst=10)
     def get_purchase_orders(self, **kwargs) -> ApiResponse:
         """
         get_purchase_orders(self, **kwargs) -> ApiResponse
@@ -60,9 +60,25 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         """
     
         return self._request(kwargs.pop('path'),  params=kwargs)
+
+    def iter_purchase_orders(self, **kwargs):
+        """
+        iter_purchase_orders(self, **kwargs) -> Iterator[dict]
+
+        Yields the purchase orders of all pages of `get_purchase_orders` one at a time, loading the next page when it's needed.
+        Takes the same arguments as `get_purchase_orders`.
+
+        Args:
+            **kwargs:
+
+        Returns:
+            Iterator[dict]:
+        """
+        return self._iter_items(self.get_purchase_orders, 'orders', next_token_param='nextToken',
+                                 next_page_kwargs=kwargs, **kwargs)
     
 
-    @sp_endpoint('/vendor/orders/v1/purchaseOrders/{}', method='GET')
+    @sp_endpoint('/vendor/orders/v1/purchaseOrders/{}', method='GET', rate=10, burst=10)
     def get_purchase_order(self, purchaseOrderNumber, **kwargs) -> ApiResponse:
         """
         get_purchase_order(self, purchaseOrderNumber, **kwargs) -> ApiResponse
@@ -90,7 +106,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(fill_query_params(kwargs.pop('path'), purchaseOrderNumber), params=kwargs)
     
 
-    @sp_endpoint('/vendor/orders/v1/acknowledgements', method='POST')
+    @sp_endpoint('/vendor/orders/v1/acknowledgements', method='POST', rate=10, burst=10)
     def submit_acknowledgement(self, **kwargs) -> ApiResponse:
         """
         submit_acknowledgement(self, **kwargs) -> ApiResponse
@@ -118,7 +134,7 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         return self._request(kwargs.pop('path'),  data=kwargs)
     
 
-    @sp_endpoint('/vendor/orders/v1/purchaseOrdersStatus', method='GET')
+    @sp_endpoint('/vendor/orders/v1/purchaseOrdersStatus', method='GET', rate=10, burst=10)
     def get_purchase_orders_status(self, **kwargs) -> ApiResponse:
         """
         get_purchase_orders_status(self, **kwargs) -> ApiResponse
@@ -166,4 +182,20 @@ The x-amzn-RateLimit-Limit response header returns the usage plan rate limits th
         """
     
         return self._request(kwargs.pop('path'),  params=kwargs)
+
+    def iter_purchase_orders_status(self, **kwargs):
+        """
+        iter_purchase_orders_status(self, **kwargs) -> Iterator[dict]
+
+        Yields the purchase order statuses of all pages of `get_purchase_orders_status` one at a time, loading the next page when it's needed.
+        Takes the same arguments as `get_purchase_orders_status`.
+
+        Args:
+            **kwargs:
+
+        Returns:
+            Iterator[dict]:
+        """
+        return self._iter_items(self.get_purchase_orders_status, 'ordersStatus', next_token_param='nextToken',
+                                 next_page_kwargs=kwargs, **kwargs)
     
@@ -12,7 +12,7 @@ class VendorShipments(Client):
     """
 
 
-    @sp_endpoint('/vendor/shipping/v1/shipmentConfirmations', method='POST')
+    @sp_endpoint('/vendor/shipping/v1/shipmentConfirmations', method='POST', rate=10, burst=10)
     def submit_shipment_confirmations(self, **kwargs) -> ApiResponse:
         """
         submit_shipment_confirmations(self, **kwargs) -> ApiResponse
@@ -12,7 +12,7 @@ class VendorTransactionStatus(Client):
     """
 
 
-    @sp_endpoint('/vendor/transactions/v1/transactions/{}', method='GET')
+    @sp_endpoint('/vendor/transactions/v1/transactions/{}', method='GET', rate=10, burst=10)
     def get_transaction(self, transactionId, **kwargs) -> ApiResponse:
         """
         get_transaction(self, transactionId, **kwargs) -> ApiResponse
@@ -1,9 +1,17 @@
 from .access_token_client import AccessTokenClient
 from .access_token_response import AccessTokenResponse
 from .credentials import Credentials
+from .token_cache import TokenCache
+from .token_store import MemoryTokenStore, FileTokenStore, SQLiteTokenStore, RedisTokenStore, set_token_store
 
 __all__ = [
     'AccessTokenResponse',
     'AccessTokenClient',
     'Credentials',
+    'TokenCache',
+    'MemoryTokenStore',
+    'FileTokenStore',
+    'SQLiteTokenStore',
+    'RedisTokenStore',
+    'set_token_store',
 ]
@@ -1,20 +1,19 @@
 import json
 import os
 
-import requests
-from botocore.exceptions import ClientError
 import hashlib
 import logging
-from cachetools import TTLCache
-import boto3
 from sp_api.base import BaseClient
+from sp_api.base.transport import default_transport
 
 from .credentials import Credentials
 from .access_token_response import AccessTokenResponse
 from .exceptions import AuthorizationError
+from .token_cache import TokenCache
 
-cache = TTLCache(maxsize=10, ttl=3600)
-grantless_cache = TTLCache(maxsize=10, ttl=3600)
+# access tokens shared by all clients of the process, keyed by refresh token, and grantless tokens by scope
+token_cache = TokenCache()
+grantless_token_cache = TokenCache()
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +22,15 @@ class AccessTokenClient(BaseClient):
     host = 'api.amazon.com'
     grant_type = 'refresh_token'
     path = '/auth/o2/token'
+    token_cache: TokenCache = token_cache
+    grantless_token_cache: TokenCache = grantless_token_cache
 
     def __init__(self, refresh_token=None, account='default', credentials=None):
         super().__init__(account, credentials)
         self.cred = Credentials(refresh_token, self.credentials)
 
     def _request(self, url, data, headers):
-        response = requests.post(url, data=data, headers=headers)
+        response = default_transport.request('POST', url, data=data, headers=headers)
         response_data = response.json()
         if response.status_code != 200:
             error_message = response_data.get('error_description')
@@ -39,29 +40,21 @@ class AccessTokenClient(BaseClient):
 
     def get_auth(self) -> AccessTokenResponse:
         """
-        Get's the access token
+        Get's the access token, from the token cache if it's still valid
         :return:AccessTokenResponse
         """
-        global cache
+        return AccessTokenResponse(**self.token_cache.get(self._get_cache_key(), self._fetch_access_token))
 
-        cache_key = self._get_cache_key()
-        try:
-            access_token = cache[cache_key]
-        except KeyError:
-            cache_ttl = 3600
-            access_token = None
+    def _fetch_access_token(self):
+        access_token = None
+        if self.use_secrets():
+            access_token = self.get_secret()
+        if not access_token:
+            request_url = self.scheme + self.host + self.path
+            access_token = self._request(request_url, self.data, self.headers)
             if self.use_secrets():
-                access_token = self.get_secret()
-            if not access_token:
-                request_url = self.scheme + self.host + self.path
-                access_token = self._request(request_url, self.data, self.headers)
-                if self.use_secrets():
-                    self.put_access_token(access_token)
-            else:
-                cache_ttl = access_token.get('expires_in')
-            cache = TTLCache(maxsize=10, ttl=cache_ttl - 15)
-            cache[cache_key] = access_token
-        return AccessTokenResponse(**access_token)
+                self.put_access_token(access_token)
+        return access_token
 
     def use_secrets(self):
         return os.environ.get('SP_API_AWS_SECRET_ID') and os.environ.get('SP_API_USE_SECRET_ACCESS_TOKEN_ROTATION')
@@ -81,23 +74,19 @@ class AccessTokenClient(BaseClient):
         &client_secret=Y76SDl2F
         :return: AccessTokenResponse
         """
-        global grantless_cache
-        cache_key = self._get_cache_key(scope)
-        try:
-            access_token = grantless_cache[cache_key]
-            logger.debug('from_cache. scope: %s', scope)
-        except KeyError:
-            request_url = self.scheme + self.host + self.path
-            access_token = self._request(
-                request_url,
-                data=self.grantless_data(scope),
-                headers=self.headers
-            )
-            logger.debug('token_refreshed')
-            grantless_cache.clear()
-            grantless_cache[cache_key] = access_token
+        return AccessTokenResponse(**self.grantless_token_cache.get(
+            self._get_cache_key(scope), lambda: self._fetch_grantless_token(scope)
+        ))
 
-        return AccessTokenResponse(**access_token)
+    def _fetch_grantless_token(self, scope):
+        request_url = self.scheme + self.host + self.path
+        access_token = self._request(
+            request_url,
+            data=self.grantless_data(scope),
+            headers=self.headers
+        )
+        logger.debug('token_refreshed. scope: %s', scope)
+        return access_token
 
     def authorize_auth_code(self, auth_code):
         request_url = self.scheme + self.host + self.path
@@ -146,7 +135,8 @@ class AccessTokenClient(BaseClient):
         ).hexdigest()
 
     def get_secret(self):
-
+        import boto3
+        from botocore.exceptions import ClientError
         try:
             client = boto3.client('secretsmanager')
             response = client.get_secret_value(
@@ -162,6 +152,8 @@ class AccessTokenClient(BaseClient):
                 return
 
     def put_access_token(self, access_token):
+        import boto3
+        from botocore.exceptions import ClientError
         try:
             client = boto3.client('secretsmanager')
             response = client.get_secret_value(
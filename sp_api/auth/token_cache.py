@@ -0,0 +1,209 @@
+import logging
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+# a cached token and the time (seconds since the epoch) it expires at
+CacheEntry = namedtuple('CacheEntry', ['token', 'expires_at'])
+
+
+class TokenCache:
+    """
+    Thread safe cache of access tokens, one entry per key, e.g. per refresh token.
+
+    Every entry expires `expires_in` seconds after its token was fetched. A token that expires within
+    `refresh_margin` seconds is still returned, while a new one is fetched in the background.
+    Concurrent misses of the same key are collapsed into a single fetch, the other callers wait for its result.
+    With a `store`, see `sp_api.auth.token_store`, tokens are looked up there before they're fetched,
+    and fetched tokens are written to it, so processes sharing the store share their tokens.
+
+    Args:
+        refresh_margin: float | seconds before expiry a token is refreshed in the background
+        expiry_margin: float | seconds before expiry a token isn't used anymore
+        default_expires_in: float | lifetime of tokens without `expires_in`
+        store: a token store shared with other processes, or None
+    """
+
+    def __init__(self, refresh_margin=300, expiry_margin=15, default_expires_in=3600, store=None):
+        self.refresh_margin = refresh_margin
+        self.expiry_margin = expiry_margin
+        self.default_expires_in = default_expires_in
+        self.store = store
+        self._entries = {}
+        self._inflight = {}
+        self._tasks = set()
+        self._lock = threading.Lock()
+
+    def put(self, key, token: dict, expires_in=None):
+        """
+        Caches `token`, expiring after `expires_in` seconds or the token's `expires_in`
+        """
+        entry = self._entry(token, expires_in)
+        self._put(key, entry)
+        self._store_put(key, entry)
+
+    def _entry(self, token, expires_in=None):
+        if expires_in is None:
+            expires_in = token.get('expires_in') or self.default_expires_in
+        return CacheEntry(token, time.time() + expires_in)
+
+    def _put(self, key, entry):
+        now = time.time()
+        with self._lock:
+            # drops expired entries, so tokens of idle accounts don't pile up
+            for stale in [k for k, cached in self._entries.items() if cached.expires_at <= now]:
+                del self._entries[stale]
+            self._entries[key] = entry
+
+    def _store_get(self, key):
+        if self.store is None:
+            return None
+        try:
+            entry = self.store.get(key)
+        except Exception as e:
+            logger.warning('Reading the token store failed: %s', e)
+            return None
+        # a token about to expire is fetched again
+        return entry if entry is not None and time.time() < entry.expires_at - self.refresh_margin else None
+
+    def _store_put(self, key, entry):
+        if self.store is None:
+            return
+        try:
+            self.store.put(key, entry)
+        except Exception as e:
+            logger.warning('Writing the token store failed: %s', e)
+
+    def peek(self, key):
+        """
+        Returns the cached, usable token of `key`, or None
+        """
+        entry = self._entries.get(key)
+        if entry is not None and time.time() < entry.expires_at - self.expiry_margin:
+            return entry.token
+        return None
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.store is not None:
+            self.store.delete(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, key):
+        """
+        Returns (token, future, owner):
+        a usable token, and the future of its background refresh if the caller has to start it,
+        or no token and the future of the fetch, `owner` tells if the caller has to run it.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now < entry.expires_at - self.expiry_margin:
+                if now < entry.expires_at - self.refresh_margin or key in self._inflight:
+                    return entry.token, None, False
+                future = self._inflight[key] = Future()
+                return entry.token, future, True
+            if key in self._inflight:
+                return None, self._inflight[key], False
+            future = self._inflight[key] = Future()
+            return None, future, True
+
+    def _done(self, key, future, entry=None, exception=None):
+        if exception is None:
+            self._put(key, entry)
+        with self._lock:
+            self._inflight.pop(key, None)
+        if exception is None:
+            future.set_result(entry.token)
+        else:
+            future.set_exception(exception)
+
+    def _load(self, key, fetch):
+        entry = self._store_get(key)
+        if entry is None:
+            entry = self._entry(fetch())
+            self._store_put(key, entry)
+        return entry
+
+    def _fetch(self, key, fetch, future):
+        try:
+            entry = self._load(key, fetch)
+        except BaseException as e:
+            self._done(key, future, exception=e)
+        else:
+            self._done(key, future, entry)
+
+    def _refresh(self, key, fetch, future):
+        self._fetch(key, fetch, future)
+        if future.exception() is not None:
+            logger.warning('Refreshing the access token in the background failed: %s', future.exception())
+
+    def get(self, key, fetch) -> dict:
+        """
+        Returns the token of `key`, calling `fetch()` to get a new one if needed
+
+        Args:
+            key: the cache key
+            fetch: callable | returns a new token, a dict with `expires_in`
+
+        Returns:
+            dict: the token
+        """
+        token, future, owner = self._lookup(key)
+        if token is not None:
+            if owner:
+                threading.Thread(target=self._refresh, args=(key, fetch, future), daemon=True,
+                                 name='sp_api-token-refresh').start()
+            return token
+        if owner:
+            self._fetch(key, fetch, future)
+        return future.result()
+
+    async def _load_async(self, key, fetch):
+        import asyncio
+        # stores may block, e.g. on a lock or the network
+        loop = asyncio.get_running_loop()
+        entry = await loop.run_in_executor(None, self._store_get, key) if self.store is not None else None
+        if entry is None:
+            entry = self._entry(await fetch())
+            if self.store is not None:
+                await loop.run_in_executor(None, self._store_put, key, entry)
+        return entry
+
+    async def _fetch_async(self, key, fetch, future):
+        try:
+            entry = await self._load_async(key, fetch)
+        except BaseException as e:
+            self._done(key, future, exception=e)
+        else:
+            self._done(key, future, entry)
+
+    async def _refresh_async(self, key, fetch, future):
+        await self._fetch_async(key, fetch, future)
+        if future.exception() is not None:
+            logger.warning('Refreshing the access token in the background failed: %s', future.exception())
+
+    async def get_async(self, key, fetch) -> dict:
+        """
+        asyncio counterpart of `get`, `fetch()` returns an awaitable
+        """
+        # imported here, sync clients don't need asyncio
+        import asyncio
+        token, future, owner = self._lookup(key)
+        if token is not None:
+            if owner:
+                # a reference to the task is kept until it's done
+                task = asyncio.ensure_future(self._refresh_async(key, fetch, future))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return token
+        if owner:
+            await self._fetch_async(key, fetch, future)
+        return await asyncio.wrap_future(future)
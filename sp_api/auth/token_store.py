@@ -0,0 +1,207 @@
+"""
+Persistent stores for access tokens and role credentials.
+
+A store keeps one `CacheEntry(token, expires_at)` per key, the token being a json serializable dict and
+`expires_at` seconds since the epoch. Stores return None for missing and expired entries.
+Attach a store to the token caches with `set_token_store`, all processes using the same store share
+their access tokens and role credentials instead of requesting their own.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from .token_cache import CacheEntry
+
+
+def _dumps(entry: CacheEntry) -> str:
+    return json.dumps({'token': entry.token, 'expires_at': entry.expires_at})
+
+
+def _loads(content):
+    if not content:
+        return None
+    value = json.loads(content)
+    entry = CacheEntry(value['token'], value['expires_at'])
+    return entry if entry.expires_at > time.time() else None
+
+
+class MemoryTokenStore:
+    """
+    Keeps the entries in memory, shared by all threads of a process
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        return entry if entry is not None and entry.expires_at > time.time() else None
+
+    def put(self, key, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class FileTokenStore:
+    """
+    Keeps one file per entry, locked with `fcntl.flock`, shared by all processes on a host.
+
+    Files are only readable by their owner. Available on POSIX systems.
+
+    Args:
+        directory: str | directory holding the entries
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.md5(key.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, key):
+        import fcntl
+        try:
+            with open(self._path(key), 'r') as f:
+                fcntl.flock(f, fcntl.LOCK_SH)
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            return _loads(content)
+        except (ValueError, KeyError):
+            return None
+
+    def put(self, key, entry: CacheEntry):
+        import fcntl
+        with open(os.open(self._path(key), os.O_RDWR | os.O_CREAT, 0o600), 'r+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.truncate()
+            f.write(_dumps(entry))
+            f.flush()
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.directory, name))
+
+
+class SQLiteTokenStore:
+    """
+    Keeps the entries in a SQLite database, shared by all processes on a host.
+
+    The database and its journal are only readable by their owner.
+
+    Args:
+        path: str | path of the database file
+        timeout: float | seconds to wait for a lock held by another process
+    """
+
+    def __init__(self, path, timeout=10):
+        self.path = path
+        self._lock = threading.Lock()
+        # sqlite creates the journal with the permissions of the database
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        for name in (path, path + '-journal', path + '-wal', path + '-shm'):
+            if os.path.exists(name):
+                os.chmod(name, 0o600)
+        self._connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, token TEXT, expires_at REAL)'
+            )
+
+    def get(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT token, expires_at FROM tokens WHERE key = ? AND expires_at > ?', (key, time.time())
+            ).fetchone()
+        return CacheEntry(json.loads(row[0]), row[1]) if row is not None else None
+
+    def put(self, key, entry: CacheEntry):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM tokens WHERE expires_at <= ?', (time.time(),))
+            self._connection.execute(
+                'INSERT OR REPLACE INTO tokens (key, token, expires_at) VALUES (?, ?, ?)',
+                (key, json.dumps(entry.token), entry.expires_at)
+            )
+
+    def delete(self, key):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM tokens WHERE key = ?', (key,))
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM tokens')
+
+    def close(self):
+        self._connection.close()
+
+
+class RedisTokenStore:
+    """
+    Keeps the entries in redis, or any server speaking the redis protocol, shared by all hosts.
+
+    Entries expire with their tokens.
+
+    Args:
+        redis: a `redis.Redis` compatible client
+        prefix: str | prefix of the keys
+    """
+
+    def __init__(self, redis, prefix='sp_api:token:'):
+        self.redis = redis
+        self.prefix = prefix
+
+    def get(self, key):
+        try:
+            return _loads(self.redis.get(self.prefix + key))
+        except (ValueError, KeyError):
+            return None
+
+    def put(self, key, entry: CacheEntry):
+        ttl = int(entry.expires_at - time.time())
+        if ttl > 0:
+            self.redis.set(self.prefix + key, _dumps(entry), ex=ttl)
+
+    def delete(self, key):
+        self.redis.delete(self.prefix + key)
+
+    def clear(self):
+        for name in self.redis.scan_iter(match=self.prefix + '*'):
+            self.redis.delete(name)
+
+
+def set_token_store(store):
+    """
+    Keeps the access tokens, grantless tokens and role credentials of all clients in `store`, or only in memory
+    if `store` is None.
+
+    Examples:
+        set_token_store(FileTokenStore('/var/run/sp-api-tokens'))
+
+    Args:
+        store: FileTokenStore, SQLiteTokenStore, RedisTokenStore or None
+    """
+    from .access_token_client import AccessTokenClient
+    from sp_api.base.client import Client
+    for cache in (AccessTokenClient.token_cache, AccessTokenClient.grantless_token_cache, Client.role_cache):
+        cache.store = store
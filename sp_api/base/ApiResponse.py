@@ -19,7 +19,8 @@ class ApiResponse:
         if nextToken:
             return nextToken
         try:
-            return self.payload.get('NextToken', None)
+            pagination = self.pagination or self.payload.get('pagination') or {}
+            return self.payload.get('NextToken') or self.payload.get('nextToken') or pagination.get('nextToken')
         except AttributeError:
             return None
 
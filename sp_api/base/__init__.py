@@ -1,6 +1,9 @@
 from .aws_sig_v4 import AWSSigV4
 from .base_client import BaseClient
 from .client import Client
+from .transport import Transport
+from .rate_limiter import RateLimiter, AdaptiveRateLimiter, UsagePlan
+from .rate_limit_storage import MemoryStorage, FileStorage, RedisStorage
 from .helpers import fill_query_params, sp_endpoint, decrypt_aes, encrypt_aes, create_md5
 from .marketplaces import Marketplaces
 from .exceptions import SellingApiException
@@ -20,7 +23,6 @@ from .credential_provider import CredentialProvider, MissingCredentials
 from .ApiResponse import ApiResponse
 from .processing_status import ProcessingStatus
 from .reportTypes import ReportType
-from sp_api.auth import AccessTokenClient
 
 __all__ = [
     'AccessTokenClient',
@@ -28,6 +30,13 @@ __all__ = [
     'ProcessingStatus',
     'ApiResponse',
     'Client',
+    'Transport',
+    'RateLimiter',
+    'AdaptiveRateLimiter',
+    'MemoryStorage',
+    'FileStorage',
+    'RedisStorage',
+    'UsagePlan',
     'BaseClient',
     'AWSSigV4',
     'Marketplaces',
@@ -53,3 +62,11 @@ __all__ = [
     'CredentialProvider',
     'MissingCredentials'
 ]
+
+
+def __getattr__(name):
+    # sp_api.auth imports this package, its client is imported on first access
+    if name == 'AccessTokenClient':
+        from sp_api.auth import AccessTokenClient
+        return AccessTokenClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
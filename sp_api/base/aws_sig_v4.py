@@ -1,25 +1,76 @@
 from __future__ import print_function
-import os
 import datetime
+import functools
 import hashlib
 import hmac
 import logging
 import urllib.parse
-from collections import OrderedDict
-from requests.auth import AuthBase
-from requests.compat import urlencode, quote, urlparse
 
 __version__ = '0.4'
 
 log = logging.getLogger(__name__)
 
+# hash of an empty payload, signed for GET requests and requests without body
+EMPTY_PAYLOAD_HASH = hashlib.sha256(b'').hexdigest()
+
 
 def sign_msg(key, msg):
     ''' Sign message using key '''
     return hmac.new(key, msg.encode('utf-8'), hashlib.sha256).digest()
 
 
-class AWSSigV4(AuthBase):
+@functools.lru_cache(maxsize=128)
+def signing_key(secret_key, datestamp, region, service) -> bytes:
+    """
+    Derives the signing key of a day, region and service.
+
+    The key only changes once a day, it's cached instead of running the four HMAC derivations on every request.
+    """
+    k_date = sign_msg(('AWS4' + secret_key).encode('utf-8'), datestamp)
+    k_region = sign_msg(k_date, region)
+    k_service = sign_msg(k_region, service)
+    return sign_msg(k_service, 'aws4_request')
+
+
+def _quote(value):
+    # RFC 3986: everything but unreserved characters is percent encoded, spaces included
+    return urllib.parse.quote(value if isinstance(value, (str, bytes)) else str(value), safe='-_.~')
+
+
+def canonical_query(params) -> str:
+    """
+    Builds the canonical query string of `params` as defined by Signature Version 4.
+
+    Names and values are RFC 3986 encoded and sorted, list values are repeated keys and None values are left out.
+    Send this string as the request's query, so the signed bytes are the bytes on the wire.
+
+    Args:
+        params: dict or list of (name, value) pairs, not encoded
+
+    Returns:
+        str
+    """
+    pairs = []
+    for name, value in (params.items() if isinstance(params, dict) else params):
+        if value is None:
+            continue
+        name = _quote(name)
+        if isinstance(value, (list, tuple)):
+            pairs.extend((name, _quote(v)) for v in value if v is not None)
+        else:
+            pairs.append((name, _quote(value)))
+    pairs.sort()
+    return '&'.join(['%s=%s' % pair for pair in pairs])
+
+
+def _utcnow():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+class AWSSigV4:
+    """
+    Signs requests with AWS Signature Version 4, usable as `auth` of a `requests` request
+    """
 
     def __init__(self, service, **kwargs):
         self.service = service
@@ -31,60 +82,74 @@ class AWSSigV4(AuthBase):
         self.region = kwargs.get('region')
 
     def __call__(self, r):
-        t = datetime.datetime.utcnow()
-        self.amzdate = t.strftime('%Y%m%dT%H%M%SZ')
-        self.datestamp = t.strftime('%Y%m%d')
-        log.debug("Starting authentication with amzdate=%s", self.amzdate)
-        p = urlparse(r.url)
-
-        host = p.hostname
-        uri = urllib.parse.quote(p.path)
+        r.headers.update(self.get_auth_headers(r.method, r.url, r.body))
+        return r
 
-        # sort query parameters alphabetically
-        if len(p.query) > 0:
-            split_query_parameters = list(map(lambda param: param.split('='), p.query.split('&')))
-            ordered_query_parameters = sorted(split_query_parameters, key=lambda param: (param[0], param[1]))
-        else:
-            ordered_query_parameters = list()
+    def get_auth_headers(self, method, url, body=None):
+        """
+        Returns the headers needed to sign a request to `url`
+        """
+        p = urllib.parse.urlsplit(url)
+        query = canonical_query(urllib.parse.parse_qsl(p.query, keep_blank_values=True)) if p.query else ''
+        return self.get_request_auth_headers(method, p.hostname, p.path, query, body)
+
+    def get_request_auth_headers(self, method, host, path, query='', body=None):
+        """
+        Returns the headers needed to sign a request, from its parts
+
+        Args:
+            method: str
+            host: str
+            path: str | the request's path as sent, URI encoded, see `fill_query_params`
+            query: str | the query as sent, built with `canonical_query`
+            body: str or bytes
+        """
+        self.amzdate = _utcnow().strftime('%Y%m%dT%H%M%SZ')
+        self.datestamp = self.amzdate[:8]
+        log.debug("Starting authentication with amzdate=%s", self.amzdate)
 
-        canonical_querystring = "&".join(map(lambda param: "=".join(param), ordered_query_parameters))
+        # all services but S3 sign the sent path encoded a second time
+        uri = urllib.parse.quote(path)
 
-        headers_to_sign = {'host': host, 'x-amz-date': self.amzdate}
+        # the signed headers are in alphabetical order already
         if self.aws_session_token is not None:
-            headers_to_sign['x-amz-security-token'] = self.aws_session_token
-
-        ordered_headers = OrderedDict(sorted(headers_to_sign.items(), key=lambda t: t[0]))
-        canonical_headers = ''.join(map(lambda h: ":".join(h) + '\n', ordered_headers.items()))
-        signed_headers = ';'.join(ordered_headers.keys())
+            canonical_headers = 'host:%s\nx-amz-date:%s\nx-amz-security-token:%s\n' % (
+                host, self.amzdate, self.aws_session_token)
+            signed_headers = 'host;x-amz-date;x-amz-security-token'
+        else:
+            canonical_headers = 'host:%s\nx-amz-date:%s\n' % (host, self.amzdate)
+            signed_headers = 'host;x-amz-date'
 
-        if r.method == 'GET':
-            payload_hash = hashlib.sha256(''.encode('utf-8')).hexdigest()
+        if method == 'GET' or not body:
+            payload_hash = EMPTY_PAYLOAD_HASH
         else:
-            if r.body:
-                payload_hash = hashlib.sha256(r.body.encode('utf-8')).hexdigest()
-            else:
-                payload_hash = hashlib.sha256(''.encode('utf-8')).hexdigest()
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+            payload_hash = hashlib.sha256(body).hexdigest()
 
-        canonical_request = '\n'.join([r.method, uri, canonical_querystring,
-                                       canonical_headers, signed_headers, payload_hash])
+        canonical_request = '%s\n%s\n%s\n%s\n%s\n%s' % (method, uri, query,
+                                                   canonical_headers, signed_headers, payload_hash)
 
-        credential_scope = '/'.join([self.datestamp, self.region, self.service, 'aws4_request'])
-        string_to_sign = '\n'.join(['AWS4-HMAC-SHA256', self.amzdate,
-                                    credential_scope, hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()])
+        credential_scope = '%s/%s/%s/aws4_request' % (self.datestamp, self.region, self.service)
+        string_to_sign = 'AWS4-HMAC-SHA256\n%s\n%s\n%s' % (
+            self.amzdate, credential_scope, hashlib.sha256(canonical_request.encode('utf-8')).hexdigest())
         log.debug("String-to-Sign: '%s'", string_to_sign)
 
-        kDate = sign_msg(('AWS4' + self.aws_secret_access_key).encode('utf-8'), self.datestamp)
-        kRegion = sign_msg(kDate, self.region)
-        kService = sign_msg(kRegion, self.service)
-        kSigning = sign_msg(kService, 'aws4_request')
-        signature = hmac.new(kSigning, string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
+        key = signing_key(self.aws_secret_access_key, self.datestamp, self.region, self.service)
+        signature = hmac.new(key, string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
 
         authorization_header = "AWS4-HMAC-SHA256 Credential={}/{}, SignedHeaders={}, Signature={}".format(
             self.aws_access_key_id, credential_scope, signed_headers, signature)
-        r.headers.update({
+        return {
             'host': host,
             'x-amz-date': self.amzdate,
             'Authorization': authorization_header,
             'x-amz-security-token': self.aws_session_token
-        })
-        return r
+        }
+
+    def sign(self, method, host, path, query, headers, body=None) -> dict:
+        """
+        Returns a copy of `headers` including the signature for the request
+        """
+        signed = {**headers, **self.get_request_auth_headers(method, host, path, query, body)}
+        return {k: v for k, v in signed.items() if v is not None}
@@ -3,26 +3,59 @@ import json
 from datetime import datetime
 import logging
 import os
+import threading
+import time
 
-import boto3
-from cachetools import TTLCache
-from requests import request
-
-from sp_api.auth import AccessTokenClient, AccessTokenResponse
+from sp_api.auth.access_token_response import AccessTokenResponse
+from sp_api.auth.token_cache import TokenCache
 from .ApiResponse import ApiResponse
 from .base_client import BaseClient
-from .exceptions import get_exception_for_code, SellingApiBadRequestException
+from .exceptions import get_exception_for_code, SellingApiBadRequestException, SellingApiRequestThrottledException
 from .marketplaces import Marketplaces
+from .transport import Transport, default_transport
+from .rate_limiter import RateLimiter, default_rate_limiter, current_usage_plan
 from sp_api.base import AWSSigV4
+from .aws_sig_v4 import canonical_query
 
 log = logging.getLogger(__name__)
 
-role_cache = TTLCache(maxsize=10, ttl=3600)
+# assumed roles shared by all clients of the process, keyed by access key and role arn.
+# Roles are refreshed in the background 5 minutes before they expire, roles without expiration are kept an hour
+role_cache = TokenCache()
+
+_sts_clients = {}
+_sts_lock = threading.Lock()
+
+
+def get_sts_client(aws_access_key=None, aws_secret_key=None):
+    """
+    Returns the STS client of the keys, created on first use and shared by all clients.
+    boto3 clients are thread safe, creating them isn't.
+    """
+    key = (aws_access_key, aws_secret_key)
+    client = _sts_clients.get(key)
+    if client is None:
+        with _sts_lock:
+            client = _sts_clients.get(key)
+            if client is None:
+                # boto3 is imported with the first STS client, it isn't needed to import sp_api
+                import boto3
+                client = _sts_clients[key] = boto3.client(
+                    'sts',
+                    aws_access_key_id=aws_access_key,
+                    aws_secret_access_key=aws_secret_key
+                )
+    return client
 
 
 class Client(BaseClient):
-    boto3_client = None
+    _boto3_client = None
     grantless_scope = ''
+    transport: Transport = default_transport
+    # defaults to sp_api.auth.AccessTokenClient, imported on first use, sp_api.auth imports this module
+    access_token_client = None
+    rate_limiter: RateLimiter = default_rate_limiter
+    role_cache: TokenCache = role_cache
 
     def __init__(
             self,
@@ -31,40 +64,79 @@ class Client(BaseClient):
             refresh_token=None,
             account='default',
             credentials=None,
-            restricted_data_token=None
+            restricted_data_token=None,
+            transport: Transport = None,
+            rate_limiter: RateLimiter = None
     ):
         super().__init__(account, credentials)
-        self.boto3_client = boto3.client(
-            'sts',
-            aws_access_key_id=self.credentials.aws_access_key,
-            aws_secret_access_key=self.credentials.aws_secret_key
-        )
         self.endpoint = marketplace.endpoint
         self.marketplace_id = marketplace.marketplace_id
         self.region = marketplace.region
         self.restricted_data_token = restricted_data_token
-        self._auth = AccessTokenClient(refresh_token=refresh_token, account=account, credentials=credentials)
+        access_token_client = self.access_token_client
+        if access_token_client is None:
+            from sp_api.auth import AccessTokenClient as access_token_client
+        self._auth = access_token_client(refresh_token=refresh_token, account=account, credentials=credentials)
+        if transport is not None:
+            self.transport = transport
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+
+    @property
+    def boto3_client(self):
+        # only created when a role has to be assumed
+        if self._boto3_client is None:
+            self._boto3_client = get_sts_client(self.credentials.aws_access_key, self.credentials.aws_secret_key)
+        return self._boto3_client
+
+    @boto3_client.setter
+    def boto3_client(self, value):
+        self._boto3_client = value
 
     def _get_cache_key(self, token_flavor=''):
+        # the role doesn't depend on the selling partner, all clients assuming it with the same keys share it
         return 'role_' + hashlib.md5(
-            (token_flavor + self._auth.cred.refresh_token).encode('utf-8')
+            '|'.join((token_flavor, self.credentials.aws_access_key or '', self.credentials.role_arn or ''))
+            .encode('utf-8')
         ).hexdigest()
 
-    def set_role(self, cache_key='role'):
+    def _selling_partner_key(self):
+        """
+        Returns a hash of the client's refresh token, identifying the selling partner without exposing the token
+        """
+        return hashlib.md5((self._auth.cred.refresh_token or '').encode('utf-8')).hexdigest()
+
+    def _rate_limit_key(self, usage_plan):
+        return self._selling_partner_key(), self.region, usage_plan.operation
 
+    def _assume_role(self):
         role = self.boto3_client.assume_role(
             RoleArn=self.credentials.role_arn,
             RoleSessionName='guid'
         )
-        role_cache[cache_key] = role
+        # only the credentials are kept, json serializable for the token store
+        credentials = dict(role['Credentials'])
+        expiration = credentials.get('Expiration')
+        if not hasattr(expiration, 'timestamp'):
+            return {'Credentials': credentials}
+        credentials['Expiration'] = expiration.isoformat()
+        # cached until shortly before the credentials expire, see `role_cache`
+        return {'Credentials': credentials, 'expires_in': expiration.timestamp() - time.time()}
+
+    def set_role(self, cache_key='role'):
+        role = self._assume_role()
+        self.role_cache.put(cache_key, role)
         return role
 
     @property
     def headers(self):
+        return self._make_headers(self.restricted_data_token or self.auth.access_token)
+
+    def _make_headers(self, access_token):
         return {
             'host': self.endpoint[8:],
             'user-agent': self.user_agent,
-            'x-amz-access-token': self.restricted_data_token or self.auth.access_token,
+            'x-amz-access-token': access_token,
             'x-amz-date': datetime.utcnow().strftime('%Y%m%dT%H%M%SZ'),
             'content-type': 'application/json'
         }
@@ -81,13 +153,7 @@ class Client(BaseClient):
 
     @property
     def role(self):
-        cache_key = self._get_cache_key()
-
-        try:
-            role = role_cache[cache_key]
-        except KeyError:
-            role = self.set_role(cache_key)
-        return role.get('Credentials')
+        return self.role_cache.get(self._get_cache_key(), self._assume_role).get('Credentials')
 
     def _sign_request(self):
         role = self.role
@@ -110,11 +176,33 @@ class Client(BaseClient):
         if add_marketplace:
             self._add_marketplaces(data if self.method in ('POST', 'PUT') else params)
 
-        res = self.logger_request(self.method, self.endpoint + path, params=params,
-                      data=json.dumps(data) if data and self.method in ('POST', 'PUT', 'PATCH') else None, headers=headers or self.headers,
-                      auth=self._sign_request())
+        usage_plan = current_usage_plan.get()
+        if usage_plan and self.rate_limiter:
+            self.rate_limiter.acquire(self._rate_limit_key(usage_plan), usage_plan.rate, usage_plan.burst)
 
-        return self._check_response(res)
+        # the query is encoded once, the signature covers exactly what is sent
+        query = canonical_query(params)
+        body = json.dumps(data) if data and self.method in ('POST', 'PUT', 'PATCH') else None
+        headers = self._sign_request().sign(self.method, self.endpoint[8:], path, query, headers or self.headers, body)
+        res = self.transport.request(self.method, self.endpoint + path + ('?' + query if query else ''),
+                                     data=body, headers=headers)
+
+        try:
+            response = self._check_response(res)
+        except SellingApiRequestThrottledException:
+            self._update_rate_limiter(usage_plan, res.headers, throttled=True)
+            raise
+        self._update_rate_limiter(usage_plan, res.headers)
+        return response
+
+    def _update_rate_limiter(self, usage_plan, headers, throttled=False):
+        if not usage_plan or not self.rate_limiter:
+            return
+        key = self._rate_limit_key(usage_plan)
+        if throttled:
+            self.rate_limiter.on_throttle(key)
+        else:
+            self.rate_limiter.on_response(key, ApiResponse.set_rate_limit(headers), usage_plan.burst)
 
     @staticmethod
     def _check_response(res) -> ApiResponse:
@@ -124,6 +212,35 @@ class Client(BaseClient):
             raise exception(error, headers=res.headers)
         return ApiResponse(**res.json(), headers=res.headers)
 
+    def _iter_pages(self, endpoint, *args, next_token_param='NextToken', next_page_kwargs=None, **kwargs):
+        """
+        Iterates over all pages of `endpoint`, the client's rate limiter paces the requests
+        """
+        from sp_api.util.load_all_pages import iter_pages
+        return iter_pages(endpoint, args, kwargs, throttle_by_seconds=0, next_token_param=next_token_param,
+                          next_page_kwargs=next_page_kwargs)
+
+    def _iter_items(self, endpoint, items, *args, next_token_param='NextToken', next_page_kwargs=None, **kwargs):
+        """
+        Yields the records of all pages of `endpoint`, one at a time
+
+        Args:
+            endpoint: the endpoint method to call
+            items: str or callable | the payload key holding the records, or a function returning them from the payload
+            next_token_param: str | The param amazon expects to hold the next token
+            next_page_kwargs: dict | additional keyword arguments passed with the next token
+        """
+        get_items = self._items_getter(items)
+        for page in self._iter_pages(endpoint, *args, next_token_param=next_token_param,
+                                     next_page_kwargs=next_page_kwargs, **kwargs):
+            yield from get_items(page.payload)
+
+    @staticmethod
+    def _items_getter(items):
+        if callable(items):
+            return items
+        return lambda payload: payload.get(items) or []
+
     def _add_marketplaces(self, data):
         POST = ['marketplaceIds', 'MarketplaceIds']
         GET = ['MarketplaceId', 'MarketplaceIds', 'marketplace_ids', 'marketplaceIds']
@@ -137,12 +254,6 @@ class Client(BaseClient):
         return data.update({k: self.marketplace_id if not k.endswith('s') else [self.marketplace_id] for k in GET})
 
     def _request_grantless_operation(self, path: str, *, data: dict = None, params: dict = None):
-        headers = {
-            'host': self.endpoint[8:],
-            'user-agent': self.user_agent,
-            'x-amz-access-token': self.grantless_auth.access_token,
-            'x-amz-date': datetime.utcnow().strftime('%Y%m%dT%H%M%SZ'),
-            'content-type': 'application/json'
-        }
+        headers = self._make_headers(self.grantless_auth.access_token)
 
         return self._request(path, data=data, params=params, headers=headers)
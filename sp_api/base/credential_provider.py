@@ -1,9 +1,7 @@
 import json
 import os
-import confuse
-import boto3
-from botocore.exceptions import ClientError
-from cachetools import Cache
+import threading
+import time
 
 
 class MissingCredentials(Exception):
@@ -13,9 +11,23 @@ class MissingCredentials(Exception):
     pass
 
 
+# credentials read from secrets manager or the config file, per account: (account_data, config file mtime)
+_resolved = {}
+_lock = threading.Lock()
+
+
 class CredentialProvider:
+    """
+    Resolves the credentials of an account from the environment, secrets manager or the config file.
+
+    Credentials read from secrets manager or the config file are kept per account, clients of an account
+    that was already resolved are constructed without any I/O. They're read again once the config file changed,
+    its modification time is checked at most every `config_check_interval` seconds, or after `reload`.
+    """
     credentials = None
-    cache = Cache(maxsize=10)
+    config_check_interval = 1.0
+    # boto3 and confuse are imported when credentials are read from them, importing sp_api doesn't need them
+    _config_file = None
 
     def __init__(self, account='default', credentials=None):
         self.account = account
@@ -33,13 +45,63 @@ class CredentialProvider:
             self.load_credentials()
 
     def load_credentials(self):
-        for read_method in self.read_credentials:
+        # environment variables take precedence and are cheap to read, they're never cached
+        if self.from_env() or self.from_cache():
+            return True
+        mtime = self._config_mtime()
+        for read_method in self.read_credentials[1:]:
             if read_method():
+                with _lock:
+                    _resolved[self.account] = (dict(vars(self.credentials)), mtime, time.monotonic())
                 return True
 
+    @classmethod
+    def reload(cls, account=None):
+        """
+        Drops the cached credentials of `account`, or of all accounts, they're read again by the next client
+        """
+        with _lock:
+            if account is None:
+                _resolved.clear()
+                cls._config_file = None
+            else:
+                _resolved.pop(account, None)
+
+    def from_cache(self):
+        entry = _resolved.get(self.account)
+        if entry is None:
+            return False
+        account_data, mtime, checked = entry
+        now = time.monotonic()
+        if now - checked >= self.config_check_interval:
+            if self._config_mtime() != mtime:
+                self.reload(self.account)
+                return False
+            with _lock:
+                if _resolved.get(self.account) is entry:
+                    _resolved[self.account] = (account_data, mtime, now)
+        self.credentials = self.Config(**account_data)
+        return True
+
+    @classmethod
+    def _config_filename(cls):
+        if cls._config_file is None:
+            import confuse
+            config = confuse.Configuration('python-sp-api', read=False)
+            cls._config_file = os.path.join(config.config_dir(), 'credentials.yml')
+        return cls._config_file
+
+    def _config_mtime(self):
+        try:
+            return os.stat(self._config_filename()).st_mtime_ns
+        except OSError:
+            return None
+
     def from_secrets(self):
         if not os.environ.get('SP_API_AWS_SECRET_ID', None):
             return
+        import boto3
+        from botocore.exceptions import ClientError
         try:
             client = boto3.client('secretsmanager')
             response = client.get_secret_value(
@@ -54,7 +116,6 @@ class CredentialProvider:
                 aws_access_key=secret.get('SP_API_ACCESS_KEY'),
                 role_arn=secret.get('SP_API_ROLE_ARN')
             )
-            self.cache['account_data'] = json.dumps(account_data)
         except ClientError as client_error:
             return
         else:
@@ -62,17 +123,14 @@ class CredentialProvider:
             return len(self.credentials.check_config()) == 0
 
     def from_env(self):
-        try:
-            account_data = json.loads(self.cache['account_data'])
-        except KeyError:
-            account_data = dict(
-                refresh_token=self._get_env('SP_API_REFRESH_TOKEN'),
-                lwa_app_id=self._get_env('LWA_APP_ID'),
-                lwa_client_secret=self._get_env('LWA_CLIENT_SECRET'),
-                aws_secret_key=self._get_env('SP_API_SECRET_KEY'),
-                aws_access_key=self._get_env('SP_API_ACCESS_KEY'),
-                role_arn=self._get_env('SP_API_ROLE_ARN')
-            )
+        account_data = dict(
+            refresh_token=self._get_env('SP_API_REFRESH_TOKEN'),
+            lwa_app_id=self._get_env('LWA_APP_ID'),
+            lwa_client_secret=self._get_env('LWA_CLIENT_SECRET'),
+            aws_secret_key=self._get_env('SP_API_SECRET_KEY'),
+            aws_access_key=self._get_env('SP_API_ACCESS_KEY'),
+            role_arn=self._get_env('SP_API_ROLE_ARN')
+        )
         self.credentials = self.Config(**account_data)
         return len(self.credentials.check_config()) == 0
 
@@ -81,10 +139,10 @@ class CredentialProvider:
                               os.environ.get(key))
 
     def read_config(self):
+        import confuse
         try:
             config = confuse.Configuration('python-sp-api')
-            config_filename = os.path.join(config.config_dir(), 'credentials.yml')
-            config.set_file(config_filename)
+            config.set_file(self._config_filename())
             account_data = config[self.account].get()
             self.credentials = self.Config(**account_data)
             missing = self.credentials.check_config()
@@ -1,26 +1,84 @@
+import codecs
+import logging
+import inspect
+import io
+import tempfile
+import urllib.parse
+import zlib
 from io import BytesIO
 
-from Crypto.Util.Padding import pad
 import hashlib
 
 import base64
-from Crypto.Cipher import AES
+
+from .rate_limiter import UsagePlan, current_usage_plan
+
+log = logging.getLogger(__name__)
+
+AES_BLOCK_SIZE = 16
+
+
+# pycryptodome is imported on first use, importing sp_api doesn't need it
+def _aes(key, iv):
+    from Crypto.Cipher import AES
+    return AES.new(key, AES.MODE_CBC, iv)
+
+
+def pad(data, block_size):
+    from Crypto.Util.Padding import pad
+    return pad(data, block_size)
 
 
 def fill_query_params(query, *args):
-    return query.format(*args)
+    """
+    Fills the placeholders of a path with `args`, URI encoded once as they are sent.
+    A sku like 'my sku+x/1' stays one path segment.
+    """
+    return query.format(*[urllib.parse.quote(format(arg), safe='-_.~') for arg in args])
 
 
-def sp_endpoint(path, method='GET'):
+def sp_endpoint(path, method='GET', rate=None, burst=None):
+    """
+    Marks a client method as endpoint, passing `path` and `method` to it.
+
+    Args:
+        path: str | the endpoint's path
+        method: str | the HTTP method
+        rate: float | documented requests per second of the operation, used by the rate limiter
+        burst: int | documented burst of the operation
+
+    """
+    usage_plan = UsagePlan(f'{method} {path}', rate, burst)
+
     def decorator(function):
-        def wrapper(*args, **kwargs):
-            kwargs.update({
-                'path': path,
-                'method': method
-            })
-            return function(*args, **kwargs)
+        if inspect.iscoroutinefunction(function):
+            async def wrapper(*args, **kwargs):
+                kwargs.update({
+                    'path': path,
+                    'method': method
+                })
+                token = current_usage_plan.set(usage_plan)
+                try:
+                    return await function(*args, **kwargs)
+                finally:
+                    current_usage_plan.reset(token)
+        else:
+            def wrapper(*args, **kwargs):
+                kwargs.update({
+                    'path': path,
+                    'method': method
+                })
+                token = current_usage_plan.set(usage_plan)
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    current_usage_plan.reset(token)
 
         wrapper.__doc__ = function.__doc__
+        wrapper.__name__ = function.__name__
+        wrapper.path = path
+        wrapper.method = method
+        wrapper.usage_plan = usage_plan
         return wrapper
 
     return decorator
@@ -29,7 +87,7 @@ def sp_endpoint(path, method='GET'):
 def encrypt_aes(file_or_bytes_io, key, iv):
     key = base64.b64decode(key)
     iv = base64.b64decode(iv)
-    aes = AES.new(key, AES.MODE_CBC, iv)
+    aes = _aes(key, iv)
     try:
         if isinstance(file_or_bytes_io, BytesIO):
             return aes.encrypt(pad(file_or_bytes_io.read(), 16))
@@ -45,12 +103,333 @@ def encrypt_aes(file_or_bytes_io, key, iv):
 def decrypt_aes(content, key, iv):
     key = base64.b64decode(key)
     iv = base64.b64decode(iv)
-    decrypter = AES.new(key, AES.MODE_CBC, iv)
+    decrypter = _aes(key, iv)
     decrypted = decrypter.decrypt(content)
     padding_bytes = decrypted[-1]
     return decrypted[:-padding_bytes]
 
 
+def encrypted_size(size):
+    """
+    Returns the size of `size` bytes encrypted with AES-CBC and PKCS#7 padding
+    """
+    return (size // AES_BLOCK_SIZE + 1) * AES_BLOCK_SIZE
+
+
+class DocumentEncoder:
+    """
+    Incrementally compresses (gzip) and encrypts (AES-CBC) a document, the counterpart of `DocumentDecoder`.
+
+    Args:
+        key: str | base64 encoded AES key
+        iv: str | base64 encoded initialization vector
+        compress: bool | gzip the document before encrypting it
+    """
+
+    def __init__(self, key, iv, compress=False):
+        self.encrypter = _aes(base64.b64decode(key), base64.b64decode(iv))
+        self.compressor = zlib.compressobj(wbits=16 + 15) if compress else None
+        self._pending = b''
+
+    def _encrypt(self, data):
+        data = self._pending + data
+        size = len(data) // AES_BLOCK_SIZE * AES_BLOCK_SIZE
+        self._pending = data[size:]
+        return self.encrypter.encrypt(data[:size]) if size > 0 else b''
+
+    def feed(self, data):
+        """
+        Returns:
+            bytes: the encrypted data completed by `data`
+        """
+        if self.compressor is not None:
+            data = self.compressor.compress(data)
+        return self._encrypt(data)
+
+    def close(self):
+        """
+        Returns:
+            bytes: the last, padded block(s)
+        """
+        data = self.compressor.flush() if self.compressor is not None else b''
+        data, self._pending = self._pending + data, b''
+        return self.encrypter.encrypt(pad(data, AES_BLOCK_SIZE))
+
+
+class EncryptedStream(io.RawIOBase):
+    """
+    Readable stream of encrypted chunks with a known length, used as streaming request body.
+
+    `len(stream)` is the number of bytes it yields, so the upload can send a Content-Length.
+    """
+
+    def __init__(self, chunks, length, source=None):
+        self._chunks = iter(chunks)
+        self._buffer = b''
+        self._position = 0
+        self.length = length
+        self._source = source
+
+    def __len__(self):
+        return self.length
+
+    def readable(self):
+        return True
+
+    def tell(self):
+        # requests derives the Content-Length from len() minus the position
+        return self._position
+
+    def readinto(self, b):
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = chunk
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        self._position += size
+        return size
+
+    def __iter__(self):
+        # iterating yields the chunks as they are encrypted, requests sends them without reading line by line
+        while True:
+            chunk = self.read(1024 * 1024)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self):
+        if self._source is not None:
+            self._source.close()
+        super().close()
+
+
+def _read_chunks(file, chunk_size, encoding):
+    # reads a binary or text file as bytes, text is encoded with `encoding`
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk if isinstance(chunk, bytes) else chunk.encode(encoding)
+
+
+def encrypt_aes_stream(file, key, iv, compress=False, chunk_size=1024 * 1024):
+    """
+    Encrypts a file chunk by chunk, the counterpart of `encrypt_aes` that keeps memory constant.
+
+    Seekable binary files are encrypted while they are read, their encrypted length is computed up front.
+    Text files are encoded iso-8859-1, or utf-8 if that fails, like `encrypt_aes`. They, compressed documents and
+    unseekable files are encrypted in one pass into a temporary file that spills to disk, to learn their length.
+
+    Args:
+        file: File or File like object, binary or text
+        key: str | base64 encoded AES key
+        iv: str | base64 encoded initialization vector
+        compress: bool | gzip the document before encrypting it
+        chunk_size: int | bytes read at once
+
+    Returns:
+        EncryptedStream
+    """
+    start = file.tell() if file.seekable() else None
+    binary = isinstance(file, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(file, 'mode', '')
+    if binary and start is not None and not compress:
+        length = file.seek(0, io.SEEK_END) - start
+        file.seek(start)
+        encoder = DocumentEncoder(key, iv)
+
+        def chunks():
+            for chunk in _read_chunks(file, chunk_size, None):
+                yield encoder.feed(chunk)
+            yield encoder.close()
+
+        return EncryptedStream(chunks(), encrypted_size(length))
+
+    spool = tempfile.SpooledTemporaryFile(max_size=chunk_size * 4)
+    for encoding in ('iso-8859-1', 'utf-8'):
+        encoder = DocumentEncoder(key, iv, compress)
+        try:
+            for chunk in _read_chunks(file, chunk_size, encoding):
+                spool.write(encoder.feed(chunk))
+        except UnicodeEncodeError:
+            if start is None:
+                raise
+            file.seek(start)
+            spool.seek(0)
+            spool.truncate()
+            continue
+        spool.write(encoder.close())
+        break
+    length = spool.tell()
+    spool.seek(0)
+    return EncryptedStream(iter(lambda: spool.read(chunk_size), b''), length, spool)
+
+
+def detect_encoding(sample, default='iso-8859-1'):
+    """
+    Guesses the character encoding of a document from its first bytes.
+
+    Byte order marks are honoured, otherwise the sample is tried as utf-8 and `default` is used if that fails.
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    try:
+        # incremental, a character cut off at the end of the sample is fine
+        codecs.getincrementaldecoder('utf-8')().decode(sample)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return default
+
+
+class FallbackDecoder:
+    """
+    Incremental decoder switching to `fallback_encoding` for the rest of the document once a piece can't be
+    decoded, e.g. a latin-1 character far behind a sample that looked like utf-8.
+
+    Args:
+        encoding: str | the detected encoding
+        fallback_encoding: str | used once `encoding` fails
+    """
+
+    def __init__(self, encoding, fallback_encoding='iso-8859-1'):
+        self.encoding = encoding
+        self.fallback_encoding = fallback_encoding
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+
+    def decode(self, data, final=False):
+        # bytes of a character cut off at the end of the previous piece
+        pending = self._decoder.getstate()[0]
+        try:
+            return self._decoder.decode(data, final)
+        except UnicodeDecodeError as e:
+            if self.encoding == self.fallback_encoding:
+                raise
+            log.warning('Document is not %s (%s), decoding the rest as %s', self.encoding, e, self.fallback_encoding)
+            self.encoding = self.fallback_encoding
+            self._decoder = codecs.getincrementaldecoder(self.fallback_encoding)()
+            return self._decoder.decode(pending + data, final)
+
+
+class DocumentDecoder:
+    """
+    Incrementally decrypts (AES-CBC), decompresses (gzip/zlib) and decodes a document.
+
+    Feed it the raw chunks as they are downloaded, only the current chunk is held in memory.
+
+    Args:
+        key: str | base64 encoded AES key, None if the document isn't encrypted
+        iv: str | base64 encoded initialization vector
+        compressed: bool | if the document is compressed
+        encoding: str | character encoding of the document, None yields bytes,
+            'auto' detects it from the first `sample_size` bytes with `detect_encoding`, and falls back to
+            `fallback_encoding` if a later part of the document can't be decoded
+        max_length: int | maximum size of a decompressed piece
+        fallback_encoding: str | encoding used by 'auto' if the document isn't utf-8
+        sample_size: int | bytes 'auto' looks at
+    """
+
+    def __init__(self, key=None, iv=None, compressed=False, encoding='iso-8859-1', max_length=1024 * 1024,
+                 fallback_encoding='iso-8859-1', sample_size=64 * 1024):
+        self.decrypter = _aes(base64.b64decode(key), base64.b64decode(iv)) if key else None
+        self.decompressor = zlib.decompressobj(15 + 32) if compressed else None
+        self.encoding = encoding
+        self.decoder = codecs.getincrementaldecoder(encoding)() if encoding and encoding != 'auto' else None
+        self.max_length = max_length
+        self.fallback_encoding = fallback_encoding
+        self.sample_size = sample_size
+        self._pending = b''
+        self._sample = []
+
+    def _decrypt(self, chunk, final=False):
+        if self.decrypter is None:
+            return chunk
+        data = self._pending + chunk
+        if final:
+            self._pending = b''
+            if not data:
+                return b''
+            decrypted = self.decrypter.decrypt(data)
+            return decrypted[:-decrypted[-1]]
+        # the last block is kept back until the end, it holds the padding
+        size = (len(data) - 1) // AES_BLOCK_SIZE * AES_BLOCK_SIZE
+        self._pending = data[size:]
+        return self.decrypter.decrypt(data[:size]) if size > 0 else b''
+
+    def _decompress(self, data, final=False):
+        if self.decompressor is None:
+            if data:
+                yield data
+            return
+        while data:
+            piece = self.decompressor.decompress(data, self.max_length)
+            if piece:
+                yield piece
+            data = self.decompressor.unconsumed_tail
+        if final:
+            piece = self.decompressor.flush()
+            if piece:
+                yield piece
+
+    def _detect(self, piece, final):
+        # collects pieces until there are enough bytes to detect the encoding
+        self._sample.append(piece)
+        sample = b''.join(self._sample)
+        if len(sample) < self.sample_size and not final:
+            return b''
+        self._sample = []
+        self.encoding = detect_encoding(sample, self.fallback_encoding)
+        self.decoder = FallbackDecoder(self.encoding, self.fallback_encoding)
+        return sample
+
+    def _decode(self, pieces, final=False):
+        for piece in pieces:
+            if self.decoder is None and self.encoding == 'auto':
+                piece = self._detect(piece, False)
+            if self.decoder is None:
+                if piece:
+                    yield piece
+                continue
+            text = self.decoder.decode(piece)
+            if text:
+                yield text
+        if final and self.decoder is None and self.encoding == 'auto':
+            sample = self._detect(b'', True)
+            text = self.decoder.decode(sample)
+            if text:
+                yield text
+        if final and self.decoder is not None:
+            text = self.decoder.decode(b'', final=True)
+            if text:
+                yield text
+
+    def feed(self, chunk):
+        """
+        Returns:
+            generator of the decoded pieces of `chunk`
+        """
+        return self._decode(self._decompress(self._decrypt(chunk)))
+
+    def close(self):
+        """
+        Returns:
+            generator of the remaining pieces, call it after the last chunk
+        """
+        return self._decode(self._decompress(self._decrypt(b'', final=True), final=True), final=True)
+
+    def iter(self, chunks):
+        """
+        Returns:
+            generator of the decoded pieces of all `chunks`
+        """
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        yield from self.close()
+
+
 def create_md5(file):
     hash_md5 = hashlib.md5()
     if isinstance(file, BytesIO):
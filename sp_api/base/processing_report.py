@@ -0,0 +1,336 @@
+import codecs
+import json
+from xml.etree import ElementTree
+
+from .helpers import detect_encoding, FallbackDecoder
+
+# flat file summary lines, e.g. "Number of records processed		2"
+FLAT_FILE_SUMMARY = {
+    'number of records processed': 'messagesProcessed',
+    'number of records successful': 'messagesAccepted',
+}
+
+# XML ProcessingSummary elements
+XML_SUMMARY = {
+    'MessagesProcessed': 'messagesProcessed',
+    'MessagesSuccessful': 'messagesAccepted',
+    'MessagesWithError': 'errors',
+    'MessagesWithWarning': 'warnings',
+}
+
+# XML ProcessingReport elements kept in the header
+XML_HEADER = {
+    'DocumentTransactionID': 'documentTransactionId',
+    'StatusCode': 'statusCode',
+}
+
+_MISSING = object()
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+class _XmlReport:
+    """
+    Pulls `Result` elements out of an XML report, every finished element is removed from the tree
+    """
+
+    def __init__(self):
+        self.parser = ElementTree.XMLPullParser(events=('start', 'end'))
+        self.header = {}
+        self.summary = {}
+        self._stack = []
+
+    def _issue(self, result):
+        issue = {
+            'messageId': _int(result.findtext('MessageID')),
+            'code': result.findtext('ResultMessageCode'),
+            'severity': (result.findtext('ResultCode') or '').upper(),
+            'message': result.findtext('ResultDescription'),
+        }
+        if result.findtext('AdditionalInfo/SKU') is not None:
+            issue['sku'] = result.findtext('AdditionalInfo/SKU')
+        return issue
+
+    def _events(self):
+        for event, element in self.parser.read_events():
+            if event == 'start':
+                self._stack.append(element)
+                continue
+            self._stack.pop()
+            parent = self._stack[-1] if self._stack else None
+            if element.tag == 'Result':
+                yield self._issue(element)
+            elif element.tag in XML_HEADER and parent is not None and parent.tag == 'ProcessingReport':
+                self.header[XML_HEADER[element.tag]] = element.text
+            elif element.tag in XML_SUMMARY and parent is not None and parent.tag == 'ProcessingSummary':
+                self.summary[XML_SUMMARY[element.tag]] = _int(element.text)
+            else:
+                continue
+            if parent is not None:
+                parent.remove(element)
+
+    def feed(self, data, final=False):
+        if data:
+            self.parser.feed(data)
+        if final:
+            self.parser.close()
+        yield from self._events()
+
+
+class _JsonReport:
+    """
+    Decodes the `issues` of a JSON report one by one, the other top level values are kept whole
+    """
+
+    def __init__(self):
+        self.decoder = json.JSONDecoder()
+        self.values = {}
+        self.state = 'start'
+        self.key = None
+        self._buffer = ''
+        self._position = 0
+
+    @property
+    def header(self):
+        return self.values.get('header') or {}
+
+    @property
+    def summary(self):
+        return dict(self.values.get('summary') or {})
+
+    def _skip_whitespace(self):
+        while self._position < len(self._buffer) and self._buffer[self._position] in ' \t\r\n':
+            self._position += 1
+
+    def _value(self, final):
+        try:
+            value, end = self.decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return _MISSING
+        # a number at the end of the buffer may go on in the next chunk
+        if end == len(self._buffer) and not final:
+            return _MISSING
+        self._position = end
+        return value
+
+    def _expect(self, char):
+        if self._buffer[self._position] != char:
+            raise ValueError('Invalid processing report, expected %r at %r' % (
+                char, self._buffer[self._position:self._position + 20]))
+        self._position += 1
+
+    def feed(self, text, final=False):
+        self._buffer = self._buffer[self._position:] + text
+        self._position = 0
+        while True:
+            self._skip_whitespace()
+            if self._position >= len(self._buffer):
+                break
+            char = self._buffer[self._position]
+            if self.state == 'start':
+                self._expect('{')
+                self.state = 'key'
+            elif self.state in ('key', 'issue') and char == ',':
+                self._position += 1
+            elif self.state == 'key' and char == '}':
+                self._position += 1
+                self.state = 'end'
+            elif self.state == 'issue' and char == ']':
+                self._position += 1
+                self.state = 'key'
+            elif self.state == 'colon':
+                self._expect(':')
+                self.state = 'issues' if self.key == 'issues' else 'value'
+            elif self.state == 'issues':
+                self._expect('[')
+                self.state = 'issue'
+            elif self.state == 'end':
+                raise ValueError('Invalid processing report, unexpected %r after the end' % char)
+            else:
+                value = self._value(final)
+                if value is _MISSING:
+                    break
+                if self.state == 'key':
+                    self.key = value
+                    self.state = 'colon'
+                elif self.state == 'value':
+                    self.values[self.key] = value
+                    self.state = 'key'
+                else:
+                    yield value
+        if final and self.state != 'end':
+            raise ValueError('Processing report ended unexpectedly')
+
+
+class _FlatFileReport:
+    """
+    Reads the summary lines and the error rows of a flat file report line by line
+    """
+
+    def __init__(self):
+        self.header = {}
+        self.summary = {}
+        self.columns = None
+        self._rest = ''
+
+    def _parse(self, line):
+        values = line.rstrip('\r').split('\t')
+        if not line.strip():
+            return None
+        if self.columns is not None:
+            row = dict(zip(self.columns, values))
+            return {
+                'messageId': _int(row.get('original-record-number')),
+                'code': row.get('error-code'),
+                'severity': (row.get('error-type') or '').upper(),
+                'message': row.get('error-message'),
+                'sku': row.get('sku'),
+            }
+        if values[0] == 'original-record-number':
+            self.columns = values
+            return None
+        fields = [value for value in values if value.strip()]
+        key = FLAT_FILE_SUMMARY.get(fields[0].strip().lower())
+        if key and len(fields) > 1:
+            self.summary[key] = _int(fields[-1].strip())
+        return None
+
+    def feed(self, text, final=False):
+        lines = (self._rest + text).split('\n')
+        self._rest = '' if final else lines.pop()
+        for line in lines:
+            issue = self._parse(line)
+            if issue is not None:
+                yield issue
+
+
+class ProcessingReportParser:
+    """
+    Incrementally parses a feed processing report into its issues, without holding the whole document.
+
+    The format is detected from the first bytes: XML reports are read with a pull parser that drops every
+    `Result` once it's parsed, the `issues` of JSON reports are decoded one at a time and flat files line by line.
+    Issues are dicts with `messageId`, `code`, `severity` (`ERROR` or `WARNING`) and `message`, like the issues of
+    the JSON processing report. `header` and `summary` are complete once the parser is closed, the summary always
+    counts `errors` and `warnings`.
+
+    Examples:
+        parser = ProcessingReportParser()
+        for chunk in chunks:
+            for issue in parser.feed(chunk):
+                print(issue['messageId'], issue['message'])
+        for issue in parser.close():
+            ...
+        print(parser.summary)
+
+    Args:
+        encoding: str | character encoding of flat file reports, detected if not passed.
+            A detected encoding falls back to iso-8859-1 if a later part of the report can't be decoded.
+            XML reports declare their encoding, JSON reports are utf-8.
+        sample_size: int | bytes the flat file encoding is detected from
+    """
+
+    def __init__(self, encoding=None, sample_size=64 * 1024):
+        self.encoding = encoding
+        self.sample_size = sample_size
+        self.errors = 0
+        self.warnings = 0
+        self._report = None
+        self._decoder = None
+        self._start = None
+
+    @property
+    def header(self) -> dict:
+        return self._report.header if self._report is not None else {}
+
+    @property
+    def summary(self) -> dict:
+        summary = dict(self._report.summary) if self._report is not None else {}
+        summary.setdefault('errors', self.errors)
+        summary.setdefault('warnings', self.warnings)
+        return summary
+
+    def _detect(self, final):
+        # the format is told from the first character that isn't whitespace or a byte order mark
+        whitespace = b'\xef\xbb\xbf \t\r\n' if isinstance(self._start, bytes) else '\ufeff \t\r\n'
+        first = self._start.lstrip(whitespace)[:1]
+        if not first and not final:
+            return False
+        if first in (b'<', '<'):
+            self._report = _XmlReport()
+            return True
+        encoding = 'utf-8-sig' if first in (b'{', '{') else self.encoding
+        if isinstance(self._start, bytes) and encoding is None:
+            # flat files are decoded with the encoding detected from the first `sample_size` bytes
+            if len(self._start) < self.sample_size and not final:
+                return False
+            self._decoder = FallbackDecoder(detect_encoding(self._start))
+        elif isinstance(self._start, bytes):
+            self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._report = _JsonReport() if first in (b'{', '{') else _FlatFileReport()
+        return True
+
+    def _count(self, issues):
+        for issue in issues:
+            if issue.get('severity') == 'ERROR':
+                self.errors += 1
+            elif issue.get('severity') == 'WARNING':
+                self.warnings += 1
+            yield issue
+
+    def feed(self, data, final=False):
+        """
+        Args:
+            data: bytes or str | the next piece of the decrypted, decompressed report
+
+        Returns:
+            generator of the issues completed by `data`
+        """
+        if self._report is None:
+            self._start = data if self._start is None else self._start + data
+            if not self._detect(final):
+                return
+            data, self._start = self._start, self._start[:0]
+        if self._decoder is not None:
+            data = self._decoder.decode(data, final)
+        yield from self._count(self._report.feed(data, final))
+
+    def close(self):
+        """
+        Returns:
+            generator of the remaining issues
+        """
+        yield from self.feed(self._start[:0] if self._start is not None else b'', True)
+
+    def iter(self, pieces):
+        """
+        Parses all `pieces` and yields the issues
+        """
+        for piece in pieces:
+            yield from self.feed(piece)
+        yield from self.close()
+
+
+def parse_processing_report(content) -> dict:
+    """
+    Parses a feed processing report into the shape of the JSON processing report.
+
+    JSON, XML and flat file reports are supported, see `ProcessingReportParser`.
+
+    Args:
+        content: str, bytes or an iterable of them | the decrypted report,
+            e.g. the pieces of `Feeds.stream_feed_result_document`
+
+    Returns:
+        dict: {'header': {...}, 'summary': {...}, 'issues': [...]}
+    """
+    parser = ProcessingReportParser()
+    issues = list(parser.iter([content] if isinstance(content, (str, bytes)) else content))
+    return {'header': parser.header, 'summary': parser.summary, 'issues': issues}
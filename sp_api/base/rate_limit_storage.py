@@ -0,0 +1,135 @@
+"""
+Storage backends for the rate limiter's token buckets.
+
+A storage keeps one state (a json serializable dict) per key and applies updates atomically.
+`update(key, func)` calls `func` with the current state, or None, and stores the state it returns;
+func returns a `(state, result)` tuple, `result` is returned by `update`. Returning None as state leaves
+the storage unchanged.
+"""
+import hashlib
+import json
+import os
+import threading
+
+
+def _key_to_str(key) -> str:
+    if isinstance(key, (tuple, list)):
+        return '|'.join(str(k) for k in key)
+    return str(key)
+
+
+class MemoryStorage:
+    """
+    Keeps the buckets in memory, shared by all threads of a process
+    """
+
+    def __init__(self):
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self._states.get(_key_to_str(key))
+
+    def update(self, key, func):
+        key = _key_to_str(key)
+        with self._lock:
+            state, result = func(self._states.get(key))
+            if state is not None:
+                self._states[key] = state
+            return result
+
+    def clear(self):
+        with self._lock:
+            self._states.clear()
+
+
+class FileStorage:
+    """
+    Keeps the buckets in files locked with `fcntl.flock`, shared by all processes on a host.
+
+    Available on POSIX systems.
+
+    Args:
+        directory: str | directory holding one file per bucket
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.md5(_key_to_str(key).encode('utf-8')).hexdigest() + '.json')
+
+    @staticmethod
+    def _read(f):
+        f.seek(0)
+        content = f.read()
+        return json.loads(content) if content else None
+
+    def get(self, key):
+        import fcntl
+        try:
+            with open(self._path(key), 'r') as f:
+                fcntl.flock(f, fcntl.LOCK_SH)
+                return self._read(f)
+        except FileNotFoundError:
+            return None
+
+    def update(self, key, func):
+        import fcntl
+        with open(self._path(key), 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            state, result = func(self._read(f))
+            if state is not None:
+                f.seek(0)
+                f.truncate()
+                json.dump(state, f)
+                f.flush()
+            return result
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.directory, name))
+
+
+class RedisStorage:
+    """
+    Keeps the buckets in redis, or any server speaking the redis protocol, shared by all hosts.
+
+    Updates run in optimistic `WATCH`/`MULTI` transactions.
+
+    Args:
+        redis: a `redis.Redis` compatible client
+        prefix: str | prefix of the keys
+        ttl: int | seconds an unused bucket is kept
+    """
+
+    def __init__(self, redis, prefix='sp_api:rate_limit:', ttl=3600):
+        self.redis = redis
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _name(self, key):
+        return self.prefix + _key_to_str(key)
+
+    def get(self, key):
+        content = self.redis.get(self._name(key))
+        return json.loads(content) if content else None
+
+    def update(self, key, func):
+        name = self._name(key)
+
+        def transaction(pipe):
+            content = pipe.get(name)
+            state, result = func(json.loads(content) if content else None)
+            pipe.multi()
+            if state is not None:
+                pipe.set(name, json.dumps(state), ex=self.ttl)
+            return result
+
+        return self.redis.transaction(transaction, name, value_from_callable=True)
+
+    def clear(self):
+        for name in self.redis.scan_iter(match=self.prefix + '*'):
+            self.redis.delete(name)
@@ -0,0 +1,177 @@
+import logging
+import time
+from collections import namedtuple
+from contextvars import ContextVar
+
+from .rate_limit_storage import MemoryStorage
+
+log = logging.getLogger(__name__)
+
+# documented usage plan of an operation, the operation is identified by method and path, e.g. `GET /orders/v0/orders`
+UsagePlan = namedtuple('UsagePlan', ['operation', 'rate', 'burst'])
+
+# usage plan of the endpoint currently being called, set by `sp_endpoint`
+current_usage_plan: ContextVar = ContextVar('current_usage_plan', default=None)
+
+
+class TokenBucket:
+    """
+    Token bucket refilled with `rate` tokens per second, holding at most `burst` tokens.
+
+    `limit` is the highest rate the bucket may be tuned to, if known.
+    """
+
+    def __init__(self, rate, burst, tokens=None, timestamp=None, limit=None):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = self.burst if tokens is None else tokens
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.limit = limit
+
+    def reserve(self, now=None) -> float:
+        """
+        Takes a token from the bucket.
+
+        The bucket may go into debt, the returned number of seconds is how long the caller has to wait
+        until the token is actually available.
+
+        Returns:
+            float: seconds to wait
+        """
+        if now is None:
+            now = time.time()
+        self.tokens = min(self.burst, self.tokens + max(0, now - self.timestamp) * self.rate)
+        self.timestamp = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0
+        return -self.tokens / self.rate
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class RateLimiter:
+    """
+    Keeps one token bucket per key, usually (selling partner, region, operation).
+
+    Calls wait until a token is available instead of being throttled by amazon.
+
+    Args:
+        storage: where the buckets are kept, defaults to `MemoryStorage`.
+            Use `FileStorage` or `RedisStorage` to share the buckets between processes.
+    """
+
+    def __init__(self, storage=None):
+        self.storage = storage if storage is not None else MemoryStorage()
+
+    def reserve(self, key, rate, burst) -> float:
+        """
+        Takes a token from the bucket of `key` and returns the seconds to wait for it.
+
+        Operations without a known rate are not limited.
+        """
+
+        def take(state):
+            if state is None:
+                if not rate:
+                    return None, 0
+                bucket = TokenBucket(rate, burst or 1)
+            else:
+                bucket = TokenBucket(**state)
+            wait = bucket.reserve()
+            return bucket.to_dict(), wait
+
+        return self.storage.update(key, take)
+
+    def acquire(self, key, rate, burst):
+        """
+        Blocks until a token for `key` is available
+        """
+        wait = self.reserve(key, rate, burst)
+        if wait > 0:
+            log.debug('Rate limit reached for %s, waiting %.2f seconds', key, wait)
+            time.sleep(wait)
+
+    def bucket(self, key) -> TokenBucket:
+        """
+        Returns the current bucket of `key`, or None
+        """
+        state = self.storage.get(key)
+        return TokenBucket(**state) if state else None
+
+    def on_response(self, key, rate_limit, burst=None):
+        """
+        Called with the `x-amzn-RateLimit-Limit` header of every response to the operation of `key`
+        """
+        pass
+
+    def on_throttle(self, key):
+        """
+        Called when a request for `key` was throttled
+        """
+        pass
+
+    def clear(self):
+        self.storage.clear()
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    Rate limiter retuning its buckets from amazon's `x-amzn-RateLimit-Limit` response header.
+
+    The header holds the actual limit for the selling partner and operation, which may differ from the documented one.
+    After a throttled request the rate is reduced by `decrease`, every successful response raises it
+    again by `increase` times the limit, until the limit is reached (AIMD).
+
+    Args:
+        decrease: float | factor the rate is multiplied by after a throttled request
+        increase: float | fraction of the limit the rate recovers by with each successful response
+        min_rate: float | the rate is never reduced below this
+        storage: see `RateLimiter`
+    """
+
+    def __init__(self, decrease=0.5, increase=0.1, min_rate=0.001, storage=None):
+        super().__init__(storage)
+        self.decrease = decrease
+        self.increase = increase
+        self.min_rate = min_rate
+
+    def on_response(self, key, rate_limit, burst=None):
+        try:
+            limit = float(rate_limit)
+        except (TypeError, ValueError):
+            limit = None
+
+        def retune(state):
+            if state is None:
+                if not limit:
+                    return None, None
+                return TokenBucket(limit, burst or 1, limit=limit).to_dict(), None
+            bucket = TokenBucket(**state)
+            if limit:
+                bucket.limit = limit
+            if bucket.limit is None:
+                bucket.limit = bucket.rate
+            bucket.rate = min(bucket.limit, bucket.rate + bucket.limit * self.increase)
+            return bucket.to_dict(), None
+
+        self.storage.update(key, retune)
+
+    def on_throttle(self, key):
+
+        def back_off(state):
+            if state is None:
+                return None, None
+            bucket = TokenBucket(**state)
+            if bucket.limit is None:
+                bucket.limit = bucket.rate
+            bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+            bucket.tokens = min(bucket.tokens, 0)
+            log.debug('Request for %s was throttled, reducing rate to %s', key, bucket.rate)
+            return bucket.to_dict(), None
+
+        self.storage.update(key, back_off)
+
+
+default_rate_limiter = AdaptiveRateLimiter()
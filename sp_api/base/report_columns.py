@@ -0,0 +1,138 @@
+"""
+Columnar export of flat file reports with pyarrow.
+
+Column types are declared per report type in `REPORT_COLUMN_TYPES`, as pyarrow type aliases
+(see `pyarrow.type_for_alias`), or 'timestamp[s, tz=UTC]' for dates with an offset.
+Columns that aren't declared are read as strings, pyarrow would infer their type from the first block only
+and fail on a later row that doesn't fit it.
+"""
+import io
+import itertools
+
+_all_orders = {
+    'amazon-order-id': 'string',
+    'merchant-order-id': 'string',
+    'purchase-date': 'timestamp[s, tz=UTC]',
+    'last-updated-date': 'timestamp[s, tz=UTC]',
+    'quantity': 'int64',
+    'item-price': 'double',
+    'item-tax': 'double',
+    'shipping-price': 'double',
+    'shipping-tax': 'double',
+    'gift-wrap-price': 'double',
+    'gift-wrap-tax': 'double',
+    'item-promotion-discount': 'double',
+    'ship-promotion-discount': 'double',
+    'ship-postal-code': 'string',
+    'is-business-order': 'bool',
+}
+
+REPORT_COLUMN_TYPES = {
+    'GET_FLAT_FILE_ALL_ORDERS_DATA_BY_LAST_UPDATE_GENERAL': _all_orders,
+    'GET_FLAT_FILE_ALL_ORDERS_DATA_BY_ORDER_DATE_GENERAL': _all_orders,
+    'GET_LEDGER_DETAIL_VIEW_DATA': {
+        'Date': 'timestamp[s]',
+        'Quantity': 'int64',
+        'Reconciled Quantity': 'int64',
+        'Unreconciled Quantity': 'int64',
+        'Date and Time': 'timestamp[s, tz=UTC]',
+    },
+}
+
+# formats of the date columns in flat files
+TIMESTAMP_FORMATS = ['%m/%d/%Y', '%d.%m.%Y']
+
+OUTPUTS = ('arrow', 'parquet')
+
+
+def report_column_types(report_type=None, column_types=None) -> dict:
+    """
+    Returns the declared column types of `report_type`, updated with `column_types`
+    """
+    declared = dict(REPORT_COLUMN_TYPES.get(getattr(report_type, 'value', report_type), {}))
+    declared.update(column_types or {})
+    return declared
+
+
+def _arrow_type(alias):
+    import pyarrow as pa
+    if not isinstance(alias, str):
+        return alias
+    if alias == 'timestamp[s, tz=UTC]':
+        return pa.timestamp('s', tz='UTC')
+    return pa.type_for_alias(alias)
+
+
+class _TextStream(io.RawIOBase):
+    # readable binary stream of utf-8 encoded text pieces
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.buffer = b''
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self.buffer:
+            piece = next(self.pieces, None)
+            if piece is None:
+                return 0
+            self.buffer = piece.encode('utf-8')
+        size = min(len(b), len(self.buffer))
+        b[:size] = self.buffer[:size]
+        self.buffer = self.buffer[size:]
+        return size
+
+
+def write_report_columns(pieces, output='arrow', file=None, column_types=None, delimiter='\t',
+                         block_size=1024 * 1024):
+    """
+    Reads a flat file report with pyarrow's streaming csv reader, batch by batch.
+
+    Args:
+        pieces: Iterator[str] | the report's contents, e.g. from `Reports.stream_report_document`
+        output: str | 'arrow' writes an Arrow IPC file, which can be memory-mapped, 'parquet' a parquet file
+        file: path or file like object to write to, optional for 'arrow'
+        column_types: dict | types of the columns, see `report_column_types`, other columns are strings
+        delimiter: str | the column delimiter
+        block_size: int | bytes per record batch
+
+    Returns:
+        pyarrow.Table if output is 'arrow' and no file is passed, else None
+    """
+    import pyarrow.csv as csv
+    import pyarrow.ipc as ipc
+    if output not in OUTPUTS:
+        raise ValueError('output must be one of %s' % ', '.join(OUTPUTS))
+    if output == 'parquet' and file is None:
+        raise ValueError('output="parquet" needs a file')
+
+    pieces = iter(pieces)
+    head = ''
+    for piece in pieces:
+        head += piece
+        if '\n' in head:
+            break
+    header = [column.strip() for column in head.split('\n', 1)[0].rstrip('\r').split(delimiter)]
+    column_types = column_types or {}
+    types = {column: _arrow_type(column_types.get(column, 'string')) for column in header}
+
+    reader = csv.open_csv(
+        io.BufferedReader(_TextStream(itertools.chain([head], pieces)), buffer_size=block_size),
+        read_options=csv.ReadOptions(block_size=block_size),
+        parse_options=csv.ParseOptions(delimiter=delimiter, quote_char=False),
+        convert_options=csv.ConvertOptions(column_types=types, timestamp_parsers=[csv.ISO8601] + TIMESTAMP_FORMATS)
+    )
+    if output == 'arrow':
+        if file is None:
+            return reader.read_all()
+        with ipc.new_file(file, reader.schema) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+        return None
+    import pyarrow.parquet as pq
+    with pq.ParquetWriter(file, reader.schema) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+    return None
@@ -1,8 +1,11 @@
 """
 Enums for header row for report responses. See reportTypes.py for all available report requests.
 """
+import logging
 from enum import Enum
 
+log = logging.getLogger(__name__)
+
 
 class ReportHeaders(str, Enum):
     """Headers will inherit from this class for optional type checking purposes."""
@@ -68,3 +71,77 @@ class MerchantListingsAllData(ReportHeaders):
     STATUS = 'status'
     MINIMUM_ORDER_QUANTITY = 'Minimum order quantity'
     SELL_REMAINDER = 'Sell remainder'
+
+
+class ReportRowParser:
+    """
+    Incrementally parses a tab separated flat file report into rows.
+
+    The first line is the header. If `header_enum` is passed, the header is validated against it and the rows
+    hold the enum's columns in the enum's order, columns missing in the report are None.
+    Columns the enum doesn't know follow them, in dicts and tuples alike, `columns` lists the order.
+
+    Args:
+        header_enum: ReportHeaders | the report's headers
+        as_tuple: bool | yield tuples instead of dicts
+        delimiter: str | the column delimiter
+        strict: bool | raise a ValueError if the report has columns the enum doesn't know, otherwise log a warning
+    """
+
+    def __init__(self, header_enum=None, as_tuple=False, delimiter='\t', strict=True):
+        self.header_enum = header_enum
+        self.as_tuple = as_tuple
+        self.delimiter = delimiter
+        self.strict = strict
+        self.header = None
+        self.columns = None
+        self._rest = ''
+
+    def _set_header(self, fields):
+        self.header = [field.strip() for field in fields]
+        if self.header_enum is None:
+            self.columns = self.header
+            return
+        known = [member.value for member in self.header_enum]
+        unknown = [column for column in self.header if column not in known]
+        if unknown:
+            message = 'Unexpected columns for %s: %s' % (self.header_enum.__name__, ', '.join(unknown))
+            if self.strict:
+                raise ValueError(message)
+            log.warning(message)
+        self.columns = known + unknown
+
+    def _parse(self, line):
+        fields = line.rstrip('\r').split(self.delimiter)
+        if self.header is None:
+            self._set_header(fields)
+            return None
+        if fields == ['']:
+            return None
+        values = dict(zip(self.header, fields))
+        if self.as_tuple:
+            return tuple(values.get(column) for column in self.columns)
+        return {column: values.get(column) for column in self.columns}
+
+    def feed(self, text):
+        """
+        Returns:
+            generator of the rows completed by `text`
+        """
+        lines = (self._rest + text).split('\n')
+        self._rest = lines.pop()
+        for line in lines:
+            row = self._parse(line)
+            if row is not None:
+                yield row
+
+    def close(self):
+        """
+        Returns:
+            generator of the last row, if the report doesn't end with a line break
+        """
+        rest, self._rest = self._rest, ''
+        if rest:
+            row = self._parse(rest)
+            if row is not None:
+                yield row
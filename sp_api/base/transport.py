@@ -0,0 +1,77 @@
+import logging
+import threading
+from urllib.parse import urlsplit
+
+
+log = logging.getLogger(__name__)
+
+
+class Transport:
+    """
+    Pooled, keep-alive HTTP transport.
+
+    Keeps one `requests.Session` per endpoint host, so connections (and their TLS handshake) are
+    reused by every client talking to that host.
+
+    Args:
+        pool_connections: int | number of connection pools to cache per session
+        pool_maxsize: int | maximum number of connections kept alive per host
+        pool_block: bool | block when no free connection is available instead of opening a new one
+        keep_alive: bool | reuse connections between requests, if False every request closes its connection
+        timeout: float or (connect, read) tuple | socket timeout applied to requests that don't pass one
+        max_retries: int | connection level retries, passed to the adapter
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True,
+                 timeout=None, max_retries=0):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def session(self, url) -> 'requests.Session':
+        """
+        Returns the session for the host of `url`, creating it on first use
+        """
+        host = urlsplit(url).netloc
+        try:
+            return self._sessions[host]
+        except KeyError:
+            pass
+        with self._lock:
+            if host not in self._sessions:
+                log.debug('Creating session for %s', host)
+                self._sessions[host] = self._make_session()
+            return self._sessions[host]
+
+    def _make_session(self):
+        # requests is imported with the first session, it isn't needed to import sp_api
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                              pool_maxsize=self.pool_maxsize,
+                              pool_block=self.pool_block,
+                              max_retries=self.max_retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def request(self, method, url, **kwargs) -> 'requests.Response':
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session(url).request(method, url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+
+default_transport = Transport()
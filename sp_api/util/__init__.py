@@ -1,11 +1,27 @@
 from .retry import retry, sp_retry, throttle_retry
-from .load_all_pages import load_all_pages
+from .load_all_pages import load_all_pages, iter_pages, prefetch_pages
+from .checkpoints import FileCheckpointStore, SQLiteCheckpointStore
 from .key_maker import KeyMaker
+from .report_jobs import ReportJobManager, ReportJobError
+from .report_cache import ReportCache, DocumentCache
+from .feed_writer import FeedWriter
+from .feed_pipeline import FeedPipeline, FeedJobError
 
 __all__ = [
     'retry',
     'sp_retry',
     'throttle_retry',
     'load_all_pages',
-    'KeyMaker'
+    'iter_pages',
+    'prefetch_pages',
+    'FileCheckpointStore',
+    'SQLiteCheckpointStore',
+    'KeyMaker',
+    'ReportJobManager',
+    'ReportJobError',
+    'ReportCache',
+    'DocumentCache',
+    'FeedWriter',
+    'FeedPipeline',
+    'FeedJobError'
 ]
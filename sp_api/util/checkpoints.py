@@ -0,0 +1,97 @@
+"""
+Checkpoint stores for resumable pagination.
+
+A checkpoint is a json serializable dict holding the query of the first request, the next token
+and the timestamp it expires at. Stores return None for missing and expired checkpoints.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+
+class FileCheckpointStore:
+    """
+    Keeps one json file per checkpoint
+
+    Args:
+        directory: str | directory holding the checkpoints
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.md5(key.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, key):
+        try:
+            with open(self._path(key), 'r') as f:
+                checkpoint = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if checkpoint.get('expires') is not None and checkpoint['expires'] < time.time():
+            self.delete(key)
+            return None
+        return checkpoint
+
+    def put(self, key, checkpoint):
+        # written to a temporary file first, a crash never leaves a partial checkpoint behind
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp, self._path(key))
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+class SQLiteCheckpointStore:
+    """
+    Keeps the checkpoints in a SQLite database
+
+    Args:
+        path: str | path of the database file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS checkpoints (key TEXT PRIMARY KEY, checkpoint TEXT, expires REAL)'
+            )
+
+    def get(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT checkpoint, expires FROM checkpoints WHERE key = ?', (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        if row[1] is not None and row[1] < time.time():
+            self.delete(key)
+            return None
+        return json.loads(row[0])
+
+    def put(self, key, checkpoint):
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO checkpoints (key, checkpoint, expires) VALUES (?, ?, ?)',
+                (key, json.dumps(checkpoint), checkpoint.get('expires'))
+            )
+
+    def delete(self, key):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM checkpoints WHERE key = ?', (key,))
+
+    def close(self):
+        self._connection.close()
@@ -0,0 +1,177 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+from .poller import PollJob, Poller
+
+log = logging.getLogger(__name__)
+
+
+class FeedJobError(Exception):
+    """
+    Raised by a feed job's future if the feed was cancelled or failed
+
+    Parameters:
+
+        feed: dict The feed, as returned by get_feed
+        report: dict The parsed processing report, if amazon created one
+    """
+
+    def __init__(self, feed, report=None):
+        self.feed = feed
+        self.report = report
+        super().__init__('Feed %s finished with status %s' % (feed.get('feedId'), feed.get('processingStatus')))
+
+
+class FeedJob(PollJob):
+    """
+    A feed tracked by `FeedPipeline`
+    """
+
+    def __init__(self, feed_type, file, content_type, compress, feed_kwargs):
+        super().__init__()
+        self.feed_type = feed_type
+        self.file = file
+        self.content_type = content_type
+        self.compress = compress
+        self.feed_kwargs = feed_kwargs
+        self.document_id = None
+        self.feed_id = None
+        self.feed = None
+
+    def __str__(self):
+        return 'Feed %s' % (self.feed_id or self.feed_type)
+
+
+class FeedPipeline(Poller):
+    """
+    Submits many feeds at once, overlapping upload, feed creation, status polling and result download.
+
+    Feed documents are encrypted and uploaded by a pool of `max_workers` threads. Feeds are created one at a
+    time on a separate thread, so waiting for the `create_feed` usage plan (0.0083 requests per second,
+    burst 15) doesn't hold up uploads or downloads. Feeds are polled from the scheduler thread with a growing
+    interval, processing reports are downloaded and parsed by the pool as soon as their feed is done.
+
+    Every job's future results in the parsed processing report, see `Feeds.get_feed_processing_report`.
+
+    Examples:
+        with FeedPipeline(Feeds()) as pipeline:
+            for path in paths:
+                pipeline.submit('POST_FLAT_FILE_INVLOADER_DATA', path, content_type='text/tsv')
+            for future in pipeline.as_completed():
+                report = future.result()
+                print(future.job.feed_id, report['summary'])
+
+    Args:
+        feeds: Feeds | the client submitting the feeds, shared by all threads
+        max_workers: int | number of concurrent uploads and downloads
+        poll_interval: float | seconds until a new feed is checked the first time
+        max_poll_interval: float | upper limit of the poll interval
+        backoff: float | factor the poll interval grows by after each check
+        timeout: float | seconds after which a feed that isn't done fails with a TimeoutError
+    """
+
+    thread_name_prefix = 'sp_api-feed'
+
+    def __init__(self, feeds, max_workers=4, poll_interval=30, max_poll_interval=300, backoff=1.5, timeout=None):
+        self.feeds = feeds
+        self._creator = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.thread_name_prefix + '-create')
+        self._futures = []
+        super().__init__(max_workers, poll_interval, max_poll_interval, backoff, timeout)
+
+    def submit(self, feed_type, file, content_type='text/tsv', compress: bool = False, **kwargs) -> Future:
+        """
+        Submits a feed, the future's result is its parsed processing report
+
+        Args:
+            feed_type: str | the feed type
+            file: path, file or file like object, opened paths are closed after the upload
+            content_type: str
+            compress: bool | gzip the file while encrypting it
+            **kwargs: passed to `create_feed`, e.g. marketplaceIds
+
+        Returns:
+            Future: `future.job` holds the feed id and the feed once they're known
+        """
+        future = self._start(FeedJob(feed_type, file, content_type, compress, kwargs))
+        self._futures.append(future)
+        return future
+
+    def as_completed(self, timeout=None):
+        """
+        Yields the futures of all submitted feeds as they complete
+        """
+        return as_completed(list(self._futures), timeout)
+
+    def _check(self, job):
+        from sp_api.base import ProcessingStatus, SellingApiRequestThrottledException
+        if job.document_id is None:
+            self._executor.submit(self._upload, job)
+            return
+        if job.feed_id is None:
+            self._creator.submit(self._create, job)
+            return
+        try:
+            job.feed = self.feeds.get_feed(job.feed_id).payload
+        except SellingApiRequestThrottledException:
+            self._retry(job)
+            return
+        except Exception as e:
+            self._fail(job, e)
+            return
+        status = job.feed.get('processingStatus')
+        if status in (ProcessingStatus.DONE, ProcessingStatus.CANCELLED, ProcessingStatus.FATAL):
+            self._executor.submit(self._download, job)
+        else:
+            self._retry(job)
+
+    def _upload(self, job):
+        if job.future.done():
+            return
+        try:
+            if isinstance(job.file, str):
+                with open(job.file, 'rb') as f:
+                    res = self.feeds.create_feed_document(f, job.content_type, job.compress)
+            else:
+                res = self.feeds.create_feed_document(job.file, job.content_type, job.compress)
+        except Exception as e:
+            self._fail(job, e)
+            return
+        job.document_id = res.payload.get('feedDocumentId')
+        log.debug('Uploaded feed document %s', job.document_id)
+        self._schedule(job, 0)
+
+    def _create(self, job):
+        from sp_api.base import SellingApiRequestThrottledException
+        if job.future.done():
+            return
+        try:
+            res = self.feeds.create_feed(job.feed_type, job.document_id, **job.feed_kwargs)
+        except SellingApiRequestThrottledException:
+            self._retry(job)
+            return
+        except Exception as e:
+            self._fail(job, e)
+            return
+        job.feed_id = res.payload.get('feedId')
+        log.debug('Created feed %s', job.feed_id)
+        self._schedule(job, job.interval)
+
+    def _download(self, job):
+        from sp_api.base import ProcessingStatus
+        if not job.future.set_running_or_notify_cancel():
+            return
+        try:
+            report = None
+            if job.feed.get('resultFeedDocumentId'):
+                report = self.feeds.get_feed_processing_report(job.feed['resultFeedDocumentId'])
+        except Exception as e:
+            job.future.set_exception(e)
+            return
+        if job.feed.get('processingStatus') == ProcessingStatus.DONE:
+            job.future.set_result(report)
+        else:
+            job.future.set_exception(FeedJobError(job.feed, report))
+
+    def shutdown(self, wait=True):
+        super().shutdown(wait)
+        self._creator.shutdown(wait=wait)
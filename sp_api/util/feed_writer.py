@@ -0,0 +1,176 @@
+import json
+import logging
+import tempfile
+
+log = logging.getLogger(__name__)
+
+FORMATS = ('tsv', 'json')
+
+
+class FeedWriter:
+    """
+    Builds feeds incrementally from rows or messages, spilling them to temporary files.
+
+    A feed is split into several parts once `max_size` bytes or `max_messages` rows are reached, every part is
+    a complete feed (header included) and is submitted as soon as it's full. Each part is streamed through
+    encryption and upload from its temporary file, memory doesn't grow with the feed.
+
+    Examples:
+        with FeedWriter(Feeds(), 'POST_FLAT_FILE_PRICEANDQUANTITYONLY_UPDATE_DATA',
+                        columns=['sku', 'price', 'quantity'], max_messages=50000) as writer:
+            for sku, price, quantity in cursor:
+                writer.write((sku, price, quantity))
+        feed_ids = [feed.payload['feedId'] for document, feed in writer.results]
+
+        with FeedWriter(Feeds(), 'JSON_LISTINGS_FEED', format='json',
+                        header={'sellerId': seller_id, 'version': '2.0'}) as writer:
+            writer.writerows({'sku': sku, 'operationType': 'PATCH', ...} for sku in skus)
+
+    Args:
+        feeds: Feeds | the client submitting the parts
+        feed_type: str | the feed type
+        format: str | 'tsv' for flat files, 'json' for JSON feeds
+        header: list of header lines (tsv), or the feed's header dict (json), repeated in every part
+        columns: list | tsv column names, the order of dict rows, and the header line if no header is passed
+        max_size: int | maximum size of a part in bytes, before compression
+        max_messages: int | maximum number of rows or messages per part
+        content_type: str | defaults to utf-8 tab separated values or application/json
+        encoding: str | character encoding of the feed
+        compress: bool | gzip the parts while encrypting them
+        directory: str | directory of the temporary files
+        **feed_kwargs: passed to `Feeds.submit_feed`, e.g. marketplaceIds
+    """
+
+    def __init__(self, feeds, feed_type, format='tsv', header=None, columns=None, max_size=None, max_messages=None,
+                 content_type=None, encoding='utf-8', compress=False, directory=None, **feed_kwargs):
+        if format not in FORMATS:
+            raise ValueError('format must be one of %s' % ', '.join(FORMATS))
+        self.feeds = feeds
+        self.feed_type = feed_type
+        self.format = format
+        self.columns = columns
+        if format == 'tsv' and header is None and columns:
+            header = [columns]
+        self.header = header
+        self.max_size = max_size
+        self.max_messages = max_messages
+        self.encoding = encoding
+        self.content_type = content_type or (
+            'application/json' if format == 'json' else 'text/tab-separated-values; charset=%s' % encoding.upper()
+        )
+        self.compress = compress
+        self.directory = directory
+        self.feed_kwargs = feed_kwargs
+        self.results = []
+        self._file = None
+        self._size = 0
+        self._messages = 0
+        self._suffix = b']}' if format == 'json' else b''
+
+    def _line(self, row):
+        if isinstance(row, str):
+            values = [row]
+        elif isinstance(row, dict):
+            values = [row.get(column) for column in self.columns] if self.columns else list(row.values())
+        else:
+            values = list(row)
+        values = ['' if value is None else str(value) for value in values]
+        if any('\t' in value or '\n' in value or '\r' in value for value in values):
+            raise ValueError('Flat file values must not contain tabs or line breaks: %r' % (row,))
+        return ('\t'.join(values) + '\n').encode(self.encoding)
+
+    def _encode(self, row):
+        if self.format == 'tsv':
+            return self._line(row)
+        if 'messageId' not in row:
+            row = dict(row, messageId=self._messages + 1)
+        data = json.dumps(row, ensure_ascii=False).encode(self.encoding)
+        return data if self._messages == 0 else b',' + data
+
+    def _start_part(self):
+        self._file = tempfile.TemporaryFile(dir=self.directory)
+        if self.format == 'json':
+            prefix = ('{"header": %s, "messages": [' % json.dumps(self.header or {}, ensure_ascii=False))
+            self._file.write(prefix.encode(self.encoding))
+            self._size = len(prefix.encode(self.encoding))
+        else:
+            self._size = 0
+            for line in self.header or []:
+                data = self._line(line)
+                self._file.write(data)
+                self._size += len(data)
+        self._messages = 0
+
+    def _full(self, size):
+        if self.max_messages is not None and self._messages >= self.max_messages:
+            return True
+        return self.max_size is not None and self._size + size + len(self._suffix) > self.max_size
+
+    def write(self, row):
+        """
+        Adds a row (tsv: tuple, list or dict) or a message (json: dict) to the feed
+        """
+        data = self._encode(row) if self._file is not None else None
+        if data is not None and self._messages and self._full(len(data)):
+            self.flush()
+        if self._file is None:
+            # the first message of a part is encoded without separator and numbered 1
+            self._start_part()
+            data = self._encode(row)
+        self._file.write(data)
+        self._size += len(data)
+        self._messages += 1
+
+    def writerows(self, rows):
+        for row in rows:
+            self.write(row)
+
+    def flush(self):
+        """
+        Submits the current part, if it has rows
+        """
+        if self._file is None:
+            return
+        file, self._file = self._file, None
+        try:
+            if not self._messages:
+                return
+            file.write(self._suffix)
+            file.seek(0)
+            log.debug('Submitting %s part %s with %s messages, %s bytes', self.feed_type, len(self.results) + 1,
+                      self._messages, self._size + len(self._suffix))
+            self.results.append(self.submit(file))
+        finally:
+            file.close()
+
+    def submit(self, file):
+        """
+        Submits a complete part, override it to submit the parts differently
+
+        Args:
+            file: binary file object positioned at the part's start
+
+        Returns:
+            the result collected in `results`, by default the responses of `Feeds.submit_feed`
+        """
+        return self.feeds.submit_feed(self.feed_type, file, self.content_type, self.compress, **self.feed_kwargs)
+
+    def close(self):
+        """
+        Submits the last part
+
+        Returns:
+            list: the results of all parts
+        """
+        self.flush()
+        return self.results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        elif self._file is not None:
+            self._file.close()
+            self._file = None
@@ -1,37 +1,193 @@
+import hashlib
+import inspect
+import json
+import logging
+import queue
+import threading
 import time
 
+log = logging.getLogger(__name__)
+
+# seconds a checkpoint is kept, next tokens are not valid forever
+DEFAULT_CHECKPOINT_TTL = 3600
+
 
 def make_sleep_time(rate_limit):
     return 1 / float(rate_limit)
 
 
-def load_all_pages(throttle_by_seconds: float = 2, next_token_param='NextToken', use_rate_limit_header: bool = False):
+def iter_pages(function, args, kwargs, throttle_by_seconds: float = 2, next_token_param='NextToken',
+               use_rate_limit_header: bool = False, next_page_kwargs: dict = None, next_token: str = None):
+    """
+    Iterates over all pages of `function`, one request at a time
+
+    Args:
+        function: the endpoint to call
+        args: positional arguments passed to every call
+        kwargs: keyword arguments passed to the first call, following calls only get the next token
+        throttle_by_seconds: float | seconds to wait between two requests
+        next_token_param: str | The param amazon expects to hold the next token
+        use_rate_limit_header: if the function should try to use amazon's rate limit header
+        next_page_kwargs: dict | additional keyword arguments passed with the next token
+        next_token: str | resume with this token instead of sending `kwargs`
+
+    Returns:
+        generator of ApiResponse
+    """
+    if next_token:
+        res = function(*args, **{**(next_page_kwargs or {}), next_token_param: next_token})
+    else:
+        res = function(*args, **kwargs)
+    yield res
+    while res.next_token:
+        sleep_time = make_sleep_time(res.rate_limit) if use_rate_limit_header and res.rate_limit else throttle_by_seconds
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+        res = function(*args, **{**(next_page_kwargs or {}), next_token_param: res.next_token})
+        yield res
+
+
+def prefetch_pages(pages, prefetch: int = 1):
+    """
+    Loads up to `prefetch` pages of the `pages` generator in a background thread,
+    while the caller processes the current one.
+
+    Exceptions raised while loading a page are raised to the caller.
+    """
+    pages_queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                pages_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def load():
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+        except Exception as e:
+            put((None, e))
+        else:
+            put((done, None))
+        finally:
+            pages.close()
+
+    thread = threading.Thread(target=load, name='sp_api-prefetch', daemon=True)
+    thread.start()
+    try:
+        while True:
+            page, error = pages_queue.get()
+            if error is not None:
+                raise error
+            if page is done:
+                return
+            yield page
+    finally:
+        stop.set()
+
+
+def make_checkpoint_key(function, args, kwargs) -> str:
+    # the instance of a decorated method isn't part of the key, its repr changes from run to run.
+    # Clients stand for their selling partner and marketplace instead
+    parameters = list(inspect.signature(function).parameters)
+    account = None
+    if args and parameters and parameters[0] in ('self', 'cls'):
+        if hasattr(args[0], '_selling_partner_key'):
+            account = [args[0]._selling_partner_key(), getattr(args[0], 'marketplace_id', None)]
+        args = args[1:]
+    query = json.dumps([account, args, kwargs], sort_keys=True, default=str)
+    return '%s.%s:%s' % (function.__module__, function.__qualname__, hashlib.md5(query.encode('utf-8')).hexdigest())
+
+
+def resume_pages(function, args, kwargs, checkpoint_store, checkpoint_key, **options):
+    """
+    Like `iter_pages`, starting from the checkpoint stored under `checkpoint_key` if there is one.
+
+    The checkpoint is only used if it was stored for the same query.
+    If amazon rejects the stored token, pagination starts over from the first page.
+    """
+    from sp_api.base import SellingApiBadRequestException
+    query = json.loads(json.dumps(kwargs, sort_keys=True, default=str))
+    checkpoint = checkpoint_store.get(checkpoint_key)
+    if checkpoint and checkpoint.get('query') == query:
+        log.info('Resuming %s from checkpoint %s', function.__qualname__, checkpoint_key)
+        pages = iter_pages(function, args, kwargs, next_token=checkpoint['next_token'], **options)
+        try:
+            first = next(pages)
+        except SellingApiBadRequestException:
+            log.warning('Checkpoint %s was rejected, starting over', checkpoint_key)
+            checkpoint_store.delete(checkpoint_key)
+            pages = iter_pages(function, args, kwargs, **options)
+            first = next(pages)
+        yield first
+        yield from pages
+    else:
+        yield from iter_pages(function, args, kwargs, **options)
+
+
+def checkpoint_pages(pages, checkpoint_store, checkpoint_key, query, checkpoint_ttl=DEFAULT_CHECKPOINT_TTL):
+    """
+    Stores the next token of every page once the caller is done with it, and removes the checkpoint
+    after the last page.
+
+    Runs in the caller's thread, pages loaded ahead by `prefetch_pages` are not checkpointed before they are processed.
+    """
+    query = json.loads(json.dumps(query, sort_keys=True, default=str))
+    for page in pages:
+        yield page
+        if page.next_token:
+            checkpoint_store.put(checkpoint_key, {
+                'query': query,
+                'next_token': page.next_token,
+                'expires': time.time() + checkpoint_ttl if checkpoint_ttl else None
+            })
+        else:
+            checkpoint_store.delete(checkpoint_key)
+
+
+def load_all_pages(throttle_by_seconds: float = 2, next_token_param='NextToken', use_rate_limit_header: bool = False,
+                   prefetch: int = 0, checkpoint_store=None, checkpoint_key: str = None,
+                   checkpoint_ttl: float = DEFAULT_CHECKPOINT_TTL):
     """
     Load all pages if a next token is returned
 
     Args:
-        throttle_by_seconds: float
+        throttle_by_seconds: float | seconds to wait between two requests, the client's rate limiter applies as well
         next_token_param: str | The param amazon expects to hold the next token
         use_rate_limit_header: if the function should try to use amazon's rate limit header
+        prefetch: int | number of pages to load ahead in a background thread, 0 loads the next page when it's needed
+        checkpoint_store: FileCheckpointStore | SQLiteCheckpointStore | stores the next token after every page,
+            an interrupted run resumes from there
+        checkpoint_key: str | key of the checkpoint, defaults to the function's name and a hash of its arguments.
+            Client methods are keyed per selling partner and marketplace, the instance of other methods isn't hashed
+        checkpoint_ttl: float | seconds a checkpoint stays valid, set it to how long the endpoint's next token is valid
 
     Returns:
         Transforms the function in a generator, returning all pages
     """
     def decorator(function):
         def wrapper(*args, **kwargs):
-            res = function(*args, **kwargs)
-            yield res
-            if res.next_token:
-                kwargs.clear()
-                kwargs.update({next_token_param: res.next_token})
-                sleep_time = make_sleep_time(res.rate_limit) if use_rate_limit_header and res.rate_limit else throttle_by_seconds
-                for x in wrapper(*args, **kwargs):
-                    yield x
-                    if sleep_time > 0:
-                        time.sleep(sleep_time)
+            options = dict(throttle_by_seconds=throttle_by_seconds, next_token_param=next_token_param,
+                           use_rate_limit_header=use_rate_limit_header)
+            if checkpoint_store is None:
+                pages = iter_pages(function, args, kwargs, **options)
+            else:
+                key = checkpoint_key or make_checkpoint_key(function, args, kwargs)
+                pages = resume_pages(function, args, kwargs, checkpoint_store, key, **options)
+            if prefetch > 0:
+                pages = prefetch_pages(pages, prefetch)
+            if checkpoint_store is not None:
+                pages = checkpoint_pages(pages, checkpoint_store, key, kwargs, checkpoint_ttl)
+            return pages
 
         wrapper.__doc__ = function.__doc__
         return wrapper
 
     return decorator
-
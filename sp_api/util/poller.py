@@ -0,0 +1,135 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class PollJob:
+    """
+    A job tracked by a `Poller`, its result is delivered through `future`
+    """
+
+    def __init__(self, interval=None, deadline=None):
+        self.interval = interval
+        self.deadline = deadline
+        self.future = Future()
+        self.future.job = self
+
+
+class Poller:
+    """
+    Checks jobs from a single scheduler thread and leaves the heavy work to a thread pool.
+
+    Jobs are kept in a priority queue ordered by the time of their next check, `_check(job)` is implemented by
+    subclasses. The interval between two checks of a job grows by `backoff` with every `_retry`.
+
+    Args:
+        max_workers: int | size of the thread pool
+        poll_interval: float | seconds until a job is checked again the first time
+        max_poll_interval: float | upper limit of the poll interval
+        backoff: float | factor the poll interval grows by after each check
+        timeout: float | seconds after which a job that isn't done fails with a TimeoutError
+    """
+
+    thread_name_prefix = 'sp_api-poller'
+
+    def __init__(self, max_workers=4, poll_interval=15, max_poll_interval=300, backoff=1.5, timeout=None):
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix=self.thread_name_prefix + '-worker')
+        self._queue = []
+        self._jobs = set()
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = None
+
+    def _start(self, job):
+        """
+        Tracks a new job and checks it right away
+        """
+        job.interval = self.poll_interval
+        job.deadline = time.monotonic() + self.timeout if self.timeout else None
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('Cannot submit jobs after shutdown')
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.thread_name_prefix + '-scheduler',
+                                                daemon=True)
+                self._thread.start()
+            self._jobs.add(job)
+            self._schedule(job, 0)
+        job.future.add_done_callback(lambda future: self._finished(job))
+        return job.future
+
+    def _finished(self, job):
+        with self._condition:
+            self._jobs.discard(job)
+            self._condition.notify()
+
+    def _schedule(self, job, delay):
+        with self._condition:
+            heapq.heappush(self._queue, (time.monotonic() + delay, next(self._counter), job))
+            self._condition.notify()
+
+    def _retry(self, job):
+        job.interval = min(self.max_poll_interval, job.interval * self.backoff)
+        self._schedule(job, job.interval)
+
+    @staticmethod
+    def _fail(job, exception):
+        if not job.future.done():
+            job.future.set_exception(exception)
+
+    def _next_job(self):
+        with self._condition:
+            while True:
+                # jobs running in the pool may come back to the queue, the scheduler stops once all are done
+                if self._closed and not self._jobs:
+                    return None
+                if self._queue and self._queue[0][0] <= time.monotonic():
+                    return heapq.heappop(self._queue)[2]
+                self._condition.wait(self._queue[0][0] - time.monotonic() if self._queue else None)
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            if job.future.done():
+                continue
+            if job.deadline is not None and time.monotonic() > job.deadline:
+                self._fail(job, TimeoutError('%s is not done' % job))
+                continue
+            self._check(job)
+
+    def _check(self, job):
+        raise NotImplementedError
+
+    def shutdown(self, wait=True):
+        """
+        Stops accepting jobs.
+
+        Args:
+            wait: bool | wait until all submitted jobs are done, otherwise pending jobs are cancelled
+        """
+        with self._condition:
+            self._closed = True
+            if not wait:
+                for job in list(self._jobs):
+                    job.future.cancel()
+                self._queue.clear()
+            self._condition.notify()
+        if wait and self._thread is not None:
+            self._thread.join()
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
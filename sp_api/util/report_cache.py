@@ -0,0 +1,289 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+log = logging.getLogger(__name__)
+
+# reports in these states are reused instead of creating a new one
+REUSABLE_STATUSES = ('DONE', 'IN_PROGRESS', 'IN_QUEUE')
+
+
+def _normalize_time(value):
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        try:
+            value = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+        except ValueError:
+            return str(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _marketplace_ids(marketplaces):
+    return sorted(getattr(m, 'marketplace_id', m) for m in marketplaces)
+
+
+class DocumentCache:
+    """
+    Keeps decrypted report documents on disk, utf-8 encoded, one file per key, e.g. the document id.
+
+    The least recently used documents are removed once the files exceed `max_size`, the document written last
+    is kept even if it's larger on its own.
+
+    Args:
+        directory: str | directory holding the documents
+        max_size: int | maximum size of all documents in bytes
+    """
+
+    def __init__(self, directory, max_size=1024 ** 3):
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, hashlib.md5(key.encode('utf-8')).hexdigest() + '.txt')
+
+    def get(self, key):
+        """
+        Returns the path of the cached document, or None
+        """
+        path = self.path(key)
+        try:
+            # the modification time orders the documents for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key, pieces):
+        """
+        Writes the document's pieces to the cache and returns its path
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for piece in pieces:
+                    f.write(piece)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            os.remove(tmp)
+            raise
+        self.evict(keep=key)
+        return self.path(key)
+
+    def evict(self, keep=None):
+        """
+        Removes the least recently used documents until the files fit into `max_size`
+
+        Args:
+            keep: str | key of a document that isn't removed
+        """
+        kept = os.path.basename(self.path(keep)) if keep is not None else None
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.txt'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        size = sum(entry[1] for entry in entries)
+        for _, file_size, name in sorted(entries):
+            if size <= self.max_size:
+                break
+            if name == kept:
+                continue
+            log.debug('Evicting cached document %s', name)
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            size -= file_size
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.txt'):
+                os.remove(os.path.join(self.directory, name))
+
+
+class ReportCache:
+    """
+    Reuses recent reports instead of creating the same report again, and caches their documents on disk.
+
+    `create_report` first looks for a report of the same selling partner with the same type, marketplaces,
+    time window and options in a local index shared by all processes using `directory`, then in `get_reports`. A report that is
+    DONE, IN_PROGRESS or IN_QUEUE and not older than `max_age` is reused.
+    Amazon doesn't return the report options, so reports found with `get_reports` are only reused if they
+    were created through the index with the same options. Without a time window, only reports without one match.
+
+    Every other attribute is the wrapped client's, so the cache can replace the client, e.g. in `ReportJobManager`.
+
+    Examples:
+        reports = ReportCache(Reports(Marketplaces.DE), '/var/cache/sp_api')
+        report_id = reports.create_report(reportType=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA).payload['reportId']
+
+    Args:
+        client: Reports | the client creating and loading reports
+        directory: str | directory of the index and the documents
+        max_age: float | seconds a report is reused after it was created
+        max_size: int | maximum size of the cached documents in bytes
+    """
+
+    def __init__(self, client, directory, max_age=3600, max_size=1024 ** 3):
+        self.client = client
+        self.directory = directory
+        self.max_age = max_age
+        self.documents = DocumentCache(os.path.join(directory, 'documents'), max_size)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.path.join(directory, 'reports.db'), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS reports (key TEXT PRIMARY KEY, report_id TEXT, created REAL)'
+            )
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS report_options (report_id TEXT PRIMARY KEY, options TEXT, created REAL)'
+            )
+
+    def __getattr__(self, item):
+        if item == 'client':
+            raise AttributeError(item)
+        return getattr(self.client, item)
+
+    def _query(self, kwargs):
+        return {
+            'sellingPartner': self.client._selling_partner_key(),
+            'reportType': getattr(kwargs.get('reportType'), 'value', kwargs.get('reportType')),
+            'marketplaceIds': _marketplace_ids(kwargs.get('marketplaceIds') or [self.client.marketplace_id]),
+            'dataStartTime': _normalize_time(kwargs.get('dataStartTime')),
+            'dataEndTime': _normalize_time(kwargs.get('dataEndTime')),
+            'reportOptions': kwargs.get('reportOptions') or None,
+        }
+
+    @staticmethod
+    def _key(query):
+        return hashlib.md5(json.dumps(query, sort_keys=True).encode('utf-8')).hexdigest()
+
+    @contextmanager
+    def _file_lock(self):
+        # serializes lookup and creation between the processes sharing the directory
+        import fcntl
+        with open(os.path.join(self.directory, 'reports.lock'), 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+    def _indexed_report(self, key):
+        from sp_api.base import SellingApiBadRequestException, SellingApiForbiddenException, \
+            SellingApiNotFoundException
+        with self._lock:
+            row = self._connection.execute('SELECT report_id, created FROM reports WHERE key = ?', (key,)).fetchone()
+        if row is None or row[1] < time.time() - self.max_age:
+            return None
+        try:
+            report = self.client.get_report(row[0]).payload
+        except (SellingApiBadRequestException, SellingApiForbiddenException, SellingApiNotFoundException) as e:
+            log.warning('Indexed report %s is not available: %s', row[0], e)
+            return None
+        if report.get('processingStatus') in REUSABLE_STATUSES:
+            return report
+        return None
+
+    @staticmethod
+    def _options(query):
+        return json.dumps(query['reportOptions'], sort_keys=True)
+
+    def _listed_report(self, query):
+        created_since = datetime.now(timezone.utc) - timedelta(seconds=self.max_age)
+        reports = self.client.get_reports(reportTypes=[query['reportType']],
+                                          processingStatuses=list(REUSABLE_STATUSES),
+                                          marketplaceIds=query['marketplaceIds'],
+                                          createdSince=created_since.isoformat()).payload.get('reports', [])
+        for report in reports:
+            if _marketplace_ids(report.get('marketplaceIds', [])) != query['marketplaceIds']:
+                continue
+            if any(_normalize_time(report.get(k)) != query[k] for k in ('dataStartTime', 'dataEndTime')):
+                continue
+            with self._lock:
+                row = self._connection.execute('SELECT options FROM report_options WHERE report_id = ?',
+                                               (report.get('reportId'),)).fetchone()
+            if row is None or row[0] != self._options(query):
+                continue
+            return report
+        return None
+
+    def _index(self, key, report_id, options):
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute('INSERT OR REPLACE INTO reports (key, report_id, created) VALUES (?, ?, ?)',
+                                     (key, report_id, now))
+            self._connection.execute('DELETE FROM report_options WHERE created < ?', (now - self.max_age,))
+            self._connection.execute(
+                'INSERT OR IGNORE INTO report_options (report_id, options, created) VALUES (?, ?, ?)',
+                (report_id, options, now)
+            )
+
+    def create_report(self, **kwargs):
+        """
+        create_report(self, **kwargs) -> ApiResponse
+
+        Returns a matching recent report, or creates one. Takes the arguments of `Reports.create_report`.
+
+        Returns:
+            ApiResponse: the payload holds the reportId, and `reused` if an existing report was found
+        """
+        from sp_api.base import ApiResponse
+        query = self._query(kwargs)
+        key = self._key(query)
+        with self._file_lock():
+            report = self._indexed_report(key) or self._listed_report(query)
+            if report is not None:
+                log.info('Reusing report %s', report.get('reportId'))
+                self._index(key, report.get('reportId'), self._options(query))
+                return ApiResponse(payload={'reportId': report.get('reportId'), 'reused': True})
+            res = self.client.create_report(**kwargs)
+            self._index(key, res.payload.get('reportId'), self._options(query))
+            return res
+
+    def get_report_document(self, document_id, decrypt: bool = False, file=None,
+                            character_code: str = 'iso-8859-1', **kwargs):
+        """
+        get_report_document(self, document_id, decrypt: bool = False, file=None, character_code: str = 'iso-8859-1', **kwargs) -> ApiResponse
+
+        Like `Reports.get_report_document`, decrypted documents are served from the disk cache,
+        per document and `character_code`. With `stream` or `output`, the call is passed to the client uncached.
+        """
+        from sp_api.base import ApiResponse
+        if not decrypt or kwargs.get('stream') or kwargs.get('output'):
+            return self.client.get_report_document(document_id, decrypt=decrypt, file=file,
+                                                   character_code=character_code, **kwargs)
+        key = '%s:%s' % (document_id, character_code.lower())
+        path = self.documents.get(key)
+        payload = {'reportDocumentId': document_id}
+        if path is None:
+            res = self.client.get_report_document(document_id)
+            payload = res.payload
+            path = self.documents.put(key, self.client.stream_report_document(res.payload, character_code))
+        if file:
+            self._copy(path, file, character_code)
+        with open(path, encoding='utf-8') as f:
+            payload['document'] = f.read()
+        return ApiResponse(payload=payload)
+
+    @staticmethod
+    def _copy(path, file, character_code):
+        with open(path, encoding='utf-8') as source:
+            if isinstance(file, str):
+                with open(file, 'w', encoding=character_code) as target:
+                    shutil.copyfileobj(source, target)
+            else:
+                shutil.copyfileobj(source, file)
@@ -0,0 +1,170 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .poller import PollJob, Poller
+
+log = logging.getLogger(__name__)
+
+
+class ReportJobError(Exception):
+    """
+    Raised by a report job's future if the report was cancelled or failed
+
+    Parameters:
+
+        report: dict The report, as returned by get_report
+    """
+
+    def __init__(self, report):
+        self.report = report
+        super().__init__('Report %s finished with status %s' % (report.get('reportId'), report.get('processingStatus')))
+
+
+class ReportJob(PollJob):
+    """
+    A report tracked by `ReportJobManager`
+    """
+
+    def __init__(self, client, create_kwargs, document_kwargs, report_id=None):
+        super().__init__()
+        self.client = client
+        self.create_kwargs = create_kwargs
+        self.document_kwargs = document_kwargs
+        self.report_id = report_id
+        self.report = None
+
+    def __str__(self):
+        return 'Report %s' % self.report_id
+
+
+class ReportJobManager(Poller):
+    """
+    Creates reports, polls them from a single scheduler thread and downloads their documents concurrently.
+
+    Reports are created one at a time on their own thread, `create_report` waits for its rate limit there
+    without holding up the checks and downloads of other reports.
+
+    Jobs are kept in a priority queue ordered by the time of their next check. The poll interval of a report
+    grows by `backoff` with every check until it's done, so long running reports don't use up the `get_report`
+    budget. Finished documents are downloaded by a thread pool, every job's result is a future.
+
+    Examples:
+        with ReportJobManager() as manager:
+            futures = [
+                manager.submit(ReportType.GET_MERCHANT_LISTINGS_ALL_DATA, marketplace=marketplace)
+                for marketplace in (Marketplaces.DE, Marketplaces.FR)
+            ]
+            documents = [future.result().payload['document'] for future in futures]
+
+    Args:
+        max_workers: int | number of concurrent downloads
+        poll_interval: float | seconds until a new report is checked the first time
+        max_poll_interval: float | upper limit of the poll interval
+        backoff: float | factor the poll interval grows by after each check
+        timeout: float | seconds after which a report that isn't done fails with a TimeoutError
+        client_class: the client used to create and load reports, defaults to `sp_api.api.Reports`
+        **client_kwargs: passed to every client, e.g. `transport`
+    """
+
+    thread_name_prefix = 'sp_api-report'
+
+    def __init__(self, max_workers=4, poll_interval=15, max_poll_interval=300, backoff=1.5, timeout=None,
+                 client_class=None, **client_kwargs):
+        if client_class is None:
+            from sp_api.api import Reports
+            client_class = Reports
+        self.client_class = client_class
+        self.client_kwargs = client_kwargs
+        self._clients = {}
+        self._creator = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.thread_name_prefix + '-create')
+        super().__init__(max_workers, poll_interval, max_poll_interval, backoff, timeout)
+
+    def client(self, marketplace=None, account='default', credentials=None, refresh_token=None):
+        """
+        Returns the client of the marketplace and account, clients are created once and reused
+        """
+        key = (marketplace, account, refresh_token, tuple(sorted(credentials.items())) if credentials else None)
+        if key not in self._clients:
+            kwargs = dict(self.client_kwargs, account=account, credentials=credentials, refresh_token=refresh_token)
+            if marketplace is not None:
+                kwargs['marketplace'] = marketplace
+            self._clients[key] = self.client_class(**kwargs)
+        return self._clients[key]
+
+    def submit(self, report_type=None, *, marketplace=None, account='default', credentials=None, refresh_token=None,
+               report_id=None, document_kwargs=None, **kwargs) -> Future:
+        """
+        Submits a report, the future's result is the ApiResponse of `get_report_document`
+
+        Args:
+            report_type: ReportType | the report to create
+            marketplace: Marketplaces | the client's marketplace
+            account: str | the client's account
+            credentials: dict | the client's credentials
+            refresh_token: str | the client's refresh token
+            report_id: str | track an existing report instead of creating one
+            document_kwargs: dict | passed to `get_report_document`, defaults to `decrypt=True`
+            **kwargs: passed to `create_report`, e.g. `dataStartTime`
+
+        Returns:
+            Future
+        """
+        if report_type is None and report_id is None:
+            raise ValueError('Pass report_type or report_id')
+        if report_type is not None:
+            kwargs['reportType'] = report_type
+        job = ReportJob(self.client(marketplace, account, credentials, refresh_token), kwargs,
+                        {'decrypt': True} if document_kwargs is None else document_kwargs,
+                        report_id=report_id)
+        return self._start(job)
+
+    def _check(self, job):
+        from sp_api.base import ProcessingStatus, SellingApiRequestThrottledException
+        if job.report_id is None:
+            self._creator.submit(self._create, job)
+            return
+        try:
+            job.report = job.client.get_report(job.report_id).payload
+        except SellingApiRequestThrottledException:
+            self._retry(job)
+            return
+        except Exception as e:
+            self._fail(job, e)
+            return
+        status = job.report.get('processingStatus')
+        if status == ProcessingStatus.DONE:
+            self._executor.submit(self._download, job)
+        elif status in (ProcessingStatus.CANCELLED, ProcessingStatus.FATAL):
+            self._fail(job, ReportJobError(job.report))
+        else:
+            self._retry(job)
+
+    def _create(self, job):
+        from sp_api.base import SellingApiRequestThrottledException
+        if job.future.done():
+            return
+        try:
+            res = job.client.create_report(**job.create_kwargs)
+        except SellingApiRequestThrottledException:
+            self._retry(job)
+            return
+        except Exception as e:
+            self._fail(job, e)
+            return
+        job.report_id = res.payload.get('reportId')
+        log.debug('Created report %s', job.report_id)
+        self._schedule(job, job.interval)
+
+    def _download(self, job):
+        if not job.future.set_running_or_notify_cancel():
+            return
+        try:
+            job.future.set_result(
+                job.client.get_report_document(job.report.get('reportDocumentId'), **job.document_kwargs)
+            )
+        except Exception as e:
+            job.future.set_exception(e)
+
+    def shutdown(self, wait=True):
+        super().shutdown(wait)
+        self._creator.shutdown(wait=wait)
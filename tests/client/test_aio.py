@@ -0,0 +1,91 @@
+import asyncio
+import json
+
+from sp_api.aio import api as aio_api, Client
+from sp_api.api import Orders
+
+credentials = dict(
+    refresh_token='Atzr|refresh',
+    lwa_app_id='amzn1.application-oa2-client.app',
+    lwa_client_secret='secret',
+    aws_access_key='AKIAEXAMPLE',
+    aws_secret_key='aws-secret',
+    role_arn='arn:aws:iam::123456789012:role/sp-api'
+)
+
+role = {'AccessKeyId': 'ASIAEXAMPLE', 'SecretAccessKey': 'role-secret', 'SessionToken': 'session'}
+
+
+class FakeResponse:
+    def __init__(self, status, content):
+        self.status = status
+        self.headers = {'x-amzn-RateLimit-Limit': '1.0'}
+        self._content = content
+
+    async def json(self, content_type=None):
+        return self._content
+
+
+class FakeTransport:
+    def __init__(self, content, status=200):
+        self.content = content
+        self.status = status
+        self.requests = []
+
+    async def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        return FakeResponse(self.status, self.content)
+
+
+def make_client(monkeypatch, transport):
+    monkeypatch.setattr(Client, 'role', property(lambda self: role))
+    return aio_api.Orders(credentials=credentials, restricted_data_token='Atz.sprdt', transport=transport)
+
+
+def test_aio_endpoint_classes():
+    assert issubclass(aio_api.Orders, Orders)
+    assert issubclass(aio_api.Orders, Client)
+    assert aio_api.Orders.get_orders.path == Orders.get_orders.path
+    assert aio_api.Orders is aio_api.Orders
+
+
+def test_aio_get_orders(monkeypatch):
+    transport = FakeTransport({'payload': {'Orders': [], 'NextToken': 'abc'}})
+    client = make_client(monkeypatch, transport)
+
+    res = asyncio.run(client.get_orders(CreatedAfter='TEST_CASE_200'))
+
+    assert res.next_token == 'abc'
+    assert res.rate_limit == '1.0'
+    method, url, kwargs = transport.requests[0]
+    assert method == 'GET'
+    assert url.startswith(client.endpoint + '/orders/v0/orders?')
+    assert 'CreatedAfter=TEST_CASE_200' in url
+    assert 'Authorization' in kwargs['headers']
+    assert kwargs['headers']['x-amz-access-token'] == 'Atz.sprdt'
+
+
+def test_aio_post_body(monkeypatch):
+    transport = FakeTransport({'payload': {'reportId': 'ID323'}})
+    monkeypatch.setattr(Client, 'role', property(lambda self: role))
+    client = aio_api.Reports(credentials=credentials, restricted_data_token='Atz.sprdt', transport=transport)
+
+    res = asyncio.run(client.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA'))
+
+    assert res.payload.get('reportId') == 'ID323'
+    method, url, kwargs = transport.requests[0]
+    assert method == 'POST'
+    assert json.loads(kwargs['data'])['reportType'] == 'GET_MERCHANT_LISTINGS_ALL_DATA'
+
+
+def test_aio_error(monkeypatch):
+    from sp_api.base import SellingApiBadRequestException
+    transport = FakeTransport({'errors': [{'code': 'InvalidInput', 'message': 'bad'}]}, status=400)
+    client = make_client(monkeypatch, transport)
+    try:
+        asyncio.run(client.get_order('bad-id'))
+    except SellingApiBadRequestException as br:
+        assert br.code == 400
+        assert br.amzn_code == 'InvalidInput'
+    else:
+        assert False
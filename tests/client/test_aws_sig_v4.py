@@ -0,0 +1,180 @@
+import asyncio
+import datetime
+import hashlib
+import hmac
+
+import pytest
+
+from sp_api.base import aws_sig_v4
+from sp_api.base.aws_sig_v4 import AWSSigV4, EMPTY_PAYLOAD_HASH, canonical_query, signing_key
+from sp_api.base.helpers import fill_query_params
+
+# request and signatures of the AWS Signature Version 4 test suite
+SECRET = 'wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY'
+
+
+@pytest.fixture
+def signer(monkeypatch):
+    monkeypatch.setattr(aws_sig_v4, '_utcnow', lambda: datetime.datetime(2015, 8, 30, 12, 36, 0))
+    return AWSSigV4('service', aws_access_key_id='AKIDEXAMPLE', aws_secret_access_key=SECRET, region='us-east-1')
+
+
+def signature(headers):
+    return headers['Authorization'].rsplit('Signature=', 1)[1]
+
+
+def test_get_vanilla(signer):
+    headers = signer.get_auth_headers('GET', 'https://example.amazonaws.com/')
+    assert headers['x-amz-date'] == '20150830T123600Z'
+    assert headers['Authorization'].startswith(
+        'AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/20150830/us-east-1/service/aws4_request, '
+        'SignedHeaders=host;x-amz-date, ')
+    assert signature(headers) == '5fa00fa31553b73ebf1942676e86291e8372ff2a2260956d9b8aae1d763fbf31'
+
+
+def test_get_vanilla_query_order(signer):
+    headers = signer.get_auth_headers('GET', 'https://example.amazonaws.com/?Param2=value2&Param1=value1')
+    assert signature(headers) == 'b97d918cfa904a5beff61c982a1b6f458b799221646efd99d3219ec94cdf2500'
+
+
+def test_session_token(signer):
+    signer.aws_session_token = 'token'
+    headers = signer.get_auth_headers('GET', 'https://sellingpartnerapi-eu.amazon.com/orders/v0/orders'
+                                             '?MarketplaceIds=A1PA6795UKMFR9&CreatedAfter=2020-01-01')
+    assert 'SignedHeaders=host;x-amz-date;x-amz-security-token,' in headers['Authorization']
+    assert headers['x-amz-security-token'] == 'token'
+    assert signature(headers) == '43b36ce35f4a21eab5e4e21294322cb00ab4d81026f3f8c0deb859e651c39f67'
+
+
+def test_signing_key_cached(signer):
+    signing_key.cache_clear()
+    signer.get_auth_headers('GET', 'https://example.amazonaws.com/')
+    signer.get_auth_headers('POST', 'https://example.amazonaws.com/', b'{}')
+    info = signing_key.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+    key = aws_sig_v4.sign_msg(('AWS4' + SECRET).encode('utf-8'), '20150830')
+    for msg in ('us-east-1', 'service', 'aws4_request'):
+        key = aws_sig_v4.sign_msg(key, msg)
+    assert signing_key(SECRET, '20150830', 'us-east-1', 'service') == key
+
+
+def test_empty_payload_hash():
+    assert EMPTY_PAYLOAD_HASH == 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'
+
+
+def test_canonical_query():
+    assert canonical_query({}) == ''
+    assert canonical_query({
+        'ItemType': 'Sku', 'Skus': 'sku+1,sku%2', 'MarketplaceIds': ['B', 'A'], 'NextToken': None, 'Query': 'a b*~',
+    }) == 'ItemType=Sku&MarketplaceIds=A&MarketplaceIds=B&Query=a%20b%2A~&Skus=sku%2B1%2Csku%252'
+
+
+def test_get_auth_headers_reencodes_query(signer):
+    # form encoded urls, as built by requests, are signed like their canonical form
+    assert signature(signer.get_auth_headers('GET', 'https://example.amazonaws.com/?b=x+y&a=1%2C2')) == \
+        signature(signer.get_request_auth_headers('GET', 'example.amazonaws.com', '/', 'a=1%2C2&b=x%20y'))
+
+
+def sign_canonical_request(canonical_request):
+    string_to_sign = 'AWS4-HMAC-SHA256\n20150830T123600Z\n20150830/us-east-1/service/aws4_request\n' + \
+        hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()
+    key = signing_key(SECRET, '20150830', 'us-east-1', 'service')
+    return hmac.new(key, string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+def test_fill_query_params():
+    assert fill_query_params('/listings/2021-08-01/items/{}/{}', 'S1', 'my sku+x/1') == \
+        '/listings/2021-08-01/items/S1/my%20sku%2Bx%2F1'
+    assert fill_query_params('/items/{}', '100%,ä~') == '/items/100%25%2C%C3%A4~'
+
+
+def test_path_encoded_twice(signer):
+    # all services but S3 sign the sent path encoded a second time
+    path = fill_query_params('/listings/2021-08-01/items/S1/{}', 'my sku+x%ä')
+    canonical_request = ('GET\n/listings/2021-08-01/items/S1/my%2520sku%252Bx%2525%25C3%25A4\n\n'
+                         'host:example.amazonaws.com\nx-amz-date:20150830T123600Z\n\nhost;x-amz-date\n'
+                         + EMPTY_PAYLOAD_HASH)
+    headers = signer.get_request_auth_headers('GET', 'example.amazonaws.com', path)
+    assert signature(headers) == sign_canonical_request(canonical_request)
+    assert signature(signer.get_auth_headers('GET', 'https://example.amazonaws.com' + path)) == signature(headers)
+
+
+class SigningTransport:
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        return SigningResponse()
+
+
+class SigningResponse:
+    status_code = 200
+    headers = {}
+
+    def json(self):
+        return {'payload': {}}
+
+
+def test_client_sends_signed_query(monkeypatch, signer):
+    from sp_api.api import Products
+    from sp_api.base import Client, Marketplaces, RateLimiter
+    from tests.client.test_aio import credentials
+
+    monkeypatch.setattr(Client, 'role', property(lambda self: {
+        'AccessKeyId': 'AKIDEXAMPLE', 'SecretAccessKey': SECRET, 'SessionToken': 'token'
+    }))
+    transport = SigningTransport()
+    client = Products(marketplace=Marketplaces.DE, credentials=credentials, restricted_data_token='Atz.sprdt',
+                      transport=transport, rate_limiter=RateLimiter())
+    client.get_product_pricing_for_skus(['sku 1', 'sku,2'])
+
+    method, url, kwargs = transport.requests[0]
+    path, query = url[len(client.endpoint):].split('?')
+    assert query == 'ItemType=Sku&MarketplaceId=A1PA6795UKMFR9&Skus=sku%2B1%2Csku%252C2'
+    assert 'params' not in kwargs and 'auth' not in kwargs
+    expected = AWSSigV4('execute-api', aws_access_key_id='AKIDEXAMPLE', aws_secret_access_key=SECRET,
+                        aws_session_token='token', region=client.region)
+    assert kwargs['headers']['Authorization'] == expected.get_auth_headers(method, url)['Authorization']
+
+
+def listings_client(monkeypatch, client_class, transport):
+    from sp_api.base import Client, Marketplaces, RateLimiter
+    from tests.client.test_aio import credentials
+
+    monkeypatch.setattr(Client, 'role', property(lambda self: {
+        'AccessKeyId': 'AKIDEXAMPLE', 'SecretAccessKey': SECRET, 'SessionToken': 'token'
+    }))
+    return client_class(marketplace=Marketplaces.DE, credentials=credentials, restricted_data_token='Atz.sprdt',
+                        transport=transport, rate_limiter=RateLimiter())
+
+
+def expected_authorization(client, method, url):
+    expected = AWSSigV4('execute-api', aws_access_key_id='AKIDEXAMPLE', aws_secret_access_key=SECRET,
+                        aws_session_token='token', region=client.region)
+    return expected.get_auth_headers(method, url)['Authorization']
+
+
+def test_client_sends_encoded_path(monkeypatch, signer):
+    from sp_api.api import ListingsItems
+
+    transport = SigningTransport()
+    client = listings_client(monkeypatch, ListingsItems, transport)
+    client.get_listings_item('S1', 'my sku+x/1')
+
+    method, url, kwargs = transport.requests[0]
+    assert url.split('?')[0] == client.endpoint + '/listings/2021-08-01/items/S1/my%20sku%2Bx%2F1'
+    assert kwargs['headers']['Authorization'] == expected_authorization(client, method, url)
+
+
+def test_aio_client_sends_encoded_path(monkeypatch, signer):
+    from sp_api.aio import api as aio_api
+    from tests.client.test_aio import FakeTransport
+
+    transport = FakeTransport({'payload': {}})
+    client = listings_client(monkeypatch, aio_api.ListingsItems, transport)
+    asyncio.run(client.get_listings_item('S1', 'my sku+x'))
+
+    method, url, kwargs = transport.requests[0]
+    assert url.split('?')[0] == client.endpoint + '/listings/2021-08-01/items/S1/my%20sku%2Bx'
+    assert kwargs['headers']['Authorization'] == expected_authorization(client, method, url)
@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from sp_api.base import CredentialProvider
+
+config = '''
+{account}:
+  refresh_token: Atzr|{account}
+  lwa_app_id: amzn1.application-oa2-client.{version}
+  lwa_client_secret: secret
+  aws_access_key: AKIAEXAMPLE
+  aws_secret_key: aws-secret
+  role_arn: arn:aws:iam::123456789012:role/sp-api
+'''
+
+
+@pytest.fixture
+def config_file(monkeypatch, tmp_path):
+    for key in list(os.environ):
+        if key.startswith(('SP_API_', 'LWA_')):
+            monkeypatch.delenv(key)
+    monkeypatch.setenv('PYTHON-SP-APIDIR', str(tmp_path))
+    path = tmp_path / 'credentials.yml'
+    path.write_text(config.format(account='default', version=1) + config.format(account='other', version=1))
+    reads = []
+    read_config = CredentialProvider.read_config
+    monkeypatch.setattr(CredentialProvider, 'read_config', lambda self: reads.append(self.account) or read_config(self))
+    CredentialProvider.reload()
+    yield path, reads
+    CredentialProvider.reload()
+
+
+def test_credentials_cached_per_account(config_file):
+    path, reads = config_file
+    for _ in range(3):
+        assert CredentialProvider().credentials.refresh_token == 'Atzr|default'
+        assert CredentialProvider('other').credentials.refresh_token == 'Atzr|other'
+    assert reads == ['default', 'other']
+
+
+def test_credentials_reloaded_on_change(config_file, monkeypatch):
+    path, reads = config_file
+    monkeypatch.setattr(CredentialProvider, 'config_check_interval', 0)
+    assert CredentialProvider().credentials.lwa_app_id.endswith('.1')
+    path.write_text(config.format(account='default', version=2))
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 10 ** 9))
+    assert CredentialProvider().credentials.lwa_app_id.endswith('.2')
+    assert CredentialProvider().credentials.lwa_app_id.endswith('.2')
+    assert reads == ['default', 'default']
+
+
+def test_credentials_reload(config_file):
+    path, reads = config_file
+    CredentialProvider()
+    CredentialProvider('other')
+    CredentialProvider.reload('default')
+    CredentialProvider()
+    CredentialProvider('other')
+    assert reads == ['default', 'other', 'default']
+
+
+def test_environment_takes_precedence(config_file, monkeypatch):
+    path, reads = config_file
+    CredentialProvider()
+    for key, value in dict(SP_API_REFRESH_TOKEN='Atzr|env', LWA_APP_ID='app', LWA_CLIENT_SECRET='secret',
+                           SP_API_ACCESS_KEY='key', SP_API_SECRET_KEY='secret', SP_API_ROLE_ARN='arn').items():
+        monkeypatch.setenv(key, value)
+    assert CredentialProvider().credentials.refresh_token == 'Atzr|env'
@@ -0,0 +1,147 @@
+import asyncio
+import gzip
+from contextlib import asynccontextmanager
+
+import pytest
+
+from sp_api.api import Feeds
+from sp_api.aio import api as aio_api, Client as AsyncClient
+from sp_api.base import Client, RateLimiter
+from sp_api.base.processing_report import ProcessingReportParser, parse_processing_report
+from tests.client.test_aio import credentials, role, FakeResponse as AsyncFakeResponse
+from tests.client.test_report_stream import encrypt, chunked, document, StreamResponse
+from tests.test_feed_pipeline import xml_report, json_report, flat_file_report
+
+large_xml_report = (
+    '<?xml version="1.0" encoding="UTF-8"?><AmazonEnvelope><MessageType>ProcessingReport</MessageType>'
+    '<Message><MessageID>1</MessageID><ProcessingReport><DocumentTransactionID>7</DocumentTransactionID>'
+    '<StatusCode>Complete</StatusCode><ProcessingSummary><MessagesProcessed>20000</MessagesProcessed>'
+    '<MessagesSuccessful>0</MessagesSuccessful><MessagesWithError>20000</MessagesWithError>'
+    '<MessagesWithWarning>0</MessagesWithWarning></ProcessingSummary>'
+    + ''.join('<Result><MessageID>%s</MessageID><ResultCode>Error</ResultCode><ResultMessageCode>8560'
+              '</ResultMessageCode><ResultDescription>Größe fehlt</ResultDescription></Result>' % i
+              for i in range(1, 20001))
+    + '</ProcessingReport></Message></AmazonEnvelope>'
+)
+
+
+@pytest.mark.parametrize('content', [xml_report, json_report, flat_file_report])
+@pytest.mark.parametrize('size', [1, 7, 4096])
+def test_processing_report_parser_chunks(content, size):
+    expected = parse_processing_report(content)
+    parser = ProcessingReportParser()
+    issues = list(parser.iter(chunked(content.encode('utf-8'), size)))
+    assert issues == expected['issues']
+    assert parser.summary == expected['summary']
+    assert parser.header == expected['header']
+
+
+def test_processing_report_parser_declared_encoding():
+    content = xml_report.replace('UTF-8', 'ISO-8859-1').encode('iso-8859-1')
+    issues = list(ProcessingReportParser().iter(chunked(content, 5)))
+    assert issues[1]['message'] == 'Größe is ignored'
+
+
+def test_processing_report_parser_flat_file_encoding():
+    content = flat_file_report.replace('The price', 'Der Preis für').encode('iso-8859-1')
+    issues = list(ProcessingReportParser().iter(chunked(content, 5)))
+    assert issues[0]['message'] == 'Der Preis für is missing'
+
+
+def test_processing_report_parser_flat_file_falls_back():
+    rows = ''.join('%s\t\t5000\tError\tThe price is missing\n' % i for i in range(1, 3000))
+    content = flat_file_report + rows + '3000\t\t5000\tError\tGröße\n'
+    expected = parse_processing_report(content)
+    issues = list(ProcessingReportParser(sample_size=16 * 1024).iter(chunked(content.encode('iso-8859-1'), 16 * 1024)))
+    assert issues[-1]['message'] == 'Größe'
+    assert issues == expected['issues']
+
+
+def test_processing_report_parser_drops_results():
+    parser = ProcessingReportParser()
+    content = large_xml_report.encode('utf-8')
+    end = content.index(b'</ProcessingReport>')
+    assert sum(1 for _ in parser.feed(content[:end])) == 20000
+    # parsed results are removed from the tree
+    assert not any(element.tag == 'Result' for element in parser._report._stack[0].iter())
+    assert list(parser.feed(content[end:])) == []
+    assert list(parser.close()) == []
+    assert parser.summary == {'messagesProcessed': 20000, 'messagesAccepted': 0, 'errors': 20000, 'warnings': 0}
+
+
+def test_processing_report_parser_json_issues_streamed():
+    parser = ProcessingReportParser()
+    content = json_report.encode('utf-8')
+    # the first issue is complete before the summary arrives
+    cut = content.index(b'"summary"')
+    assert [issue['messageId'] for issue in parser.feed(content[:cut])] == [2]
+    assert list(parser.feed(content[cut:])) == []
+    assert list(parser.close()) == []
+    assert parser.summary['messagesInvalid'] == 1
+
+
+def test_processing_report_parser_truncated_json():
+    with pytest.raises(ValueError):
+        parse_processing_report(json_report[:-20])
+
+
+def result_feeds(monkeypatch, content):
+    class ResultTransport:
+        def request(self, method, url, stream=False, **kwargs):
+            if url.startswith('https://tortuga'):
+                assert stream
+                return StreamResponse(encrypt(gzip.compress(content)))
+            return StreamResponse({'payload': document(True)})
+
+    monkeypatch.setattr(Client, 'role', property(lambda self: role))
+    return Feeds(credentials=credentials, restricted_data_token='Atz.sprdt', transport=ResultTransport(),
+                 rate_limiter=RateLimiter())
+
+
+def test_iter_feed_result_issues(monkeypatch):
+    feeds = result_feeds(monkeypatch, large_xml_report.encode('utf-8'))
+    parser = ProcessingReportParser()
+    issues = feeds.iter_feed_result_issues('doc', parser=parser)
+    assert next(issues) == {'messageId': 1, 'code': '8560', 'severity': 'ERROR', 'message': 'Größe fehlt'}
+    assert sum(1 for _ in issues) == 19999
+    assert parser.header == {'documentTransactionId': '7', 'statusCode': 'Complete'}
+
+
+def test_get_feed_processing_report(monkeypatch):
+    feeds = result_feeds(monkeypatch, flat_file_report.encode('utf-8'))
+    report = feeds.get_feed_processing_report('doc')
+    assert report == parse_processing_report(flat_file_report)
+
+
+def test_get_feed_result_document(monkeypatch):
+    feeds = result_feeds(monkeypatch, xml_report.encode('utf-8'))
+    # utf-8 results are no longer decoded as iso-8859-1
+    assert feeds.get_feed_result_document('doc') == xml_report
+
+
+def test_aio_iter_feed_result_issues(monkeypatch):
+    class StreamContent:
+        async def iter_chunked(self, size):
+            for chunk in chunked(encrypt(gzip.compress(json_report.encode('utf-8'))), 10):
+                yield chunk
+
+    class AsyncResultTransport:
+        async def request(self, method, url, **kwargs):
+            return AsyncFakeResponse(200, {'payload': document(True)})
+
+        @asynccontextmanager
+        async def stream(self, method, url, **kwargs):
+            response = AsyncFakeResponse(200, None)
+            response.content = StreamContent()
+            yield response
+
+    monkeypatch.setattr(AsyncClient, 'role', property(lambda self: role))
+    client = aio_api.Feeds(credentials=credentials, restricted_data_token='Atz.sprdt',
+                           transport=AsyncResultTransport(), rate_limiter=RateLimiter())
+
+    async def issues():
+        return [issue async for issue in client.iter_feed_result_issues('doc')]
+
+    assert asyncio.run(issues()) == parse_processing_report(json_report)['issues']
+    assert asyncio.run(client.get_feed_processing_report('doc')) == parse_processing_report(json_report)
+    assert asyncio.run(client.get_feed_result_document('doc')) == json_report
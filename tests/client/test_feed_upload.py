@@ -0,0 +1,137 @@
+import asyncio
+import gzip
+import io
+
+import pytest
+
+from sp_api.api import Feeds
+from sp_api.aio import api as aio_api, Client as AsyncClient
+from sp_api.base import Client, RateLimiter
+from sp_api.base.helpers import encrypt_aes, encrypt_aes_stream, decrypt_aes, encrypted_size
+from tests.client.test_aio import credentials, role, FakeResponse as AsyncFakeResponse
+from tests.client.test_report_stream import key, iv
+
+feed = ''.join('sku-%s\t%s\t3\n' % (i, i) for i in range(20000))
+
+
+class ReadCounter(io.BytesIO):
+    max_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.max_read = max(self.max_read, len(data))
+        return data
+
+
+def test_encrypted_size():
+    assert [encrypted_size(n) for n in (0, 1, 15, 16, 17)] == [16, 16, 16, 32, 32]
+
+
+def test_encrypt_aes_stream_binary():
+    file = ReadCounter(feed.encode('iso-8859-1'))
+    stream = encrypt_aes_stream(file, key, iv, chunk_size=1000)
+    body = stream.read()
+    assert len(body) == len(stream)
+    assert body == encrypt_aes(io.BytesIO(feed.encode('iso-8859-1')), key, iv)
+    # read while uploading, chunk by chunk
+    assert file.max_read == 1000
+
+
+@pytest.mark.parametrize('content, encoding', [(feed, 'iso-8859-1'), (feed + 'Größe\n', 'iso-8859-1'),
+                                               (feed + '€ 日本\n', 'utf-8')])
+def test_encrypt_aes_stream_text(tmp_path, content, encoding):
+    path = tmp_path / 'feed.txt'
+    path.write_text(content, encoding='utf-8')
+    with open(path, encoding='utf-8') as f:
+        stream = encrypt_aes_stream(f, key, iv, chunk_size=1000)
+        body = b''.join(stream)
+    assert len(body) == len(stream)
+    assert decrypt_aes(body, key, iv).decode(encoding) == content
+
+
+def test_encrypt_aes_stream_compressed():
+    stream = encrypt_aes_stream(io.BytesIO(feed.encode('utf-8')), key, iv, compress=True, chunk_size=1000)
+    body = stream.read()
+    assert len(body) == len(stream) < len(feed)
+    assert gzip.decompress(decrypt_aes(body, key, iv)).decode('utf-8') == feed
+
+
+class UploadResponse:
+    headers = {}
+
+    def __init__(self, status_code, content=None):
+        self.status_code = status_code
+        self.content = content
+
+    def json(self):
+        return self.content
+
+
+class UploadTransport:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.uploads = []
+
+    def request(self, method, url, data=None, headers=None, **kwargs):
+        if method == 'PUT':
+            self.uploads.append((headers, b''.join(data)))
+            return UploadResponse(self.status_code)
+        return UploadResponse(200, {'payload': {
+            'feedDocumentId': 'feed-doc', 'url': 'https://tortuga-prod-eu.s3-eu-west-1.amazonaws.com/feed',
+            'encryptionDetails': {'standard': 'AES', 'initializationVector': iv, 'key': key}
+        }})
+
+
+@pytest.fixture
+def feeds(monkeypatch):
+    monkeypatch.setattr(Client, 'role', property(lambda self: role))
+    return Feeds(credentials=credentials, restricted_data_token='Atz.sprdt', transport=UploadTransport(),
+                 rate_limiter=RateLimiter())
+
+
+def test_create_feed_document(feeds):
+    res = feeds.create_feed_document(io.BytesIO(feed.encode('iso-8859-1')), content_type='text/tsv')
+    assert res.payload['feedDocumentId'] == 'feed-doc'
+    headers, body = feeds.transport.uploads[0]
+    assert headers == {'Content-Type': 'text/tsv', 'Content-Length': str(len(body))}
+    assert decrypt_aes(body, key, iv).decode('iso-8859-1') == feed
+
+
+def test_create_feed_document_failed(feeds):
+    from sp_api.base import SellingApiException
+    feeds.transport.status_code = 403
+    with pytest.raises(SellingApiException):
+        feeds.create_feed_document(io.StringIO(feed))
+
+
+def test_aio_create_feed_document(monkeypatch):
+    class AsyncUploadTransport:
+        uploads = []
+
+        async def request(self, method, url, data=None, headers=None, **kwargs):
+            if method == 'PUT':
+                self.uploads.append((headers, b''.join([chunk async for chunk in data])))
+                return AsyncFakeResponse(200, None)
+            return AsyncFakeResponse(200, {'payload': {
+                'feedDocumentId': 'feed-doc', 'url': 'https://tortuga-prod-eu.s3-eu-west-1.amazonaws.com/feed',
+                'encryptionDetails': {'standard': 'AES', 'initializationVector': iv, 'key': key}
+            }})
+
+    monkeypatch.setattr(AsyncClient, 'role', property(lambda self: role))
+    transport = AsyncUploadTransport()
+    client = aio_api.Feeds(credentials=credentials, restricted_data_token='Atz.sprdt', transport=transport,
+                           rate_limiter=RateLimiter())
+
+    asyncio.run(client.create_feed_document(io.StringIO(feed), compress=True))
+
+    headers, body = transport.uploads[0]
+    assert headers['Content-Length'] == str(len(body))
+    assert gzip.decompress(decrypt_aes(body, key, iv)).decode('iso-8859-1') == feed
+
+
+def test_encrypted_stream_is_not_chunked():
+    import requests
+    stream = encrypt_aes_stream(io.BytesIO(feed.encode('utf-8')), key, iv)
+    request = requests.Request('PUT', 'https://tortuga-prod-eu.s3-eu-west-1.amazonaws.com/feed', data=stream).prepare()
+    assert request.headers['Content-Length'] == str(len(stream))
+    assert 'Transfer-Encoding' not in request.headers
@@ -0,0 +1,124 @@
+import asyncio
+from urllib.parse import urlsplit, parse_qsl
+
+import pytest
+
+from sp_api.api import Orders, Finances, VendorOrders, FulfillmentInbound
+from sp_api.base import ApiResponse, Client, RateLimiter
+from sp_api.aio import api as aio_api, Client as AsyncClient
+from tests.client.test_aio import credentials, role, FakeResponse as AsyncFakeResponse
+
+
+class PagedResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, content):
+        self.content = content
+
+    def json(self):
+        return self.content
+
+
+class PagedTransport:
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append(dict(parse_qsl(urlsplit(url).query)))
+        return PagedResponse(self.pages.pop(0))
+
+
+@pytest.fixture
+def no_role(monkeypatch):
+    monkeypatch.setattr(Client, 'role', property(lambda self: role))
+
+
+def make_client(endpoint, pages):
+    transport = PagedTransport(pages)
+    return endpoint(credentials=credentials, restricted_data_token='Atz.sprdt', transport=transport,
+                    rate_limiter=RateLimiter()), transport
+
+
+def test_iter_orders(no_role):
+    client, transport = make_client(Orders, [
+        {'payload': {'Orders': [{'AmazonOrderId': '1'}, {'AmazonOrderId': '2'}], 'NextToken': 'next'}},
+        {'payload': {'Orders': [{'AmazonOrderId': '3'}]}},
+    ])
+    orders = client.iter_orders(CreatedAfter='2021-01-01')
+    assert next(orders)['AmazonOrderId'] == '1'
+    # the next page is loaded lazily
+    assert len(transport.requests) == 1
+    assert [o['AmazonOrderId'] for o in orders] == ['2', '3']
+    assert transport.requests[1]['NextToken'] == 'next'
+    assert 'CreatedAfter' not in transport.requests[1]
+
+
+def test_iter_financial_events(no_role):
+    client, transport = make_client(Finances, [
+        {'payload': {'FinancialEvents': {'ShipmentEventList': [{'id': 1}], 'RefundEventList': []},
+                     'NextToken': 'next'}},
+        {'payload': {'FinancialEvents': {'ShipmentEventList': [{'id': 2}], 'RefundEventList': [{'id': 3}]}}},
+    ])
+    assert list(client.iter_financial_events(PostedAfter='2021-01-01')) == [
+        ('ShipmentEventList', {'id': 1}),
+        ('ShipmentEventList', {'id': 2}),
+        ('RefundEventList', {'id': 3}),
+    ]
+
+
+def test_iter_shipments_next_token_query(no_role):
+    client, transport = make_client(FulfillmentInbound, [
+        {'payload': {'ShipmentData': [{'ShipmentId': 'a'}], 'NextToken': 'next'}},
+        {'payload': {'ShipmentData': [{'ShipmentId': 'b'}]}},
+    ])
+    assert [s['ShipmentId'] for s in client.iter_shipments(QueryType='SHIPMENT')] == ['a', 'b']
+    assert transport.requests[1]['QueryType'] == 'NEXT_TOKEN'
+    assert transport.requests[1]['NextToken'] == 'next'
+
+
+def test_iter_purchase_orders_pagination(no_role):
+    client, transport = make_client(VendorOrders, [
+        {'payload': {'orders': [{'purchaseOrderNumber': 'a'}], 'pagination': {'nextToken': 'next'}}},
+        {'payload': {'orders': [{'purchaseOrderNumber': 'b'}]}},
+    ])
+    numbers = [o['purchaseOrderNumber'] for o in client.iter_purchase_orders(createdAfter='2021-01-01')]
+    assert numbers == ['a', 'b']
+    assert transport.requests[1]['nextToken'] == 'next'
+    assert transport.requests[1]['createdAfter'] == '2021-01-01'
+
+
+def test_aio_iter_orders(monkeypatch):
+    class AsyncPagedTransport:
+        def __init__(self, pages):
+            self.pages = list(pages)
+
+        async def request(self, method, url, **kwargs):
+            return AsyncFakeResponse(200, self.pages.pop(0))
+
+    monkeypatch.setattr(AsyncClient, 'role', property(lambda self: role))
+    client = aio_api.Orders(credentials=credentials, restricted_data_token='Atz.sprdt', rate_limiter=RateLimiter(),
+                            transport=AsyncPagedTransport([
+                                {'payload': {'Orders': [{'AmazonOrderId': '1'}], 'NextToken': 'next'}},
+                                {'payload': {'Orders': [{'AmazonOrderId': '2'}]}},
+                            ]))
+
+    async def collect():
+        return [o['AmazonOrderId'] async for o in client.iter_orders(CreatedAfter='2021-01-01')]
+
+    assert asyncio.run(collect()) == ['1', '2']
+
+
+@pytest.mark.parametrize('response, next_token', [
+    ({'payload': {'NextToken': 'a'}}, 'a'),
+    # v2021 apis return the token in camel case or in a pagination object
+    ({'payload': {'nextToken': 'b'}}, 'b'),
+    ({'payload': {'items': []}, 'pagination': {'nextToken': 'c'}}, 'c'),
+    ({'payload': {'pagination': {'nextToken': 'd'}}}, 'd'),
+    ({'payload': {'items': []}, 'nextToken': 'e'}, 'e'),
+    ({'payload': {'items': []}}, None),
+    ({'payload': ['not', 'a', 'dict']}, None),
+])
+def test_api_response_next_token(response, next_token):
+    assert ApiResponse(**response).next_token == next_token
@@ -0,0 +1,49 @@
+import pytest
+
+from sp_api.base import RateLimiter, AdaptiveRateLimiter, MemoryStorage, FileStorage, RedisStorage
+
+key = ('selling_partner', 'eu-west-1', 'GET /orders/v0/orders')
+
+
+@pytest.fixture(params=['memory', 'file', 'redis'])
+def make_storage(request, tmp_path):
+    if request.param == 'memory':
+        storage = MemoryStorage()
+        return lambda: storage
+    if request.param == 'file':
+        return lambda: FileStorage(str(tmp_path / 'rate_limits'))
+    fakeredis = pytest.importorskip('fakeredis')
+    server = fakeredis.FakeServer()
+    return lambda: RedisStorage(fakeredis.FakeRedis(server=server))
+
+
+def test_storage_shared_between_limiters(make_storage):
+    # two limiters on the same storage act like two worker processes
+    a, b = RateLimiter(make_storage()), RateLimiter(make_storage())
+    assert a.reserve(key, 1, 2) == 0
+    assert b.reserve(key, 1, 2) == 0
+    assert a.reserve(key, 1, 2) > 0.9
+    assert b.reserve(key, 1, 2) > 1.9
+
+
+def test_storage_unknown_operation(make_storage):
+    limiter = RateLimiter(make_storage())
+    assert limiter.reserve(key, None, None) == 0
+    assert limiter.bucket(key) is None
+
+
+def test_storage_adaptive(make_storage):
+    a, b = AdaptiveRateLimiter(storage=make_storage()), AdaptiveRateLimiter(storage=make_storage())
+    a.reserve(key, 1, 1)
+    b.on_response(key, '0.5')
+    assert a.bucket(key).rate == 0.5
+    b.on_throttle(key)
+    assert a.bucket(key).rate == 0.25
+
+
+def test_storage_clear(make_storage):
+    storage = make_storage()
+    limiter = RateLimiter(storage)
+    limiter.reserve(key, 1, 1)
+    limiter.clear()
+    assert limiter.bucket(key) is None
@@ -0,0 +1,144 @@
+import asyncio
+
+from sp_api.api import Orders
+from sp_api.base import Client, RateLimiter, AdaptiveRateLimiter, SellingApiRequestThrottledException
+from sp_api.base.rate_limiter import TokenBucket
+from sp_api.aio import api as aio_api, Client as AsyncClient
+from tests.client.test_aio import credentials, role, FakeTransport as AsyncFakeTransport
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def json(self):
+        return {'payload': {}}
+
+
+class FakeTransport:
+    def request(self, method, url, **kwargs):
+        return FakeResponse()
+
+
+class RecordingRateLimiter(RateLimiter):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def reserve(self, key, rate, burst):
+        self.calls.append((key, rate, burst))
+        return 0
+
+
+def test_token_bucket_burst_then_rate():
+    bucket = TokenBucket(rate=2, burst=3)
+    now = bucket.timestamp
+    assert [bucket.reserve(now) for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve(now) == 0.5
+    assert bucket.reserve(now) == 1.0
+    assert bucket.reserve(now + 1.5) == 0
+
+
+def test_rate_limiter_buckets_per_key():
+    limiter = RateLimiter()
+    assert limiter.reserve(('a', 'eu-west-1', 'GET /x'), 1, 1) == 0
+    assert limiter.reserve(('b', 'eu-west-1', 'GET /x'), 1, 1) == 0
+    assert limiter.reserve(('a', 'eu-west-1', 'GET /x'), 1, 1) > 0
+
+
+def test_usage_plan_from_sp_endpoint():
+    usage_plan = Orders.get_orders.usage_plan
+    assert usage_plan.operation == 'GET /orders/v0/orders'
+    assert usage_plan.rate == 1
+    assert usage_plan.burst == 1
+
+
+def test_every_endpoint_has_usage_plan():
+    import sp_api.api
+    missing = []
+    for name in sp_api.api.__all__:
+        client = getattr(sp_api.api, name)
+        for attribute, endpoint in vars(client).items():
+            usage_plan = getattr(endpoint, 'usage_plan', None)
+            if usage_plan is not None and not (usage_plan.rate and usage_plan.burst):
+                missing.append('%s.%s' % (name, attribute))
+    assert missing == []
+
+
+def test_client_waits_for_rate_limiter(monkeypatch):
+    monkeypatch.setattr(Client, 'role', property(lambda self: role))
+    limiter = RecordingRateLimiter()
+    client = Orders(credentials=credentials, restricted_data_token='Atz.sprdt', transport=FakeTransport(),
+                    rate_limiter=limiter)
+    client.get_orders(CreatedAfter='TEST_CASE_200')
+    client.get_order('123-1234567-1234567')
+
+    (key, rate, burst), (order_key, _, _) = limiter.calls
+    assert key[1:] == (client.region, 'GET /orders/v0/orders')
+    assert (rate, burst) == (1, 1)
+    assert order_key[2] == 'GET /orders/v0/orders/{}'
+
+
+def test_async_client_waits_for_rate_limiter(monkeypatch):
+    monkeypatch.setattr(AsyncClient, 'role', property(lambda self: role))
+    limiter = RecordingRateLimiter()
+    client = aio_api.Orders(credentials=credentials, restricted_data_token='Atz.sprdt',
+                            transport=AsyncFakeTransport({'payload': {}}), rate_limiter=limiter)
+    asyncio.run(client.get_orders(CreatedAfter='TEST_CASE_200'))
+    assert limiter.calls[0][0][2] == 'GET /orders/v0/orders'
+
+
+def test_adaptive_rate_limiter_retunes_from_header():
+    limiter = AdaptiveRateLimiter()
+    key = ('a', 'eu-west-1', 'GET /orders/v0/orders')
+    limiter.reserve(key, 1, 1)
+    limiter.on_response(key, '0.5')
+    assert limiter.bucket(key).rate == 0.5
+
+
+def test_adaptive_rate_limiter_learns_undocumented_operation():
+    limiter = AdaptiveRateLimiter()
+    key = ('a', 'eu-west-1', 'GET /finances/v0/financialEvents')
+    assert limiter.reserve(key, None, None) == 0
+    assert limiter.reserve(key, None, None) == 0
+    limiter.on_response(key, '0.5')
+    assert limiter.reserve(key, None, None) == 0
+    assert limiter.reserve(key, None, None) > 1.9
+
+
+def test_adaptive_rate_limiter_aimd():
+    limiter = AdaptiveRateLimiter(decrease=0.5, increase=0.25)
+    key = ('a', 'eu-west-1', 'GET /orders/v0/orders')
+    limiter.reserve(key, 2, 10)
+    limiter.on_throttle(key)
+    assert limiter.bucket(key).rate == 1
+    assert limiter.bucket(key).tokens <= 0
+    limiter.on_response(key, None)
+    assert limiter.bucket(key).rate == 1.5
+    limiter.on_response(key, '2.0')
+    limiter.on_response(key, '2.0')
+    assert limiter.bucket(key).rate == 2
+
+
+def test_client_reports_throttling(monkeypatch):
+    class ThrottledResponse(FakeResponse):
+        status_code = 429
+        headers = {'x-amzn-RateLimit-Limit': '0.5'}
+
+        def json(self):
+            return {'errors': [{'code': 'QuotaExceeded', 'message': 'You exceeded your quota'}]}
+
+    class ThrottledTransport:
+        def request(self, method, url, **kwargs):
+            return ThrottledResponse()
+
+    monkeypatch.setattr(Client, 'role', property(lambda self: role))
+    limiter = AdaptiveRateLimiter()
+    client = Orders(credentials=credentials, restricted_data_token='Atz.sprdt', transport=ThrottledTransport(),
+                    rate_limiter=limiter)
+    try:
+        client.get_orders(CreatedAfter='TEST_CASE_200')
+    except SellingApiRequestThrottledException:
+        pass
+    bucket = limiter.bucket(client._rate_limit_key(Orders.get_orders.usage_plan))
+    assert bucket.rate == 0.5
@@ -0,0 +1,120 @@
+import asyncio
+import datetime
+import gzip
+from contextlib import asynccontextmanager
+
+import pytest
+
+from sp_api.api import Reports
+from sp_api.aio import api as aio_api, Client as AsyncClient
+from sp_api.base import Client, RateLimiter, ReportType
+from sp_api.base.report_columns import write_report_columns, report_column_types
+from tests.client.test_aio import credentials, role, FakeResponse as AsyncFakeResponse
+from tests.client.test_report_stream import StreamResponse, encrypt, document, chunked
+
+pa = pytest.importorskip('pyarrow')
+
+orders = ('amazon-order-id\tpurchase-date\tsku\tquantity\titem-price\tship-postal-code\tis-business-order\n'
+          + ''.join('302-%07d\t2021-06-01T12:00:00+00:00\tsku-%s\t%s\t%s.99\t0%s\tfalse\n' % (i, i, i % 5, i, 1000 + i)
+                    for i in range(20000)))
+
+
+def body():
+    return encrypt(gzip.compress(orders.encode('utf-8')))
+
+
+@pytest.fixture
+def reports(monkeypatch):
+    class OrdersTransport:
+        def request(self, method, url, stream=False, **kwargs):
+            if url.startswith('https://tortuga'):
+                return StreamResponse(body())
+            return StreamResponse({'payload': document(True)})
+
+    monkeypatch.setattr(Client, 'role', property(lambda self: role))
+    return Reports(credentials=credentials, restricted_data_token='Atz.sprdt', transport=OrdersTransport(),
+                   rate_limiter=RateLimiter())
+
+
+def test_report_column_types():
+    types = report_column_types(ReportType.GET_FLAT_FILE_ALL_ORDERS_DATA_BY_LAST_UPDATE_GENERAL, {'sku': 'large_string'})
+    assert types['quantity'] == 'int64'
+    assert types['sku'] == 'large_string'
+    assert report_column_types('UNKNOWN') == {}
+
+
+def test_get_report_document_arrow(reports, tmp_path):
+    path = str(tmp_path / 'orders.arrow')
+    reports.get_report_document('doc', output='arrow', file=path, character_code='utf-8',
+                                report_type=ReportType.GET_FLAT_FILE_ALL_ORDERS_DATA_BY_LAST_UPDATE_GENERAL)
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    assert table.num_rows == 20000
+    assert table.schema.field('quantity').type == pa.int64()
+    assert table.schema.field('purchase-date').type == pa.timestamp('s', tz='UTC')
+    # not declared, read as string
+    assert table.schema.field('sku').type == pa.string()
+    row = table.slice(1, 1).to_pylist()[0]
+    assert row['ship-postal-code'] == '01001'
+    assert row['item-price'] == 1.99
+    assert row['is-business-order'] is False
+    assert row['purchase-date'].replace(tzinfo=None) == datetime.datetime(2021, 6, 1, 12)
+
+
+def test_get_report_document_parquet(reports, tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = str(tmp_path / 'orders.parquet')
+    reports.get_report_document('doc', output='parquet', file=path, character_code='utf-8',
+                                report_type='GET_FLAT_FILE_ALL_ORDERS_DATA_BY_LAST_UPDATE_GENERAL')
+    table = pq.read_table(path)
+    assert table.num_rows == 20000
+    assert table.column('amazon-order-id')[0].as_py() == '302-0000000'
+
+
+def test_get_report_document_arrow_table(reports):
+    res = reports.get_report_document('doc', output='arrow', character_code='utf-8')
+    # without a report type, all columns are strings
+    assert res.payload['document'].num_rows == 20000
+    assert set(res.payload['document'].schema.types) == {pa.string()}
+
+
+def test_write_report_columns_undeclared():
+    # a value that doesn't fit the type of the first block, far behind it
+    report = 'sku\tqty\n' + ''.join('sku-%s\t%s\n' % (i, i) for i in range(200000)) + 'sku-x\tabc\n'
+    table = write_report_columns(chunked(report, 64 * 1024), block_size=64 * 1024)
+    assert table.num_rows == 200001
+    assert table.column('qty')[-1].as_py() == 'abc'
+    table = write_report_columns(chunked(report[:-len('sku-x\tabc\n')], 64 * 1024), column_types={'qty': 'int64'})
+    assert table.schema.field('qty').type == pa.int64()
+
+
+def test_write_report_columns_output():
+    with pytest.raises(ValueError):
+        write_report_columns(['a\n'], output='csv')
+    with pytest.raises(ValueError):
+        write_report_columns(['a\n'], output='parquet')
+
+
+def test_aio_get_report_document_arrow(monkeypatch):
+    class StreamContent:
+        async def iter_chunked(self, size):
+            for chunk in chunked(body(), 4096):
+                yield chunk
+
+    class AsyncOrdersTransport:
+        async def request(self, method, url, **kwargs):
+            return AsyncFakeResponse(200, {'payload': document(True)})
+
+        @asynccontextmanager
+        async def stream(self, method, url, **kwargs):
+            response = AsyncFakeResponse(200, None)
+            response.content = StreamContent()
+            yield response
+
+    monkeypatch.setattr(AsyncClient, 'role', property(lambda self: role))
+    client = aio_api.Reports(credentials=credentials, restricted_data_token='Atz.sprdt',
+                             transport=AsyncOrdersTransport(), rate_limiter=RateLimiter())
+
+    res = asyncio.run(client.get_report_document('doc', output='arrow', character_code='utf-8',
+                                                 report_type=ReportType.GET_FLAT_FILE_ALL_ORDERS_DATA_BY_LAST_UPDATE_GENERAL))
+
+    assert res.payload['document'].num_rows == 20000
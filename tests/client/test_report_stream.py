@@ -0,0 +1,262 @@
+import asyncio
+import base64
+import gzip
+import io
+from contextlib import asynccontextmanager
+
+import pytest
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
+
+from sp_api.api import Reports
+from sp_api.aio import api as aio_api, Client as AsyncClient
+from sp_api.base import Client, RateLimiter, SellingApiException
+from sp_api.base.helpers import DocumentDecoder, detect_encoding
+from sp_api.base.report_headers import ReportRowParser, MerchantListingsData, MerchantListingsAllData
+from tests.client.test_aio import credentials, role, FakeResponse as AsyncFakeResponse
+
+key = base64.b64encode(b'k' * 32).decode()
+iv = base64.b64encode(b'i' * 16).decode()
+report = ''.join('sku-%s\tTitel mit Umlaut äöü\t%s\n' % (i, i) for i in range(5000))
+
+
+def encrypt(content):
+    return AES.new(base64.b64decode(key), AES.MODE_CBC, base64.b64decode(iv)).encrypt(pad(content, 16))
+
+
+def chunked(content, size):
+    return [content[i:i + size] for i in range(0, len(content), size)]
+
+
+def document(compressed):
+    payload = {
+        'reportDocumentId': 'doc',
+        'url': 'https://tortuga-prod-eu.s3-eu-west-1.amazonaws.com/doc',
+        'encryptionDetails': {'standard': 'AES', 'initializationVector': iv, 'key': key}
+    }
+    if compressed:
+        payload['compressionAlgorithm'] = 'GZIP'
+    return payload
+
+
+def body(compressed):
+    content = report.encode('utf-8')
+    return encrypt(gzip.compress(content) if compressed else content)
+
+
+@pytest.mark.parametrize('compressed', [True, False])
+@pytest.mark.parametrize('size', [1, 15, 16, 17, 4096])
+def test_document_decoder(compressed, size):
+    decoder = DocumentDecoder(key, iv, compressed, 'utf-8', max_length=1000)
+    pieces = list(decoder.iter(chunked(body(compressed), size)))
+    assert ''.join(pieces) == report
+    if compressed:
+        # pieces are bounded by max_length, plus an incomplete character carried over from the previous one
+        assert max(len(p.encode('utf-8')) for p in pieces) <= 1000 + 3
+
+
+def test_detect_encoding():
+    assert detect_encoding('für'.encode('utf-8')) == 'utf-8'
+    assert detect_encoding('für'.encode('utf-8-sig')) == 'utf-8-sig'
+    assert detect_encoding('für'.encode('utf-16')) == 'utf-16'
+    assert detect_encoding('für'.encode('iso-8859-1')) == 'iso-8859-1'
+    # a character cut off by the end of the sample
+    assert detect_encoding('für'.encode('utf-8')[:2]) == 'utf-8'
+
+
+def test_document_decoder_falls_back():
+    # ascii for far more than the sample, a latin-1 character at the very end
+    content = ('sku-%s\tPrice\n' * 20000 % tuple(range(20000)) + 'Größe\n').encode('iso-8859-1')
+    decoder = DocumentDecoder(encoding='auto', sample_size=16 * 1024)
+    assert ''.join(decoder.iter(chunked(content, 16 * 1024))) == content.decode('iso-8859-1')
+    assert decoder.encoding == 'utf-8'
+    assert decoder.decoder.encoding == 'iso-8859-1'
+
+
+def test_document_decoder_explicit_encoding_fails():
+    with pytest.raises(UnicodeDecodeError):
+        ''.join(DocumentDecoder(encoding='utf-8').iter([b'a' * 10, 'Größe'.encode('iso-8859-1')]))
+
+
+def test_document_decoder_plain():
+    decoder = DocumentDecoder(encoding=None)
+    assert b''.join(decoder.iter([b'abc', b'def'])) == b'abcdef'
+
+
+class StreamResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, content):
+        self.content = content
+        self.closed = False
+
+    def json(self):
+        return self.content
+
+    def iter_content(self, chunk_size):
+        return iter(chunked(self.content, 1000))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.closed = True
+
+
+class ReportTransport:
+    def __init__(self, compressed):
+        self.compressed = compressed
+        self.downloads = []
+
+    def request(self, method, url, stream=False, **kwargs):
+        if url.startswith('https://tortuga'):
+            assert stream
+            self.downloads.append(StreamResponse(body(self.compressed)))
+            return self.downloads[-1]
+        return StreamResponse({'payload': document(self.compressed)})
+
+
+@pytest.fixture
+def reports(monkeypatch):
+    monkeypatch.setattr(Client, 'role', property(lambda self: role))
+    transport = ReportTransport(compressed=True)
+    return Reports(credentials=credentials, restricted_data_token='Atz.sprdt', transport=transport,
+                   rate_limiter=RateLimiter())
+
+
+def test_get_report_document(reports):
+    res = reports.get_report_document('doc', decrypt=True, character_code='utf-8')
+    assert res.payload['document'] == report
+    assert reports.transport.downloads[0].closed
+
+
+def test_get_report_document_stream_to_file(reports, tmp_path):
+    path = str(tmp_path / 'report.txt')
+    res = reports.get_report_document('doc', decrypt=True, file=path, character_code='utf-8', stream=True)
+    assert 'document' not in res.payload
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == report
+
+
+def test_get_report_document_stream(reports):
+    res = reports.get_report_document('doc', decrypt=True, character_code='utf-8', stream=True)
+    assert ''.join(res.payload['document']) == report
+
+
+def test_decrypt_report_content():
+    assert Reports.decrypt_report_content(body(True), iv, key, 'AES', 'utf-8', document(True)) == report
+    with pytest.raises(SellingApiException):
+        Reports.decrypt_report_content(body(True), iv, key, 'RSA', 'utf-8', document(True))
+
+
+def test_aio_get_report_document_stream(monkeypatch, tmp_path):
+    class StreamContent:
+        def __init__(self, content):
+            self.content = content
+
+        async def iter_chunked(self, size):
+            for chunk in chunked(self.content, 1000):
+                yield chunk
+
+    class AsyncReportTransport:
+        async def request(self, method, url, **kwargs):
+            return AsyncFakeResponse(200, {'payload': document(True)})
+
+        @asynccontextmanager
+        async def stream(self, method, url, **kwargs):
+            response = AsyncFakeResponse(200, None)
+            response.content = StreamContent(body(True))
+            yield response
+
+    monkeypatch.setattr(AsyncClient, 'role', property(lambda self: role))
+    client = aio_api.Reports(credentials=credentials, restricted_data_token='Atz.sprdt',
+                             transport=AsyncReportTransport(), rate_limiter=RateLimiter())
+    file = io.StringIO()
+
+    res = asyncio.run(client.get_report_document('doc', decrypt=True, file=file, character_code='utf-8', stream=True))
+
+    assert 'document' not in res.payload
+    assert file.getvalue() == report
+    res = asyncio.run(client.get_report_document('doc', decrypt=True, character_code='utf-8'))
+    assert res.payload['document'] == report
+    path = tmp_path / 'report.tsv'
+    res = asyncio.run(client.get_report_document('doc', decrypt=True, file=str(path), character_code='utf-8'))
+    assert res.payload['document'] == report
+    assert path.read_text(encoding='utf-8') == report
+
+    async def rows():
+        return [row async for row in client.iter_report_rows('doc', as_tuple=True)]
+
+    assert asyncio.run(rows())[-1] == ('sku-4999', 'Titel mit Umlaut äöü', '4999')
+
+
+listings = ('item-name\tseller-sku\tprice\tquantity\tstatus\r\n'
+            'Kaffeebohnen für Kenner\tsku-1\t9.99\t3\tActive\r\n'
+            'Tee\tsku-2\t4.50\t\tInactive\r\n')
+
+
+def listings_reports(monkeypatch, content, marketplace=None):
+    class ListingsTransport(ReportTransport):
+        def request(self, method, url, stream=False, **kwargs):
+            if url.startswith('https://tortuga'):
+                return StreamResponse(encrypt(gzip.compress(content)))
+            return StreamResponse({'payload': document(True)})
+
+    monkeypatch.setattr(Client, 'role', property(lambda self: role))
+    kwargs = {'marketplace': marketplace} if marketplace else {}
+    return Reports(credentials=credentials, restricted_data_token='Atz.sprdt', transport=ListingsTransport(True),
+                   rate_limiter=RateLimiter(), **kwargs)
+
+
+@pytest.mark.parametrize('encoding', ['utf-8', 'utf-8-sig', 'iso-8859-1'])
+def test_iter_report_rows(monkeypatch, encoding):
+    reports = listings_reports(monkeypatch, listings.encode(encoding))
+    rows = list(reports.iter_report_rows('doc', header_enum=MerchantListingsAllData))
+    assert rows[0]['item-name'] == 'Kaffeebohnen für Kenner'
+    assert rows[0]['seller-sku'] == 'sku-1'
+    assert rows[1]['quantity'] == ''
+    # known columns missing in the report
+    assert rows[1]['listing-id'] is None
+    assert len(rows) == 2
+
+
+def test_iter_report_rows_tuples(monkeypatch):
+    reports = listings_reports(monkeypatch, listings.encode('utf-8'))
+    rows = list(reports.iter_report_rows('doc', as_tuple=True))
+    assert rows == [('Kaffeebohnen für Kenner', 'sku-1', '9.99', '3', 'Active'), ('Tee', 'sku-2', '4.50', '', 'Inactive')]
+
+
+def test_iter_report_rows_shift_jis(monkeypatch):
+    from sp_api.base import Marketplaces
+    reports = listings_reports(monkeypatch, listings.replace('für', 'コーヒー').encode('cp932'), Marketplaces.JP)
+    assert next(reports.iter_report_rows('doc'))['item-name'] == 'Kaffeebohnen コーヒー Kenner'
+
+
+def test_iter_report_rows_validates_header(monkeypatch):
+    reports = listings_reports(monkeypatch, listings.encode('utf-8'))
+    with pytest.raises(ValueError):
+        next(reports.iter_report_rows('doc', header_enum=MerchantListingsData))
+    rows = list(reports.iter_report_rows('doc', header_enum=MerchantListingsData, strict=False))
+    assert rows[0]['status'] == 'Active'
+    # tuples keep the unknown columns as well, after the enum's columns
+    tuples = list(reports.iter_report_rows('doc', header_enum=MerchantListingsData, as_tuple=True, strict=False))
+    assert [tuple(row.values()) for row in rows] == tuples
+    assert tuples[0][-1] == 'Active'
+
+
+def test_iter_report_rows_falls_back(monkeypatch):
+    # the encoding is detected from the first 64 KB, a latin-1 character follows much later
+    content = listings.encode('ascii', 'replace') + ''.join(
+        'Tee\tsku-%s\t4.50\t1\tActive\r\n' % i for i in range(10000)).encode('ascii') + 'Größe\tsku-x\t1\t1\tActive\r\n'.encode('iso-8859-1')
+    reports = listings_reports(monkeypatch, content)
+    rows = list(reports.iter_report_rows('doc', chunk_size=16 * 1024))
+    assert len(rows) == 10003
+    assert rows[-1]['item-name'] == 'Größe'
+
+
+def test_report_row_parser_split_lines():
+    parser = ReportRowParser()
+    text = 'a\tb\n1\t2\n3\t4'
+    rows = [row for piece in text for row in parser.feed(piece)] + list(parser.close())
+    assert rows == [{'a': '1', 'b': '2'}, {'a': '3', 'b': '4'}]
@@ -0,0 +1,326 @@
+import asyncio
+import os
+import stat
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from sp_api.auth import AccessTokenClient, TokenCache, MemoryTokenStore, FileTokenStore, SQLiteTokenStore, \
+    RedisTokenStore, set_token_store
+from sp_api.auth.token_cache import CacheEntry
+from sp_api.base import Client
+from sp_api.aio.access_token_client import AccessTokenClient as AsyncAccessTokenClient
+from tests.client.test_aio import credentials, role
+
+
+def test_auth_imported_first():
+    # the first sp_api import of a process, as when this file runs alone
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    subprocess.run([sys.executable, '-c', 'from sp_api.auth import AccessTokenClient, set_token_store'], cwd=root,
+                   check=True)
+
+
+class Fetcher:
+    def __init__(self, delay=0.0, expires_in=3600, fail=False):
+        self.delay = delay
+        self.expires_in = expires_in
+        self.fail = fail
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.calls += 1
+            calls = self.calls
+        time.sleep(self.delay)
+        if self.fail:
+            raise ValueError('invalid_grant')
+        return {'access_token': 'Atza|%s' % calls, 'expires_in': self.expires_in}
+
+
+def test_token_cache_expiry():
+    cache = TokenCache(refresh_margin=0, expiry_margin=0)
+    fetch = Fetcher(expires_in=0.05)
+    assert cache.get('a', fetch)['access_token'] == 'Atza|1'
+    assert cache.get('a', fetch)['access_token'] == 'Atza|1'
+    time.sleep(0.06)
+    assert cache.peek('a') is None
+    assert cache.get('a', fetch)['access_token'] == 'Atza|2'
+
+
+def test_token_cache_keeps_every_key():
+    cache = TokenCache()
+    fetchers = {'seller-%s' % i: Fetcher() for i in range(50)}
+    for _ in range(2):
+        for key, fetch in fetchers.items():
+            cache.get(key, fetch)
+    assert all(fetch.calls == 1 for fetch in fetchers.values())
+
+
+def test_token_cache_single_flight():
+    cache = TokenCache()
+    fetch = Fetcher(delay=0.1)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get('a', fetch))) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert fetch.calls == 1
+    assert [token['access_token'] for token in results] == ['Atza|1'] * 10
+
+
+def test_token_cache_refreshes_in_background():
+    cache = TokenCache(refresh_margin=10, expiry_margin=0)
+    fetch = Fetcher(delay=0.05, expires_in=5)
+    assert cache.get('a', fetch)['access_token'] == 'Atza|1'
+    # within the refresh margin, the current token is returned while a new one is fetched
+    assert cache.get('a', fetch)['access_token'] == 'Atza|1'
+    assert cache.get('a', fetch)['access_token'] == 'Atza|1'
+    time.sleep(0.1)
+    assert fetch.calls == 2
+    assert cache.peek('a')['access_token'] == 'Atza|2'
+
+
+def test_token_cache_failed_fetch():
+    cache = TokenCache()
+    fetch = Fetcher(delay=0.05, fail=True)
+    errors = []
+
+    def get():
+        try:
+            cache.get('a', fetch)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=get) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(errors) == 5 and fetch.calls == 1
+    fetch.fail = False
+    assert cache.get('a', fetch)['access_token'] == 'Atza|2'
+
+
+def test_token_cache_async_single_flight():
+    cache = TokenCache()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {'access_token': 'Atza|async', 'expires_in': 3600}
+
+    async def main():
+        return await asyncio.gather(*[cache.get_async('a', fetch) for _ in range(10)])
+
+    assert [token['access_token'] for token in asyncio.run(main())] == ['Atza|async'] * 10
+    assert len(calls) == 1
+
+
+@pytest.fixture
+def token_cache(monkeypatch):
+    cache = TokenCache()
+    monkeypatch.setattr(AccessTokenClient, 'token_cache', cache)
+    return cache
+
+
+def test_access_token_client_cache(monkeypatch, token_cache):
+    requests = []
+
+    def request(self, url, data, headers):
+        requests.append(data['refresh_token'])
+        return {'access_token': 'Atza|' + data['refresh_token'], 'refresh_token': data['refresh_token'],
+                'token_type': 'bearer', 'expires_in': 3600}
+
+    monkeypatch.setattr(AccessTokenClient, '_request', request)
+    for _ in range(2):
+        for i in range(20):
+            auth = AccessTokenClient(refresh_token='Atzr|%s' % i, credentials=credentials).get_auth()
+            assert auth.access_token == 'Atza|Atzr|%s' % i
+    assert len(requests) == 20
+
+
+def test_aio_access_token_client_cache(monkeypatch, token_cache):
+    requests = []
+
+    async def request(self, url, data, headers):
+        requests.append(data['refresh_token'])
+        await asyncio.sleep(0.01)
+        return {'access_token': 'Atza|async', 'refresh_token': data['refresh_token'], 'token_type': 'bearer',
+                'expires_in': 3600}
+
+    monkeypatch.setattr(AsyncAccessTokenClient, '_request', request)
+
+    async def main():
+        client = AsyncAccessTokenClient(refresh_token='Atzr|async', credentials=credentials)
+        return await asyncio.gather(*[client.get_auth() for _ in range(5)])
+
+    assert {auth.access_token for auth in asyncio.run(main())} == {'Atza|async'}
+    assert requests == ['Atzr|async']
+
+
+@pytest.fixture(params=['memory', 'file', 'sqlite', 'redis'])
+def store(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryTokenStore()
+    if request.param == 'file':
+        return FileTokenStore(str(tmp_path / 'tokens'))
+    if request.param == 'sqlite':
+        return SQLiteTokenStore(str(tmp_path / 'tokens.db'))
+    fakeredis = pytest.importorskip('fakeredis')
+    return RedisTokenStore(fakeredis.FakeRedis())
+
+
+def test_token_store(store):
+    store.put('a', CacheEntry({'access_token': 'Atza|1'}, time.time() + 60))
+    store.put('b', CacheEntry({'access_token': 'Atza|2'}, time.time() - 1))
+    assert store.get('a') == CacheEntry({'access_token': 'Atza|1'}, store.get('a').expires_at)
+    assert store.get('b') is None
+    assert store.get('c') is None
+    store.delete('a')
+    assert store.get('a') is None
+
+
+def test_sqlite_token_store_permissions(tmp_path):
+    path = str(tmp_path / 'tokens.db')
+    # an existing database, created with the umask
+    with open(path + '-wal', 'w'):
+        pass
+    os.chmod(path + '-wal', 0o644)
+    store = SQLiteTokenStore(path)
+    store.put('a', CacheEntry({'access_token': 'Atza|1'}, time.time() + 60))
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(path + '-wal').st_mode) == 0o600
+    store.close()
+    os.remove(path + '-wal')
+    store = SQLiteTokenStore(path)
+    store._connection.execute('PRAGMA journal_mode=WAL')
+    store.put('b', CacheEntry({'access_token': 'Atza|2'}, time.time() + 60))
+    assert stat.S_IMODE(os.stat(path + '-wal').st_mode) == 0o600
+    store.close()
+
+
+def test_token_store_clear(store):
+    store.put('a', CacheEntry({'access_token': 'Atza|1'}, time.time() + 60))
+    store.clear()
+    assert store.get('a') is None
+
+
+def test_token_cache_shares_store(store):
+    fetch = Fetcher()
+    # a cache in another process, sharing the store
+    assert TokenCache(store=store).get('a', fetch)['access_token'] == 'Atza|1'
+    assert TokenCache(store=store).get('a', fetch)['access_token'] == 'Atza|1'
+    assert fetch.calls == 1
+    # tokens about to expire aren't taken from the store
+    store.put('b', CacheEntry({'access_token': 'Atza|old'}, time.time() + 60))
+    assert TokenCache(store=store).get('b', fetch)['access_token'] == 'Atza|2'
+    assert store.get('b').token['access_token'] == 'Atza|2'
+
+
+def test_token_cache_broken_store():
+    class BrokenStore:
+        def get(self, key):
+            raise ConnectionError('store is down')
+
+        put = get
+
+    assert TokenCache(store=BrokenStore()).get('a', Fetcher())['access_token'] == 'Atza|1'
+
+
+def test_token_cache_async_store(store):
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return {'access_token': 'Atza|async', 'expires_in': 3600}
+
+    for _ in range(2):
+        assert asyncio.run(TokenCache(store=store).get_async('a', fetch))['access_token'] == 'Atza|async'
+    assert len(calls) == 1
+
+
+def test_client_role_store(monkeypatch, tmp_path):
+    from datetime import datetime, timezone
+    from sp_api.api import Orders
+
+    class FakeSts:
+        calls = 0
+
+        def assume_role(self, RoleArn, RoleSessionName):
+            self.calls += 1
+            return {'Credentials': {**role, 'Expiration': datetime(2030, 1, 1, tzinfo=timezone.utc)}}
+
+    sts = FakeSts()
+    monkeypatch.setattr(Client, 'role_cache', TokenCache())
+    set_token_store(FileTokenStore(str(tmp_path)))
+    try:
+        client = Orders(credentials=credentials, refresh_token='Atzr|role')
+        client.boto3_client = sts
+        assert client.role['AccessKeyId'] == role['AccessKeyId']
+        assert client.role['Expiration'] == '2030-01-01T00:00:00+00:00'
+        # a new process starts with an empty cache
+        monkeypatch.setattr(Client, 'role_cache', TokenCache(store=Client.role_cache.store))
+        assert client.role['SessionToken'] == role['SessionToken']
+        assert sts.calls == 1
+    finally:
+        set_token_store(None)
+
+
+def test_client_role_cache(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+    from sp_api.api import Orders
+
+    class FakeSts:
+        calls = 0
+
+        def assume_role(self, RoleArn, RoleSessionName):
+            self.calls += 1
+            expiration = datetime.now(timezone.utc) + timedelta(minutes=20)
+            return {'Credentials': {**role, 'SessionToken': 'session-%s' % self.calls, 'Expiration': expiration}}
+
+    sts = FakeSts()
+    monkeypatch.setattr(Client, '_boto3_client', sts)
+    monkeypatch.setattr(Client, 'role_cache', TokenCache(refresh_margin=300, expiry_margin=15))
+    clients = [Orders(credentials=credentials, refresh_token='Atzr|%s' % i) for i in range(20)]
+    for client in clients:
+        client.boto3_client = sts
+    # the role is shared by all selling partners
+    assert {client.role['SessionToken'] for client in clients} == {'session-1'}
+    assert sts.calls == 1
+    # and expires with its credentials, not after an hour
+    entry = Client.role_cache._entries[clients[0]._get_cache_key()]
+    assert 1180 < entry.expires_at - time.time() <= 1200
+    other = Orders(credentials={**credentials, 'role_arn': 'arn:aws:iam::123456789012:role/other'})
+    other.boto3_client = sts
+    assert other.role['SessionToken'] == 'session-2'
+
+
+def test_sts_client_created_lazily(monkeypatch):
+    from sp_api.api import Orders
+    import boto3
+    from sp_api.base import client as client_module
+
+    created = []
+
+    def fake_client(service, **kwargs):
+        time.sleep(0.01)
+        created.append(kwargs)
+        return object()
+
+    monkeypatch.setattr(boto3, 'client', fake_client)
+    monkeypatch.setattr(client_module, '_sts_clients', {})
+    clients = [Orders(credentials=credentials) for _ in range(10)]
+    assert created == []
+    threads = [threading.Thread(target=lambda c=c: c.boto3_client) for c in clients]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(c.boto3_client) for c in clients}) == 1
+    assert created == [{'aws_access_key_id': 'AKIAEXAMPLE', 'aws_secret_access_key': 'aws-secret'}]
@@ -0,0 +1,28 @@
+from requests.adapters import HTTPAdapter
+
+from sp_api.base import Transport
+
+
+def test_transport_reuses_session_per_host():
+    transport = Transport()
+    a = transport.session('https://sellingpartnerapi-eu.amazon.com/orders/v0/orders')
+    b = transport.session('https://sellingpartnerapi-eu.amazon.com/reports/2020-09-04/reports')
+    c = transport.session('https://sellingpartnerapi-na.amazon.com/orders/v0/orders')
+    assert a is b
+    assert a is not c
+
+
+def test_transport_pool_settings():
+    transport = Transport(pool_maxsize=42, keep_alive=False)
+    session = transport.session('https://sellingpartnerapi-eu.amazon.com')
+    adapter = session.get_adapter('https://sellingpartnerapi-eu.amazon.com')
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 42
+    assert session.headers['Connection'] == 'close'
+
+
+def test_transport_close():
+    transport = Transport()
+    transport.session('https://sellingpartnerapi-eu.amazon.com')
+    transport.close()
+    assert transport._sessions == {}
@@ -0,0 +1,170 @@
+import io
+import threading
+import time
+
+import pytest
+
+from sp_api.base import ApiResponse, SellingApiRequestThrottledException
+from sp_api.base.processing_report import parse_processing_report
+from sp_api.util import FeedPipeline, FeedJobError
+
+xml_report = '''<?xml version="1.0" encoding="UTF-8"?>
+<AmazonEnvelope xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:noNamespaceSchemaLocation="amzn-envelope.xsd">
+    <Header><DocumentVersion>1.02</DocumentVersion><MerchantIdentifier>A1</MerchantIdentifier></Header>
+    <MessageType>ProcessingReport</MessageType>
+    <Message>
+        <MessageID>1</MessageID>
+        <ProcessingReport>
+            <DocumentTransactionID>50001</DocumentTransactionID>
+            <StatusCode>Complete</StatusCode>
+            <ProcessingSummary>
+                <MessagesProcessed>3</MessagesProcessed>
+                <MessagesSuccessful>1</MessagesSuccessful>
+                <MessagesWithError>1</MessagesWithError>
+                <MessagesWithWarning>1</MessagesWithWarning>
+            </ProcessingSummary>
+            <Result>
+                <MessageID>2</MessageID>
+                <ResultCode>Error</ResultCode>
+                <ResultMessageCode>8560</ResultMessageCode>
+                <ResultDescription>SKU sku-2 is missing required attributes</ResultDescription>
+                <AdditionalInfo><SKU>sku-2</SKU></AdditionalInfo>
+            </Result>
+            <Result>
+                <MessageID>3</MessageID>
+                <ResultCode>Warning</ResultCode>
+                <ResultMessageCode>99001</ResultMessageCode>
+                <ResultDescription>Größe is ignored</ResultDescription>
+            </Result>
+        </ProcessingReport>
+    </Message>
+</AmazonEnvelope>'''
+
+flat_file_report = ('Feed Processing Summary:\n'
+                    '\tNumber of records processed\t\t2\n'
+                    '\tNumber of records successful\t\t1\n'
+                    '\n'
+                    'original-record-number\tsku\terror-code\terror-type\terror-message\n'
+                    '2\tsku-2\t8560\tError\tThe price is missing\n')
+
+json_report = ('{"header": {"sellerId": "A1", "version": "2.0", "feedId": "f1"}, '
+               '"issues": [{"messageId": 2, "code": "90220", "severity": "ERROR", "message": "missing"}], '
+               '"summary": {"errors": 1, "warnings": 0, "messagesProcessed": 2, "messagesAccepted": 1, '
+               '"messagesInvalid": 1}}')
+
+
+def test_parse_xml_processing_report():
+    report = parse_processing_report(xml_report)
+    assert report['header'] == {'documentTransactionId': '50001', 'statusCode': 'Complete'}
+    assert report['summary'] == {'messagesProcessed': 3, 'messagesAccepted': 1, 'errors': 1, 'warnings': 1}
+    assert report['issues'] == [
+        {'messageId': 2, 'code': '8560', 'severity': 'ERROR', 'message': 'SKU sku-2 is missing required attributes',
+         'sku': 'sku-2'},
+        {'messageId': 3, 'code': '99001', 'severity': 'WARNING', 'message': 'Größe is ignored'},
+    ]
+
+
+def test_parse_flat_file_processing_report():
+    report = parse_processing_report(flat_file_report)
+    assert report['summary'] == {'messagesProcessed': 2, 'messagesAccepted': 1, 'errors': 1, 'warnings': 0}
+    assert report['issues'] == [{'messageId': 2, 'code': '8560', 'severity': 'ERROR',
+                                 'message': 'The price is missing', 'sku': 'sku-2'}]
+
+
+def test_parse_json_processing_report():
+    report = parse_processing_report(json_report)
+    assert report['header']['feedId'] == 'f1'
+    assert report['summary']['errors'] == 1
+    assert report['issues'][0]['messageId'] == 2
+
+
+class FakeFeeds:
+    def __init__(self, statuses=('IN_QUEUE', 'IN_PROGRESS', 'DONE'), upload_time=0.05):
+        self.statuses = statuses
+        self.upload_time = upload_time
+        self.lock = threading.Lock()
+        self.feeds = {}
+        self.created = []
+        self.uploading = 0
+        self.max_uploading = 0
+        self.throttle = 0
+
+    def create_feed_document(self, file, content_type='text/tsv', compress=False):
+        with self.lock:
+            self.uploading += 1
+            self.max_uploading = max(self.max_uploading, self.uploading)
+        content = file.read()
+        time.sleep(self.upload_time)
+        with self.lock:
+            self.uploading -= 1
+        return ApiResponse(payload={'feedDocumentId': 'doc-%s' % content})
+
+    def create_feed(self, feed_type, input_feed_document_id, **kwargs):
+        if self.throttle:
+            self.throttle -= 1
+            raise SellingApiRequestThrottledException([{'message': 'throttled'}], {})
+        with self.lock:
+            feed_id = 'feed-%s' % len(self.feeds)
+            self.feeds[feed_id] = list(kwargs.get('statuses', self.statuses))
+            self.created.append((threading.current_thread().name, input_feed_document_id, kwargs))
+        return ApiResponse(payload={'feedId': feed_id})
+
+    def get_feed(self, feed_id):
+        status = self.feeds[feed_id].pop(0)
+        return ApiResponse(payload={'feedId': feed_id, 'processingStatus': status,
+                                    'resultFeedDocumentId': 'result-' + feed_id if status != 'CANCELLED' else None})
+
+    def get_feed_processing_report(self, document_id):
+        return parse_processing_report(xml_report)
+
+
+def test_feed_pipeline():
+    feeds = FakeFeeds()
+    with FeedPipeline(feeds, max_workers=3, poll_interval=0.01, backoff=2) as pipeline:
+        futures = [pipeline.submit('POST_FLAT_FILE_INVLOADER_DATA', io.BytesIO(b'%d' % i), marketplaceIds=['A1'])
+                   for i in range(6)]
+        completed = list(pipeline.as_completed(timeout=5))
+    assert sorted(completed, key=id) == sorted(futures, key=id)
+    assert all(f.result()['summary']['errors'] == 1 for f in futures)
+    assert sorted(f.job.document_id for f in futures) == ['doc-%s' % (b'%d' % i) for i in range(6)]
+    assert all(f.job.feed['processingStatus'] == 'DONE' for f in futures)
+    # uploads run concurrently, feeds are created one at a time on their own thread
+    assert feeds.max_uploading > 1
+    assert {name for name, _, _ in feeds.created} == {'sp_api-feed-create_0'}
+    assert all(kwargs == {'marketplaceIds': ['A1']} for _, _, kwargs in feeds.created)
+
+
+def test_feed_pipeline_opens_paths(tmp_path):
+    path = tmp_path / 'feed.tsv'
+    path.write_bytes(b'sku\tquantity\n')
+    with FeedPipeline(FakeFeeds(), poll_interval=0.01) as pipeline:
+        future = pipeline.submit('POST_FLAT_FILE_INVLOADER_DATA', str(path))
+    assert future.job.document_id == 'doc-%s' % b'sku\tquantity\n'
+
+
+def test_feed_pipeline_throttled_create():
+    feeds = FakeFeeds()
+    feeds.throttle = 2
+    with FeedPipeline(feeds, poll_interval=0.01) as pipeline:
+        future = pipeline.submit('POST_FLAT_FILE_INVLOADER_DATA', io.BytesIO(b'1'))
+        assert future.result(timeout=5)['issues']
+    assert len(feeds.created) == 1
+
+
+@pytest.mark.parametrize('statuses, report', [(['IN_QUEUE', 'FATAL'], True), (['CANCELLED'], False)])
+def test_feed_pipeline_failed(statuses, report):
+    with FeedPipeline(FakeFeeds(), poll_interval=0.01) as pipeline:
+        future = pipeline.submit('POST_FLAT_FILE_INVLOADER_DATA', io.BytesIO(b'1'), statuses=statuses)
+        with pytest.raises(FeedJobError) as e:
+            future.result(timeout=5)
+    assert e.value.feed['processingStatus'] == statuses[-1]
+    assert (e.value.report is not None) == report
+
+
+def test_feed_pipeline_upload_error():
+    feeds = FakeFeeds()
+    with FeedPipeline(feeds, poll_interval=0.01) as pipeline:
+        future = pipeline.submit('POST_FLAT_FILE_INVLOADER_DATA', None)
+        with pytest.raises(AttributeError):
+            future.result(timeout=5)
+    assert not feeds.created
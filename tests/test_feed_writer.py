@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from sp_api.base import ApiResponse
+from sp_api.util import FeedWriter
+
+
+class FakeFeeds:
+    def __init__(self):
+        self.submitted = []
+
+    def submit_feed(self, feed_type, file, content_type='text/tsv', compress=False, **kwargs):
+        self.submitted.append((feed_type, file.read(), content_type, compress, kwargs))
+        feed_id = str(len(self.submitted))
+        return ApiResponse(payload={'feedDocumentId': 'doc-' + feed_id}), ApiResponse(payload={'feedId': feed_id})
+
+
+def test_feed_writer_tsv():
+    feeds = FakeFeeds()
+    with FeedWriter(feeds, 'POST_FLAT_FILE_PRICEANDQUANTITYONLY_UPDATE_DATA', columns=['sku', 'price', 'quantity'],
+                    max_messages=2, marketplaceIds=['A1PA6795UKMFR9']) as writer:
+        writer.write(('sku-1', 9.99, 3))
+        writer.write({'quantity': 0, 'sku': 'sku-2', 'price': None})
+        writer.writerows([('sku-3', 1, 1)])
+    assert [s[1] for s in feeds.submitted] == [
+        b'sku\tprice\tquantity\nsku-1\t9.99\t3\nsku-2\t\t0\n',
+        b'sku\tprice\tquantity\nsku-3\t1\t1\n',
+    ]
+    assert feeds.submitted[0][2] == 'text/tab-separated-values; charset=UTF-8'
+    assert feeds.submitted[0][4] == {'marketplaceIds': ['A1PA6795UKMFR9']}
+    assert [feed.payload['feedId'] for _, feed in writer.results] == ['1', '2']
+
+
+def test_feed_writer_max_size():
+    feeds = FakeFeeds()
+    writer = FeedWriter(feeds, 'POST_FLAT_FILE_PRICEANDQUANTITYONLY_UPDATE_DATA', header=['TemplateType=Offer'],
+                        max_size=40)
+    writer.writerows(('sku-%s' % i, i) for i in range(10))
+    writer.close()
+    parts = [s[1] for s in feeds.submitted]
+    assert all(len(part) <= 40 for part in parts)
+    assert all(part.startswith(b'TemplateType=Offer\n') for part in parts)
+    assert sum(part.count(b'sku-') for part in parts) == 10
+
+
+def test_feed_writer_json():
+    feeds = FakeFeeds()
+    header = {'sellerId': 'A3SELLER', 'version': '2.0', 'issueLocale': 'de_DE'}
+    with FeedWriter(feeds, 'JSON_LISTINGS_FEED', format='json', header=header, max_messages=2) as writer:
+        writer.writerows({'sku': 'sku-%s' % i, 'operationType': 'DELETE', 'productType': 'PRODUCT'} for i in range(3))
+    feeds_json = [json.loads(s[1]) for s in feeds.submitted]
+    assert feeds_json[0]['header'] == header
+    assert [m['messageId'] for m in feeds_json[0]['messages']] == [1, 2]
+    assert [m['sku'] for m in feeds_json[1]['messages']] == ['sku-2']
+    assert feeds_json[1]['messages'][0]['messageId'] == 1
+    assert feeds.submitted[0][2] == 'application/json'
+
+
+def test_feed_writer_json_max_size():
+    feeds = FakeFeeds()
+    writer = FeedWriter(feeds, 'JSON_LISTINGS_FEED', format='json', header={'sellerId': 'A3SELLER'}, max_size=200)
+    writer.writerows({'sku': 'sku-%s' % i, 'operationType': 'DELETE'} for i in range(10))
+    writer.close()
+    assert len(feeds.submitted) > 1
+    for submitted in feeds.submitted:
+        assert len(submitted[1]) <= 200
+        json.loads(submitted[1])
+
+
+def test_feed_writer_rejects_line_breaks():
+    writer = FeedWriter(FakeFeeds(), 'POST_FLAT_FILE_PRICEANDQUANTITYONLY_UPDATE_DATA')
+    with pytest.raises(ValueError):
+        writer.write(('sku', 'line\nbreak'))
+
+
+def test_feed_writer_discards_on_error():
+    feeds = FakeFeeds()
+    with pytest.raises(RuntimeError):
+        with FeedWriter(feeds, 'POST_FLAT_FILE_PRICEANDQUANTITYONLY_UPDATE_DATA') as writer:
+            writer.write(('sku', 1))
+            raise RuntimeError()
+    assert not feeds.submitted
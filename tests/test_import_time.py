@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# dependencies only imported once they're used
+heavy = ['boto3', 'botocore', 'requests', 'confuse', 'Crypto', 'cachetools', 'aiohttp', 'asyncio']
+
+# import time of sp_api in microseconds, about 50 ms without the heavy dependencies, generous for slow machines
+budget = 1000000
+
+
+def run_import(statement):
+    """
+    Runs `statement` in a new interpreter with `-X importtime`
+
+    Returns:
+        (list, int): the imported modules, and the import time of the top level modules in microseconds
+    """
+    code = statement + '\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))'
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=root,
+                            capture_output=True, text=True, check=True)
+    total = 0
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and 'cumulative' not in line:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            # top level sp_api modules, nested imports are part of their cumulative time
+            if name.startswith(' sp_api'):
+                total += int(cumulative)
+    return json.loads(result.stdout), total
+
+
+@pytest.mark.parametrize('statement', ['import sp_api.base', 'import sp_api.api', 'from sp_api.api import Orders'])
+def test_no_heavy_imports(statement):
+    modules, total = run_import(statement)
+    assert [name for name in modules if name.split('.')[0] in heavy] == []
+    assert total < budget, '%s took %.1f ms' % (statement, total / 1000)
+
+
+def test_endpoints_imported_on_access():
+    modules, _ = run_import('import sp_api.api')
+    assert [name for name in modules if name.startswith('sp_api.api.')] == []
+    modules, _ = run_import('from sp_api.api import Orders')
+    assert [name for name in modules if name.startswith('sp_api.api.')] == ['sp_api.api.orders',
+                                                                            'sp_api.api.orders.orders']
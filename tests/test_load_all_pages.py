@@ -0,0 +1,178 @@
+import sys
+import threading
+import time
+
+import pytest
+
+from sp_api.base import ApiResponse, SellingApiBadRequestException
+from sp_api.util import load_all_pages, FileCheckpointStore, SQLiteCheckpointStore
+
+
+def make_pages(count, calls, fail_on=None, loaded=None):
+    def get_orders(**kwargs):
+        calls.append(kwargs)
+        if loaded is not None and len(calls) == loaded[0]:
+            loaded[1].set()
+        page = len(calls)
+        if page == fail_on:
+            raise ValueError('page %s failed' % page)
+        next_token = 'token_%s' % page if page < count else None
+        return ApiResponse(payload={'Orders': [page], 'NextToken': next_token})
+
+    return get_orders
+
+
+def test_load_all_pages():
+    calls = []
+    pages = list(load_all_pages(throttle_by_seconds=0)(make_pages(3, calls))(CreatedAfter='2021-01-01'))
+    assert [p.payload['Orders'] for p in pages] == [[1], [2], [3]]
+    assert calls == [{'CreatedAfter': '2021-01-01'}, {'NextToken': 'token_1'}, {'NextToken': 'token_2'}]
+
+
+def test_load_all_pages_is_not_recursive():
+    calls = []
+    count = sys.getrecursionlimit() + 100
+    pages = load_all_pages(throttle_by_seconds=0)(make_pages(count, calls))()
+    assert sum(1 for _ in pages) == count
+
+
+@pytest.mark.parametrize('prefetch', [1, 3])
+def test_load_all_pages_prefetch(prefetch):
+    calls = []
+    # pages are loaded in the background while the first one is processed, until the queue is full
+    # and the loader waits with the next page
+    loaded = threading.Event()
+    pages = load_all_pages(throttle_by_seconds=0, prefetch=prefetch)(
+        make_pages(5, calls, loaded=(prefetch + 2, loaded)))()
+    first = next(pages)
+    assert loaded.wait(5)
+    assert len(calls) == prefetch + 2
+    assert [first.payload['Orders']] + [p.payload['Orders'] for p in pages] == [[1], [2], [3], [4], [5]]
+
+
+def test_load_all_pages_prefetch_raises():
+    calls = []
+    pages = load_all_pages(throttle_by_seconds=0, prefetch=2)(make_pages(5, calls, fail_on=3))()
+    with pytest.raises(ValueError):
+        list(pages)
+
+
+def test_load_all_pages_prefetch_stops():
+    calls = []
+    pages = load_all_pages(throttle_by_seconds=0, prefetch=1)(make_pages(100, calls))()
+    next(pages)
+    loaders = [t for t in threading.enumerate() if t.name == 'sp_api-prefetch']
+    pages.close()
+    for loader in loaders:
+        loader.join(5)
+    assert len(calls) < 5
+    assert not [t for t in loaders if t.is_alive()]
+
+
+@pytest.fixture(params=['file', 'sqlite'])
+def checkpoint_store(request, tmp_path):
+    if request.param == 'file':
+        return FileCheckpointStore(str(tmp_path / 'checkpoints'))
+    return SQLiteCheckpointStore(str(tmp_path / 'checkpoints.db'))
+
+
+def test_load_all_pages_resumes_from_checkpoint(checkpoint_store):
+    calls = []
+    pages = load_all_pages(throttle_by_seconds=0, checkpoint_store=checkpoint_store)(make_pages(5, calls))
+    with pytest.raises(RuntimeError):
+        for page in pages(PostedAfter='2021-01-01'):
+            if page.payload['Orders'] == [3]:
+                raise RuntimeError('worker died')
+    # page 3 was not processed, the run resumes with its token
+    resumed = list(pages(PostedAfter='2021-01-01'))
+    assert calls[3] == {'NextToken': 'token_2'}
+    assert [p.payload['Orders'] for p in resumed] == [[4], [5]]
+    # finished runs remove their checkpoint
+    calls.clear()
+    assert len(list(pages(PostedAfter='2021-01-01'))) == 5
+
+
+def test_load_all_pages_checkpoint_other_query(checkpoint_store):
+    calls = []
+    pages = load_all_pages(throttle_by_seconds=0, checkpoint_store=checkpoint_store, checkpoint_key='backfill')(
+        make_pages(3, calls))
+    next(pages(PostedAfter='2021-01-01'))
+    next(pages(PostedAfter='2021-01-01'))
+    calls.clear()
+    list(pages(PostedAfter='2022-01-01'))
+    assert calls[0] == {'PostedAfter': '2022-01-01'}
+
+
+def test_load_all_pages_checkpoint_method(checkpoint_store):
+    calls = []
+
+    class Finances:
+        @load_all_pages(throttle_by_seconds=0, checkpoint_store=checkpoint_store)
+        def list_financial_events(self, **kwargs):
+            return make_pages(3, calls)(**kwargs)
+
+    pages = Finances().list_financial_events(PostedAfter='2021-01-01')
+    next(pages)
+    next(pages)
+    # a new instance, e.g. in the next run, resumes from the checkpoint
+    calls.clear()
+    list(Finances().list_financial_events(PostedAfter='2021-01-01'))
+    assert calls[0] == {'NextToken': 'token_1'}
+
+
+def test_load_all_pages_checkpoint_per_client(checkpoint_store):
+    from sp_api.base import Client, Marketplaces
+    from tests.client.test_aio import credentials
+    calls = []
+
+    class Finances(Client):
+        @load_all_pages(throttle_by_seconds=0, checkpoint_store=checkpoint_store)
+        def list_financial_events(self, **kwargs):
+            return make_pages(3, calls)(**kwargs)
+
+    pages = Finances(credentials=credentials).list_financial_events(PostedAfter='2021-01-01')
+    next(pages)
+    next(pages)
+    # another seller, or another marketplace, runs the same query from the first page
+    for client in (Finances(credentials=credentials, refresh_token='Atzr|other'),
+                   Finances(Marketplaces.DE, credentials=credentials)):
+        calls.clear()
+        list(client.list_financial_events(PostedAfter='2021-01-01'))
+        assert calls[0] == {'PostedAfter': '2021-01-01'}
+    # the same seller resumes
+    calls.clear()
+    list(Finances(credentials=credentials).list_financial_events(PostedAfter='2021-01-01'))
+    assert calls[0] == {'NextToken': 'token_1'}
+
+
+def test_load_all_pages_checkpoint_expires(checkpoint_store, monkeypatch):
+    calls = []
+    pages = load_all_pages(throttle_by_seconds=0, checkpoint_store=checkpoint_store, checkpoint_ttl=60)(
+        make_pages(3, calls))
+    it = pages()
+    next(it)
+    next(it)
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 61)
+    calls.clear()
+    assert len(list(pages())) == 3
+    assert calls[0] == {}
+
+
+def test_load_all_pages_checkpoint_rejected(checkpoint_store):
+    calls, expired = [], []
+
+    def get_orders(**kwargs):
+        if kwargs.get('NextToken') in expired:
+            expired.remove(kwargs['NextToken'])
+            raise SellingApiBadRequestException([{'code': 'InvalidInput'}])
+        return make_pages(3, calls)(**kwargs)
+
+    pages = load_all_pages(throttle_by_seconds=0, checkpoint_store=checkpoint_store)(get_orders)
+    it = pages()
+    next(it)
+    next(it)
+    expired.append('token_1')
+    calls.clear()
+    assert [p.payload['Orders'] for p in pages()] == [[1], [2], [3]]
+    assert calls[0] == {}
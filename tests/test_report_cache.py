@@ -0,0 +1,179 @@
+import io
+import os
+import time
+
+import pytest
+
+from sp_api.base import ApiResponse, Marketplaces, ReportType, SellingApiForbiddenException
+from sp_api.util import ReportCache, DocumentCache
+
+
+class FakeReports:
+    marketplace_id = Marketplaces.DE.marketplace_id
+
+    def __init__(self, listed=None, refresh_token='Atzr|seller'):
+        self.refresh_token = refresh_token
+        self.created = []
+        self.listed = listed or []
+        self.reports = {}
+        self.downloads = []
+
+    def create_report(self, **kwargs):
+        report_id = 'report-%s' % len(self.created)
+        self.created.append(kwargs)
+        self.reports[report_id] = 'IN_QUEUE'
+        return ApiResponse(payload={'reportId': report_id})
+
+    def _selling_partner_key(self):
+        return self.refresh_token
+
+    def get_report(self, report_id):
+        if report_id not in self.reports:
+            raise SellingApiForbiddenException([{'code': 'Unauthorized'}])
+        return ApiResponse(payload={'reportId': report_id, 'processingStatus': self.reports[report_id]})
+
+    def get_reports(self, **kwargs):
+        self.list_kwargs = kwargs
+        return ApiResponse(payload={'reports': self.listed})
+
+    def get_report_document(self, document_id, **kwargs):
+        return ApiResponse(payload={'reportDocumentId': document_id, 'url': 'https://example.com/' + document_id})
+
+    def stream_report_document(self, document, character_code='iso-8859-1'):
+        self.downloads.append(document['reportDocumentId'])
+        yield 'sku\tprice\n'
+        yield ('äöü\t%s\n' % document['reportDocumentId']).encode('utf-8').decode(character_code)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ReportCache(FakeReports(), str(tmp_path), max_age=60)
+
+
+def test_create_report_reuses_indexed_report(cache, tmp_path):
+    kwargs = dict(reportType=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA, dataStartTime='2021-06-01T00:00:00Z')
+    first = cache.create_report(**kwargs)
+    # another process sharing the directory
+    other = ReportCache(cache.client, str(tmp_path), max_age=60)
+    second = other.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA', dataStartTime='2021-06-01T00:00:00+00:00')
+    assert second.payload == {'reportId': first.payload['reportId'], 'reused': True}
+    assert len(cache.client.created) == 1
+    # different time window
+    cache.create_report(reportType=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA, dataStartTime='2021-06-02')
+    assert len(cache.client.created) == 2
+
+
+def test_create_report_per_selling_partner(cache, tmp_path):
+    cache.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA')
+    # another seller sharing the directory
+    other = ReportCache(FakeReports(refresh_token='Atzr|other'), str(tmp_path), max_age=60)
+    assert other.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA').payload == {'reportId': 'report-0'}
+    assert len(other.client.created) == 1
+
+
+def test_create_report_indexed_report_not_available(cache, tmp_path):
+    cache.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA')
+    # the same seller, e.g. with a new client that can't load the report
+    other = ReportCache(FakeReports(), str(tmp_path), max_age=60)
+    assert 'reused' not in other.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA').payload
+    assert len(other.client.created) == 1
+
+
+def test_create_report_skips_failed_reports(cache):
+    report_id = cache.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA').payload['reportId']
+    cache.client.reports[report_id] = 'FATAL'
+    assert cache.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA').payload['reportId'] != report_id
+
+
+def test_create_report_expires(tmp_path):
+    cache = ReportCache(FakeReports(), str(tmp_path), max_age=0.05)
+    cache.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA')
+    time.sleep(0.1)
+    cache.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA')
+    assert len(cache.client.created) == 2
+
+
+def test_create_report_reuses_listed_report(tmp_path):
+    client = FakeReports()
+    cache = ReportCache(client, str(tmp_path))
+    kwargs = dict(reportType='GET_FLAT_FILE_ALL_ORDERS_DATA_BY_LAST_UPDATE_GENERAL', dataStartTime='2021-06-01')
+    report_id = cache.create_report(**kwargs).payload['reportId']
+    # the index now points to a newer report, which failed
+    client.reports['failed'] = 'FATAL'
+    cache._index(cache._key(cache._query(kwargs)), 'failed', 'null')
+    client.listed = [
+        {'reportId': 'other-marketplace', 'marketplaceIds': ['A13V1IB3VIYZZH'], 'processingStatus': 'DONE',
+         'dataStartTime': '2021-06-01T00:00:00+00:00'},
+        {'reportId': report_id, 'marketplaceIds': [Marketplaces.DE.marketplace_id], 'processingStatus': 'DONE',
+         'dataStartTime': '2021-06-01T00:00:00+00:00'},
+    ]
+    res = cache.create_report(**kwargs)
+    assert res.payload == {'reportId': report_id, 'reused': True}
+    assert client.list_kwargs['processingStatuses'] == ['DONE', 'IN_PROGRESS', 'IN_QUEUE']
+    assert len(client.created) == 1
+
+
+def test_create_report_listed_report_options(tmp_path):
+    client = FakeReports()
+    cache = ReportCache(client, str(tmp_path))
+    report_id = cache.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA',
+                                    reportOptions={'custom': 'true'}).payload['reportId']
+    client.listed = [{'reportId': report_id, 'marketplaceIds': [Marketplaces.DE.marketplace_id],
+                      'processingStatus': 'DONE'},
+                     {'reportId': 'seller-central', 'marketplaceIds': [Marketplaces.DE.marketplace_id],
+                      'processingStatus': 'DONE'}]
+    # amazon doesn't return the report options, reports created elsewhere or with other options aren't reused
+    assert cache.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA').payload['reportId'] == 'report-1'
+    assert len(client.created) == 2
+
+
+def test_create_report_listed_report_window(tmp_path):
+    client = FakeReports()
+    cache = ReportCache(client, str(tmp_path))
+    report_id = cache.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA',
+                                    dataStartTime='2021-06-01T00:00:00Z').payload['reportId']
+    client.listed = [{'reportId': report_id, 'marketplaceIds': [Marketplaces.DE.marketplace_id],
+                      'processingStatus': 'DONE', 'dataStartTime': '2021-06-01T00:00:00+00:00'}]
+    # a request without a time window doesn't match a report with one
+    assert cache.create_report(reportType='GET_MERCHANT_LISTINGS_ALL_DATA').payload['reportId'] == 'report-1'
+
+
+def test_get_report_document_cached(cache, tmp_path):
+    assert cache.get_report_document('doc-1', decrypt=True, character_code='utf-8').payload['document'] == 'sku\tprice\näöü\tdoc-1\n'
+    file = io.StringIO()
+    res = cache.get_report_document('doc-1', decrypt=True, file=file, character_code='UTF-8')
+    assert res.payload['document'] == file.getvalue() == 'sku\tprice\näöü\tdoc-1\n'
+    assert cache.client.downloads == ['doc-1']
+    # cached per character code
+    assert cache.get_report_document('doc-1', decrypt=True, character_code='iso-8859-1').payload['document'] \
+        == 'sku\tprice\nÃ¤Ã¶Ã¼\tdoc-1\n'
+    assert cache.client.downloads == ['doc-1', 'doc-1']
+    # not decrypted, passed to the client
+    assert 'url' in cache.get_report_document('doc-1').payload
+
+
+def test_document_cache_evicts_least_recently_used(tmp_path):
+    documents = DocumentCache(str(tmp_path), max_size=25)
+    documents.put('a', ['x' * 10])
+    documents.put('b', ['x' * 10])
+    os.utime(documents.path('a'), (0, 0))
+    os.utime(documents.path('b'), (1, 1))
+    documents.get('a')
+    documents.put('c', ['x' * 10])
+    assert documents.get('a') and documents.get('c')
+    assert documents.get('b') is None
+
+
+def test_get_report_document_larger_than_cache(tmp_path):
+    cache = ReportCache(FakeReports(), str(tmp_path), max_size=10)
+    cache.documents.put('old', ['x' * 5])
+    assert cache.get_report_document('doc-1', decrypt=True, character_code='utf-8').payload['document'] == \
+        'sku\tprice\näöü\tdoc-1\n'
+    # the document is kept until the next one is written, older ones make room for it
+    assert cache.documents.get('doc-1:utf-8') and cache.documents.get('old') is None
+    cache.get_report_document('doc-2', decrypt=True, character_code='utf-8')
+    assert cache.documents.get('doc-1:utf-8') is None
+
+
+def test_report_cache_delegates(cache):
+    assert cache.marketplace_id == Marketplaces.DE.marketplace_id
@@ -0,0 +1,126 @@
+import threading
+import time
+
+import pytest
+
+from sp_api.base import ApiResponse, Marketplaces, SellingApiRequestThrottledException
+from sp_api.util import ReportJobManager, ReportJobError
+
+
+class FakeReports:
+    lock = threading.Lock()
+    instances = []
+
+    def __init__(self, marketplace=Marketplaces.US, account='default', **kwargs):
+        self.marketplace = marketplace
+        self.account = account
+        self.statuses = {}
+        self.polls = []
+        self.throttle = 0
+        self.downloading = 0
+        self.max_downloading = 0
+        self.creating = None
+        FakeReports.instances.append(self)
+
+    def create_report(self, reportType, **kwargs):
+        if self.creating is not None:
+            self.creating.wait(5)
+        report_id = '%s-%s' % (reportType, len(self.statuses))
+        self.statuses[report_id] = list(kwargs.get('statuses', ['IN_QUEUE', 'IN_PROGRESS', 'DONE']))
+        return ApiResponse(payload={'reportId': report_id})
+
+    def get_report(self, report_id):
+        self.polls.append((report_id, time.monotonic()))
+        if self.throttle:
+            self.throttle -= 1
+            raise SellingApiRequestThrottledException([{'message': 'throttled'}], {})
+        status = self.statuses[report_id].pop(0)
+        return ApiResponse(payload={'reportId': report_id, 'processingStatus': status,
+                                    'reportDocumentId': 'doc-' + report_id})
+
+    def get_report_document(self, document_id, decrypt=False):
+        with self.lock:
+            self.downloading += 1
+            self.max_downloading = max(self.max_downloading, self.downloading)
+        time.sleep(0.05)
+        with self.lock:
+            self.downloading -= 1
+        return ApiResponse(payload={'document': document_id, 'decrypt': decrypt})
+
+
+@pytest.fixture
+def manager():
+    FakeReports.instances = []
+    manager = ReportJobManager(poll_interval=0.01, backoff=2, client_class=FakeReports)
+    yield manager
+    manager.shutdown(wait=False)
+
+
+def test_report_job(manager):
+    future = manager.submit('GET_MERCHANT_LISTINGS_ALL_DATA', marketplace=Marketplaces.DE)
+    res = future.result(timeout=5)
+    assert res.payload == {'document': 'doc-GET_MERCHANT_LISTINGS_ALL_DATA-0', 'decrypt': True}
+    client = FakeReports.instances[0]
+    assert client.marketplace == Marketplaces.DE
+    # the poll interval grows with every check
+    times = [t for _, t in client.polls]
+    assert times[2] - times[1] > times[1] - times[0]
+
+
+def test_report_jobs_share_clients_and_download_concurrently(manager):
+    futures = [manager.submit('GET_MERCHANT_LISTINGS_ALL_DATA', marketplace=marketplace, account=account)
+               for marketplace in (Marketplaces.DE, Marketplaces.FR) for account in ('a', 'b') for _ in range(3)]
+    assert all(f.result(timeout=5).payload['document'] for f in futures)
+    assert sorted(len(client.statuses) for client in FakeReports.instances) == [3, 3, 3, 3]
+    assert len(FakeReports.instances) == 4
+    assert any(client.max_downloading > 1 for client in FakeReports.instances)
+
+
+def test_report_job_fatal(manager):
+    future = manager.submit('GET_MERCHANT_LISTINGS_ALL_DATA', statuses=['IN_QUEUE', 'FATAL'])
+    with pytest.raises(ReportJobError) as e:
+        future.result(timeout=5)
+    assert e.value.report['processingStatus'] == 'FATAL'
+
+
+def test_report_job_throttled(manager):
+    client = manager.client()
+    client.throttle = 2
+    assert manager.submit('GET_MERCHANT_LISTINGS_ALL_DATA').result(timeout=5).payload['document']
+    assert len(client.polls) == 5
+
+
+def test_report_job_create_does_not_block_polling(manager):
+    # a create_report waiting for its rate limit doesn't hold up other reports
+    client = manager.client()
+    client.creating = threading.Event()
+    created = manager.submit('GET_MERCHANT_LISTINGS_ALL_DATA')
+    client.statuses['42'] = ['IN_QUEUE', 'DONE']
+    assert manager.submit(report_id='42').result(timeout=5).payload['document'] == 'doc-42'
+    assert not created.done()
+    client.creating.set()
+    assert created.result(timeout=5).payload['document']
+
+
+def test_report_job_existing_report(manager):
+    client = manager.client()
+    client.statuses['42'] = ['DONE']
+    assert manager.submit(report_id='42').result(timeout=5).payload['document'] == 'doc-42'
+
+
+def test_report_job_timeout():
+    manager = ReportJobManager(poll_interval=0.01, timeout=0.05, client_class=FakeReports)
+    future = manager.submit('GET_MERCHANT_LISTINGS_ALL_DATA', statuses=['IN_QUEUE'] * 100)
+    with pytest.raises(TimeoutError):
+        future.result(timeout=5)
+    manager.shutdown()
+
+
+def test_report_job_shutdown():
+    manager = ReportJobManager(poll_interval=10, client_class=FakeReports)
+    future = manager.submit('GET_MERCHANT_LISTINGS_ALL_DATA')
+    time.sleep(0.05)
+    manager.shutdown(wait=False)
+    assert future.cancelled()
+    with pytest.raises(RuntimeError):
+        manager.submit('GET_MERCHANT_LISTINGS_ALL_DATA')